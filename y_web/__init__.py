@@ -264,14 +264,20 @@ def create_app(db_type="sqlite", desktop_mode=False):
     else:
         raise ValueError("Unsupported db_type, use 'sqlite' or 'postgresql'")
 
+    # Resolved once here so request handlers don't re-parse the database URI
+    app.config["DB_TYPE"] = db_type
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
     # Disable static file caching for development mode to ensure JS/CSS updates are loaded
     # This ensures loading indicators and other static assets work in development mode
     app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 0
 
-    # Enable template auto-reload in development mode
-    app.config["TEMPLATES_AUTO_RELOAD"] = True
+    # Reload templates only in debug runs; otherwise every render_template
+    # stats the template source to check whether it changed
+    app.config["TEMPLATES_AUTO_RELOAD"] = None
+
+    # The *_data endpoints return large dicts; skip sorting their keys
+    app.config["JSON_SORT_KEYS"] = False
 
     db.init_app(app)
     login_manager.init_app(app)
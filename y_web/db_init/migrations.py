@@ -203,6 +203,89 @@ def _run_all_migrations(app, db_type, db):
     except Exception as e:
         print(f"Failed to run experiment schedule tables migration: {e}")
 
+    # ------------------------------------------------------------------
+    # unique (group_id, experiment_id) on schedule items
+    # ------------------------------------------------------------------
+    try:
+        if db_type == "sqlite":
+            from y_web.migrations.add_schedule_item_unique_constraint import (
+                migrate_sqlite,
+            )
+
+            if dashboard_db_path:
+                migrate_sqlite(dashboard_db_path)
+        elif db_type == "postgresql":
+            from y_web.migrations.add_schedule_item_unique_constraint import (
+                migrate_postgresql,
+            )
+
+            if pg["password"]:
+                migrate_postgresql(
+                    pg["host"], pg["port"], pg["database"], pg["user"], pg["password"]
+                )
+    except Exception as e:
+        print(f"Failed to run schedule item unique constraint migration: {e}")
+
+    # ------------------------------------------------------------------
+    # experiment lookup indexes (delete / activate experiment paths)
+    # ------------------------------------------------------------------
+    try:
+        if db_type == "sqlite":
+            from y_web.migrations.add_experiment_lookup_indexes import (
+                migrate_sqlite,
+            )
+
+            if dashboard_db_path:
+                migrate_sqlite(dashboard_db_path)
+        elif db_type == "postgresql":
+            from y_web.migrations.add_experiment_lookup_indexes import (
+                migrate_postgresql,
+            )
+
+            if pg["password"]:
+                migrate_postgresql(
+                    pg["host"], pg["port"], pg["database"], pg["user"], pg["password"]
+                )
+    except Exception as e:
+        print(f"Failed to run experiment lookup indexes migration: {e}")
+
+    # ------------------------------------------------------------------
+    # population lookup indexes (population details / delete paths)
+    # ------------------------------------------------------------------
+    try:
+        if db_type == "sqlite":
+            from y_web.migrations.add_population_lookup_indexes import (
+                migrate_sqlite,
+            )
+
+            if dashboard_db_path:
+                migrate_sqlite(dashboard_db_path)
+        elif db_type == "postgresql":
+            from y_web.migrations.add_population_lookup_indexes import (
+                migrate_postgresql,
+            )
+
+            if pg["password"]:
+                migrate_postgresql(
+                    pg["host"], pg["port"], pg["database"], pg["user"], pg["password"]
+                )
+    except Exception as e:
+        print(f"Failed to run population lookup indexes migration: {e}")
+
+    # ------------------------------------------------------------------
+    # trigram indexes for admin LIKE searches (PostgreSQL only)
+    # ------------------------------------------------------------------
+    try:
+        if db_type == "postgresql":
+            from y_web.migrations.add_search_trigram_indexes import migrate_postgresql
+
+            if pg["password"]:
+                migrate_postgresql(
+                    pg["host"], pg["port"], pg["database"], pg["user"], pg["password"]
+                )
+    except Exception as e:
+        print(f"Failed to run search trigram indexes migration: {e}")
+
     # ------------------------------------------------------------------
     # watchdog settings
     # ------------------------------------------------------------------
@@ -39,7 +39,17 @@ def create_postgresql_db(app):
         "db_admin": app.config["SQLALCHEMY_DATABASE_URI"],
         "db_exp": f"postgresql://{user}:{password}@{host}:{port}/{dbname_dummy}",  # change if needed
     }
-    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {}
+    # The admin pages issue many short queries per request; size the pool so
+    # concurrent admins do not wait on connection checkout, and replace
+    # connections dropped by the server instead of failing the request.
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_pre_ping": True,
+        "pool_recycle": 3600,
+        # room for every statement the admin routes issue (default is 500)
+        "query_cache_size": 1200,
+    }
 
     # is postgresql installed and running?
     try:
@@ -68,6 +68,8 @@ def create_sqlite_db(app):
         "connect_args": {"check_same_thread": False, "timeout": 10},
         "pool_pre_ping": True,
         "poolclass": NullPool,
+        # room for every statement the admin routes issue (default is 500)
+        "query_cache_size": 1200,
     }
 
     # Store the database paths for migrations
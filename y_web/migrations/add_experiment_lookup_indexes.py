@@ -0,0 +1,103 @@
+"""
+Database migration script to index experiment lookup columns.
+
+Deleting an experiment and switching the active experiment both filter the
+experiment association tables by experiment (or client) id.  Without an index
+on those columns every lookup is a full table scan, which grows with the
+number of experiments stored in the dashboard database.
+"""
+
+import os
+import sqlite3
+
+try:
+    import psycopg2
+
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+
+# (index name, table, indexed columns)
+INDEXES = [
+    ("ix_population_experiment_exp", "population_experiment", ("id_exp",)),
+    ("ix_user_experiment_user_exp", "user_experiment", ("user_id", "exp_id")),
+    ("ix_client_exp", "client", ("id_exp",)),
+    ("ix_exp_stats_exp", "exp_stats", ("exp_id",)),
+    ("ix_client_execution_client", "client_execution", ("client_id",)),
+    ("ix_exp_topic_exp", "exp_topic", ("exp_id",)),
+    ("ix_jupyter_instances_exp", "jupyter_instances", ("exp_id",)),
+]
+
+
+def _create_index_sql(name, table, columns):
+    return f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"
+
+
+def migrate_sqlite(db_path):
+    """Add the experiment lookup indexes to the SQLite dashboard database."""
+    if not os.path.exists(db_path):
+        print(f"Database file not found: {db_path}")
+        return False
+
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        for name, table, columns in INDEXES:
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
+                (table,),
+            )
+            if cursor.fetchone() is None:
+                print(f"○ {table} table not found, skipping {name}")
+                continue
+
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND name=?",
+                (name,),
+            )
+            if cursor.fetchone() is None:
+                cursor.execute(_create_index_sql(name, table, columns))
+                print(f"✓ Created {name} index on {table}")
+            else:
+                print(f"○ {name} index already exists")
+
+        conn.commit()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"✗ Error migrating SQLite database: {e}")
+        return False
+
+
+def migrate_postgresql(host, port, database, user, password):
+    """Add the experiment lookup indexes to the PostgreSQL dashboard database."""
+    if not PSYCOPG2_AVAILABLE:
+        print("✗ psycopg2 not available. Cannot migrate PostgreSQL database.")
+        return False
+
+    try:
+        conn = psycopg2.connect(
+            host=host, port=port, database=database, user=user, password=password
+        )
+        cursor = conn.cursor()
+
+        for name, table, columns in INDEXES:
+            cursor.execute("SELECT to_regclass(%s)", (table,))
+            if cursor.fetchone()[0] is None:
+                print(f"○ {table} table not found, skipping {name}")
+                continue
+
+            cursor.execute("SELECT to_regclass(%s)", (name,))
+            if cursor.fetchone()[0] is None:
+                cursor.execute(_create_index_sql(name, table, columns))
+                print(f"✓ Created {name} index on {table}")
+            else:
+                print(f"○ {name} index already exists")
+
+        conn.commit()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"✗ Error migrating PostgreSQL database: {e}")
+        return False
@@ -0,0 +1,108 @@
+"""
+Database migration script to index population lookup columns.
+
+Population details, export, delete and listing pages filter the population
+association tables by population id.  Without an index on those columns
+every lookup scans the whole table, which grows with the number of agents
+stored in the dashboard database.
+"""
+
+import os
+import sqlite3
+
+try:
+    import psycopg2
+
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+
+# (index name, table, indexed columns)
+INDEXES = [
+    ("ix_agent_population_population", "agent_population", ("population_id",)),
+    (
+        "ix_population_experiment_population",
+        "population_experiment",
+        ("id_population",),
+    ),
+    (
+        "ix_population_activity_profile_population",
+        "population_activity_profile",
+        ("population",),
+    ),
+    ("ix_page_population_population", "page_population", ("population_id",)),
+]
+
+
+def _create_index_sql(name, table, columns):
+    return f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"
+
+
+def migrate_sqlite(db_path):
+    """Add the population lookup indexes to the SQLite dashboard database."""
+    if not os.path.exists(db_path):
+        print(f"Database file not found: {db_path}")
+        return False
+
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        for name, table, columns in INDEXES:
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
+                (table,),
+            )
+            if cursor.fetchone() is None:
+                print(f"○ {table} table not found, skipping {name}")
+                continue
+
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND name=?",
+                (name,),
+            )
+            if cursor.fetchone() is None:
+                cursor.execute(_create_index_sql(name, table, columns))
+                print(f"✓ Created {name} index on {table}")
+            else:
+                print(f"○ {name} index already exists")
+
+        conn.commit()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"✗ Error migrating SQLite database: {e}")
+        return False
+
+
+def migrate_postgresql(host, port, database, user, password):
+    """Add the population lookup indexes to the PostgreSQL dashboard database."""
+    if not PSYCOPG2_AVAILABLE:
+        print("✗ psycopg2 not available. Cannot migrate PostgreSQL database.")
+        return False
+
+    try:
+        conn = psycopg2.connect(
+            host=host, port=port, database=database, user=user, password=password
+        )
+        cursor = conn.cursor()
+
+        for name, table, columns in INDEXES:
+            cursor.execute("SELECT to_regclass(%s)", (table,))
+            if cursor.fetchone()[0] is None:
+                print(f"○ {table} table not found, skipping {name}")
+                continue
+
+            cursor.execute("SELECT to_regclass(%s)", (name,))
+            if cursor.fetchone()[0] is None:
+                cursor.execute(_create_index_sql(name, table, columns))
+                print(f"✓ Created {name} index on {table}")
+            else:
+                print(f"○ {name} index already exists")
+
+        conn.commit()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"✗ Error migrating PostgreSQL database: {e}")
+        return False
@@ -0,0 +1,109 @@
+"""
+Database migration script to enforce unique schedule items.
+
+Adds a unique index on ``experiment_schedule_items(group_id, experiment_id)``
+so that an experiment can be assigned to a given schedule group only once.
+Pre-existing duplicate assignments are collapsed (keeping the oldest row)
+before the index is created.
+"""
+
+import os
+import sqlite3
+
+try:
+    import psycopg2
+
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+
+INDEX_NAME = "uq_sched_item_group_exp"
+
+_DEDUPLICATE_SQL = """
+    DELETE FROM experiment_schedule_items
+    WHERE id NOT IN (
+        SELECT MIN(id) FROM experiment_schedule_items
+        GROUP BY group_id, experiment_id
+    )
+"""
+
+_CREATE_INDEX_SQL = f"""
+    CREATE UNIQUE INDEX IF NOT EXISTS {INDEX_NAME}
+    ON experiment_schedule_items (group_id, experiment_id)
+"""
+
+
+def migrate_sqlite(db_path):
+    """Add the unique schedule item index to the SQLite dashboard database."""
+    if not os.path.exists(db_path):
+        print(f"Database file not found: {db_path}")
+        return False
+
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='experiment_schedule_items'"
+        )
+        if cursor.fetchone() is None:
+            print("○ experiment_schedule_items table not found, skipping")
+            conn.close()
+            return True
+
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND name=?",
+            (INDEX_NAME,),
+        )
+        if cursor.fetchone() is None:
+            cursor.execute(_DEDUPLICATE_SQL)
+            cursor.execute(_CREATE_INDEX_SQL)
+            print(f"✓ Created {INDEX_NAME} index on experiment_schedule_items")
+        else:
+            print(f"○ {INDEX_NAME} index already exists")
+
+        conn.commit()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"✗ Error migrating SQLite database: {e}")
+        return False
+
+
+def migrate_postgresql(host, port, database, user, password):
+    """Add the unique schedule item index to the PostgreSQL dashboard database."""
+    if not PSYCOPG2_AVAILABLE:
+        print("✗ psycopg2 not available. Cannot migrate PostgreSQL database.")
+        return False
+
+    try:
+        conn = psycopg2.connect(
+            host=host, port=port, database=database, user=user, password=password
+        )
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT EXISTS (
+                SELECT FROM information_schema.tables
+                WHERE table_name = 'experiment_schedule_items'
+            )
+        """)
+        if not cursor.fetchone()[0]:
+            print("○ experiment_schedule_items table not found, skipping")
+            conn.close()
+            return True
+
+        cursor.execute("SELECT to_regclass(%s)", (INDEX_NAME,))
+        if cursor.fetchone()[0] is None:
+            cursor.execute(_DEDUPLICATE_SQL)
+            cursor.execute(_CREATE_INDEX_SQL)
+            print(f"✓ Created {INDEX_NAME} index on experiment_schedule_items")
+        else:
+            print(f"○ {INDEX_NAME} index already exists")
+
+        conn.commit()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"✗ Error migrating PostgreSQL database: {e}")
+        return False
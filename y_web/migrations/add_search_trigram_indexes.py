@@ -0,0 +1,78 @@
+"""
+Database migration script to add trigram indexes on admin search columns.
+
+The admin table endpoints filter with ``LIKE '%term%'``.  A leading wildcard
+cannot use a b-tree index, so on PostgreSQL every search scans the table.
+``pg_trgm`` GIN indexes serve substring ``LIKE`` filters directly.
+
+SQLite has no equivalent index type for infix matches, so this migration only
+applies to PostgreSQL.
+"""
+
+try:
+    import psycopg2
+
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+
+# (index name, table, searched column)
+INDEXES = [
+    ("ix_languages_language_trgm", "languages", "language"),
+    ("ix_leanings_leaning_trgm", "leanings", "leaning"),
+    ("ix_nationalities_nationality_trgm", "nationalities", "nationality"),
+    ("ix_professions_profession_trgm", "professions", "profession"),
+    ("ix_education_education_level_trgm", "education", "education_level"),
+    ("ix_toxicity_levels_toxicity_level_trgm", "toxicity_levels", "toxicity_level"),
+    ("ix_topic_list_name_trgm", "topic_list", "name"),
+    ("ix_age_classes_name_trgm", "age_classes", "name"),
+    ("ix_activity_profiles_name_trgm", "activity_profiles", "name"),
+    ("ix_exps_exp_name_trgm", "exps", "exp_name"),
+    ("ix_population_name_trgm", "population", "name"),
+    ("ix_agents_name_trgm", "agents", "name"),
+    ("ix_pages_name_trgm", "pages", "name"),
+]
+
+
+def migrate_postgresql(host, port, database, user, password):
+    """Add trigram GIN indexes on the search columns of the dashboard database."""
+    if not PSYCOPG2_AVAILABLE:
+        print("✗ psycopg2 not available. Cannot migrate PostgreSQL database.")
+        return False
+
+    try:
+        conn = psycopg2.connect(
+            host=host, port=port, database=database, user=user, password=password
+        )
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+        conn.autocommit = True
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        except Exception as e:
+            print(f"○ pg_trgm extension not available, skipping trigram indexes: {e}")
+            conn.close()
+            return True
+
+        for name, table, column in INDEXES:
+            cursor.execute("SELECT to_regclass(%s)", (table,))
+            if cursor.fetchone()[0] is None:
+                print(f"○ {table} table not found, skipping {name}")
+                continue
+
+            cursor.execute("SELECT to_regclass(%s)", (name,))
+            if cursor.fetchone()[0] is None:
+                cursor.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                    f"ON {table} USING gin ({column} gin_trgm_ops)"
+                )
+                print(f"✓ Created {name} index on {table}")
+            else:
+                print(f"○ {name} index already exists")
+
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"✗ Error migrating PostgreSQL database: {e}")
+        return False
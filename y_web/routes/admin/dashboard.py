@@ -33,7 +33,7 @@ from y_web.src.models import (
     Ollama_Pull,
     User_Experiment,
 )
-from y_web.src.system.jupyter_utils import get_jupyter_instances
+from y_web.src.system.jupyter_utils import get_jupyter_instances, pids_running
 from y_web.src.system.miscellanea import (
     check_connection,
     check_privileges,
@@ -82,6 +82,14 @@ def _is_embedding_model_name(model_name: str) -> bool:
     return any(marker in lowered for marker in embedding_markers)
 
 
+def _jupyter_pid(instance):
+    """Return a Jupyter_instances row's process id as an int, or None."""
+    try:
+        return int(instance.process) if instance.process is not None else None
+    except (ValueError, TypeError):
+        return None
+
+
 @admin.route("/admin/api/fetch_models")
 @login_required
 def fetch_models():
@@ -320,19 +328,15 @@ def dashboard():
 
     # Get jupyter instances and create a mapping by exp_id
     jupyter_instances = Jupyter_instances.query.all()
+    jupyter_pid_running = pids_running(
+        pid
+        for pid in (_jupyter_pid(jupyter) for jupyter in jupyter_instances)
+        if pid is not None
+    )
     jupyter_by_exp = {}
     for jupyter in jupyter_instances:
         # Check if process is actually running
-        import psutil
-
-        is_running = False
-        if jupyter.process is not None:
-            try:
-                proc = psutil.Process(int(jupyter.process))
-                if proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE:
-                    is_running = True
-            except (psutil.NoSuchProcess, ValueError, TypeError):
-                pass
+        is_running = jupyter_pid_running.get(_jupyter_pid(jupyter), False)
 
         jupyter_by_exp[jupyter.exp_id] = {
             "port": jupyter.port,
@@ -600,8 +604,6 @@ def jupyter_data():
     Returns:
         JSON with 'data' array of jupyter session objects and 'total' count
     """
-    import psutil
-
     check_privileges(current_user.username)
 
     # Get current user
@@ -609,6 +611,11 @@ def jupyter_data():
 
     # Get all jupyter instances from database
     all_db_instances = Jupyter_instances.query.all()
+    jupyter_pid_running = pids_running(
+        pid
+        for pid in (_jupyter_pid(db_inst) for db_inst in all_db_instances)
+        if pid is not None
+    )
 
     # Filter instances based on user access
     filtered_instances = []
@@ -631,14 +638,7 @@ def jupyter_data():
 
         if has_access:
             # Check if process is actually running
-            is_running = False
-            if db_inst.process is not None:
-                try:
-                    proc = psutil.Process(int(db_inst.process))
-                    if proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE:
-                        is_running = True
-                except (psutil.NoSuchProcess, ValueError, TypeError):
-                    pass
+            is_running = jupyter_pid_running.get(_jupyter_pid(db_inst), False)
 
             filtered_instances.append(
                 {
@@ -327,14 +327,15 @@ def _update_recsys_internal(uid, expected_mode):
     agents = Agent_Population.query.filter_by(population_id=population.id).all()
 
     # updating the recommenders of the agents in the specific simulation instance (not in the population)
+    # all users are committed together, or none if one is missing
     for agent in agents:
         try:
             a = Agent.query.filter_by(id=agent.agent_id).first()
             user = (User_mgmt.query.filter_by(username=a.name)).first()
             user.frecsys_type = frecsys_type
             user.recsys_type = recsys_type
-            db.session.commit()
         except:
+            db.session.rollback()
             flash("The experiment needs to be activated first.", "error")
             return redirect(request.referrer)
 
@@ -420,13 +421,14 @@ def _update_client_llm_internal(uid, expected_mode):
     # get agents for the populations
     agents = Agent_Population.query.filter_by(population_id=population.id).all()
 
+    # all users are committed together, or none if one is missing
     for agent in agents:
         try:
             a = Agent.query.filter_by(id=agent.agent_id).first()
             user = (User_mgmt.query.filter_by(username=a.name)).first()
             user.user_type = user_type
-            db.session.commit()
         except:
+            db.session.rollback()
             flash("The experiment needs to be activated first.", "error")
             return redirect(request.referrer)
 
@@ -13,13 +13,16 @@ import random
 import re
 import shutil
 import socket
+import sqlite3
 import threading
 import time
 import uuid
+import zipfile
 from collections import defaultdict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from urllib.error import HTTPError, URLError
-from urllib.parse import quote, urlparse
+from urllib.parse import quote
 from urllib.request import Request, urlopen
 
 from flask import (
@@ -33,6 +36,10 @@ from flask import (
     url_for,
 )
 from flask_login import current_user, login_required, login_user
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import load_only
+from sqlalchemy.pool import NullPool
+from werkzeug.security import generate_password_hash
 
 from y_web import db  # , app
 from y_web.src.content.avatars import normalize_forum_avatar_mode
@@ -97,6 +104,8 @@ from y_web.src.system.desktop_file_handler import send_file_desktop
 from y_web.src.system.jupyter_utils import stop_process
 from y_web.src.system.miscellanea import (
     check_privileges,
+    current_admin,
+    get_admin_user,
     llm_backend_status,
     ollama_status,
     reload_current_user,
@@ -115,11 +124,16 @@ from ._blueprint import (
     _schedule_check_lock,
     experiments,
 )
-from ._data import experiment_details
 from ._helpers import *  # noqa: F401,F403
 from ._helpers import (
     _current_admin_user_or_none,
     _experiment_configuration_update_required,
+    _get_database_type,
+    _get_experiment_folder,
+    _parse_database_uri,
+    _postgres_admin_engine,
+    _row_exists,
+    _stop_running_clients,
     default_stress_reward_config,
 )
 
@@ -164,7 +178,7 @@ def settings():
     Shows list of experiments, users, and database configuration.
     """
     # Get current user
-    user = Admin_users.query.filter_by(username=current_user.username).first()
+    user = current_admin()
 
     # Filter experiments based on role + visibility grants
     if user.role in ("admin", "researcher"):
@@ -177,14 +191,25 @@ def settings():
         flash("Access denied. Please use the experiment feed.")
         return redirect(url_for("auth.login"))
 
-    users = Admin_users.query.all()
+    # Only the account columns the page shows; skips password hashes and API keys
+    users = Admin_users.query.options(
+        load_only(
+            Admin_users.id, Admin_users.username, Admin_users.email, Admin_users.role
+        )
+    ).all()
 
     # Check and update status for stopped experiments that are actually completed.
     # Use batched queries to avoid per-experiment N+1 work on page load.
-    stopped_experiments = Exps.query.filter_by(exp_status="stopped").all()
+    stopped_experiments = (
+        Exps.query.options(load_only(Exps.idexp, Exps.exp_status))
+        .filter_by(exp_status="stopped")
+        .all()
+    )
     stopped_ids = [exp.idexp for exp in stopped_experiments]
     if stopped_ids:
-        clients = Client.query.filter(Client.id_exp.in_(stopped_ids)).all()
+        clients = db.session.query(Client.id, Client.id_exp).filter(
+            Client.id_exp.in_(stopped_ids)
+        )
         clients_by_exp = defaultdict(list)
         client_ids = []
         for client in clients:
@@ -193,9 +218,11 @@ def settings():
 
         exec_by_client_id = {}
         if client_ids:
-            exec_rows = Client_Execution.query.filter(
-                Client_Execution.client_id.in_(client_ids)
-            ).all()
+            exec_rows = db.session.query(
+                Client_Execution.client_id,
+                Client_Execution.elapsed_time,
+                Client_Execution.expected_duration_rounds,
+            ).filter(Client_Execution.client_id.in_(client_ids))
             exec_by_client_id = {row.client_id: row for row in exec_rows}
 
         updated_any = False
@@ -224,21 +251,19 @@ def settings():
         if updated_any:
             db.session.commit()
 
-    # Check which experiments have infinite clients (batched).
-    exp_has_infinite = {}
+    # Check which experiments have infinite clients (one batched id lookup).
     preview_ids = [exp.idexp for exp in experiments]
-    preview_clients = []
+    infinite_ids = set()
     if preview_ids:
-        preview_clients = Client.query.filter(Client.id_exp.in_(preview_ids)).all()
-    preview_clients_by_exp = defaultdict(list)
-    for client in preview_clients:
-        preview_clients_by_exp[client.id_exp].append(client)
-    for exp in experiments:
-        exp_has_infinite[exp.idexp] = any(
-            client.days == -1 for client in preview_clients_by_exp.get(exp.idexp, [])
-        )
+        infinite_ids = {
+            row.id_exp
+            for row in db.session.query(Client.id_exp)
+            .filter(Client.id_exp.in_(preview_ids), Client.days == -1)
+            .distinct()
+        }
+    exp_has_infinite = {exp.idexp: exp.idexp in infinite_ids for exp in experiments}
 
-    dbtype = current_app.config["SQLALCHEMY_DATABASE_URI"].split(":")[0]
+    dbtype = _get_database_type()
 
     # Get suggested port for new experiment
     suggested_port = get_suggested_port()
@@ -372,7 +397,7 @@ def visibility_settings_add_experiment():
     is_admin = (user.role or "").strip().lower() == "admin"
 
     exp_id = request.form.get("exp_id", type=int)
-    experiment = Exps.query.filter_by(idexp=exp_id).first()
+    experiment = db.session.get(Exps, exp_id)
     if not experiment:
         flash("Experiment not found.", "error")
         return redirect(url_for("experiments.visibility_settings"))
@@ -519,7 +544,7 @@ def visibility_settings_revoke_assignment():
         flash("Invalid revoke request.", "error")
         return redirect(url_for("experiments.visibility_settings"))
 
-    experiment = Exps.query.filter_by(idexp=exp_id).first()
+    experiment = db.session.get(Exps, exp_id)
     if not experiment:
         flash("Experiment not found.", "error")
         return redirect(url_for("experiments.visibility_settings"))
@@ -650,7 +675,7 @@ def change_active_experiment(exp_id):
     check_privileges(current_user.username)
     uname = current_user.username
 
-    exp = Exps.query.filter_by(idexp=exp_id).first()
+    exp = db.session.get(Exps, exp_id)
 
     if not exp:
         flash("Experiment not found.")
@@ -687,7 +712,7 @@ def change_active_experiment(exp_id):
         skip_user_registration = False
         if exp.simulator_type == "HPC":
             # Check database type
-            if current_app.config["SQLALCHEMY_DATABASE_URI"].startswith("sqlite"):
+            if _get_database_type() == "sqlite":
                 # Check if the SQLite database file exists
                 from y_web.src.system.path_utils import get_writable_path
 
@@ -769,12 +794,9 @@ def change_active_experiment(exp_id):
                     current_app.config["SQLALCHEMY_BINDS"]["db_exp"] = old_bind
 
         # Add user to experiment if not present
-        user_exp = (
-            db.session.query(User_Experiment)
-            .filter_by(user_id=current_user.id, exp_id=exp_id)
-            .first()
-        )
-        if user_exp is None:
+        if not _row_exists(
+            User_Experiment.query.filter_by(user_id=current_user.id, exp_id=exp_id)
+        ):
             user_exp = User_Experiment(user_id=current_user.id, exp_id=exp_id)
             db.session.add(user_exp)
             db.session.commit()
@@ -783,13 +805,222 @@ def change_active_experiment(exp_id):
 
     # Reload user session from admin database (not experiment database)
     # Use Admin_users which is in the main database
-    admin_user = Admin_users.query.filter_by(username=uname).first()
+    admin_user = get_admin_user(uname)
     if admin_user:
         login_user(admin_user, remember=True, force=True)
 
     return redirect("/admin/dashboard")
 
 
+_ADMIN_USER_INSERT_SQL = """
+    INSERT INTO user_mgmt (username, email, password, user_type, leaning, age,
+                           language, owner, joined_on, frecsys_type,
+                           round_actions, toxicity, is_page, daily_activity_level, cover_image)
+    VALUES (:username, :email, :password, :user_type, :leaning, :age,
+            :language, :owner, :joined_on, :frecsys_type,
+            :round_actions, :toxicity, :is_page, :daily_activity_level, :cover_image)
+"""
+
+
+@lru_cache(maxsize=1)
+def _postgresql_schema_sql():
+    """Return the experiment PostgreSQL schema script, read from disk once."""
+    schema_path = get_resource_path(os.path.join("data_schema", "postgre_server.sql"))
+    with open(schema_path, "r") as schema_file:
+        return schema_file.read()
+
+
+def _bootstrap_postgresql_experiment_db(engine):
+    """
+    Apply the experiment schema and seed the Admin user in one transaction.
+
+    Args:
+        engine: SQLAlchemy engine bound to the freshly created experiment database
+    """
+    hashed_pw = generate_password_hash("admin", method="pbkdf2:sha256")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(_postgresql_schema_sql())
+        conn.execute(
+            text(_ADMIN_USER_INSERT_SQL),
+            {
+                "username": "Admin",
+                "email": "admin@y-not.social",
+                "password": hashed_pw,
+                "user_type": "user",
+                "leaning": "none",
+                "age": 0,
+                "language": "en",
+                "owner": "admin",
+                "joined_on": 0,
+                "frecsys_type": "default",
+                "round_actions": 3,
+                "toxicity": "none",
+                "is_page": 0,
+                "daily_activity_level": 1,
+                "cover_image": random_cover_image_url(),
+            },
+        )
+
+
+# FileStorage.save() copies uploads in 16 KiB chunks by default
+_UPLOAD_SAVE_BUFFER_SIZE = 2 << 20
+_ZIP_COPY_BUFFER_SIZE = 1 << 20
+
+
+def _extract_zip(zip_path, dest_dir):
+    """
+    Extract a ZIP archive, streaming each member with a 1 MiB buffer.
+
+    Members whose resolved path falls outside ``dest_dir`` (absolute names,
+    ``..`` components, or paths leading through a symlink) are skipped.
+    Empty members are created without copying any data.
+
+    Args:
+        zip_path: Path of the ZIP archive
+        dest_dir: Directory to extract into
+    """
+    dest_root = os.path.realpath(dest_dir)
+    with zipfile.ZipFile(zip_path) as zf:
+        for info in zf.infolist():
+            name = info.filename
+            if os.path.isabs(name):
+                continue
+
+            target = os.path.realpath(os.path.join(dest_root, *name.split("/")))
+            if os.path.commonpath([dest_root, target]) != dest_root:
+                continue
+            if target == dest_root and not info.is_dir():
+                continue
+
+            if info.is_dir():
+                os.makedirs(target, exist_ok=True)
+                continue
+
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "wb") as dst:
+                if info.file_size == 0:
+                    continue
+                with zf.open(info) as src:
+                    shutil.copyfileobj(
+                        src, dst, min(info.file_size, _ZIP_COPY_BUFFER_SIZE)
+                    )
+
+
+def _load_json(path):
+    """Parse a JSON file, reading it in one call and closing it promptly."""
+    with open(path, "rb") as f:
+        return json.loads(f.read())
+
+
+def _prompts_path(base_dir, experiment):
+    """Return the prompts.json path inside the folder of ``experiment``."""
+    return os.path.join(
+        _get_experiment_folder(base_dir, experiment, _get_database_type()),
+        "prompts.json",
+    )
+
+
+@lru_cache(maxsize=64)
+def _load_prompts_cached(path, mtime_ns, size):
+    """Parse prompts.json; ``mtime_ns`` and ``size`` only key the cache."""
+    return _load_json(path)
+
+
+def _load_prompts(path):
+    """
+    Return the parsed prompts.json at ``path`` for read-only use.
+
+    Parsed files are cached per (mtime, size), so an edited file is re-read on
+    the next call. The returned dict is shared and must not be mutated; the
+    update routes read the file directly.
+    """
+    st = os.stat(path)
+    return _load_prompts_cached(path, st.st_mtime_ns, st.st_size)
+
+
+def _discard_upload_dir(exp_dir):
+    """
+    Remove a rejected upload directory without blocking the request.
+
+    Extracted archives can hold large databases and many files, so the
+    recursive delete runs on a daemon thread and the response is sent
+    straight away. The directory name is a fresh uuid, so nothing else
+    touches it in the meantime.
+    """
+    threading.Thread(
+        target=shutil.rmtree,
+        args=(exp_dir,),
+        kwargs={"ignore_errors": True},
+        daemon=True,
+    ).start()
+
+
+def _add_experiment_topics(exp_id, topics):
+    """
+    Link topics to an experiment, creating missing Topic_List entries.
+
+    Topic names are stripped and de-duplicated; existing topics are fetched
+    with a single IN query and missing ones are inserted in one flush. The
+    caller is responsible for committing.
+
+    Args:
+        exp_id: ID of the experiment to link topics to
+        topics: Iterable of topic names
+    """
+    topic_names = list(dict.fromkeys(t.strip() for t in topics if t.strip()))
+    if not topic_names:
+        return
+
+    existing = {
+        topic.name: topic
+        for topic in Topic_List.query.filter(Topic_List.name.in_(topic_names)).order_by(
+            Topic_List.id.desc()
+        )
+    }
+    missing = [Topic_List(name=name) for name in topic_names if name not in existing]
+    if missing:
+        db.session.add_all(missing)
+        db.session.flush()
+        existing.update((topic.name, topic) for topic in missing)
+
+    db.session.add_all(
+        [Exp_Topic(exp_id=exp_id, topic_id=existing[name].id) for name in topic_names]
+    )
+
+
+def _activity_profile_ids_by_name(names):
+    """
+    Resolve activity profile names to IDs, creating missing profiles.
+
+    Existing profiles are fetched with a single IN query; missing ones are
+    created with default working hours (9am-5pm) and flushed together.
+
+    Args:
+        names: Iterable of activity profile names (falsy names are ignored)
+
+    Returns:
+        Dict mapping profile name to ActivityProfile ID
+    """
+    names = {name for name in names if name}
+    if not names:
+        return {}
+
+    profile_ids = {
+        profile.name: profile.id
+        for profile in ActivityProfile.query.filter(ActivityProfile.name.in_(names))
+    }
+    new_profiles = [
+        ActivityProfile(name=name, hours="9,10,11,12,13,14,15,16,17")
+        for name in sorted(names - profile_ids.keys())
+    ]
+    if new_profiles:
+        db.session.add_all(new_profiles)
+        db.session.flush()
+        profile_ids.update((profile.name, profile.id) for profile in new_profiles)
+
+    return profile_ids
+
+
 @experiments.route("/admin/upload_experiment", methods=["POST"])
 @login_required
 def upload_experiment():
@@ -805,25 +1036,19 @@ def upload_experiment():
     from y_web.src.system.path_utils import get_writable_path
 
     BASE_DIR = get_writable_path()
+    exp_dir = os.path.join(BASE_DIR, "y_web", "experiments", uid)
 
-    pathlib.Path(f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}").mkdir(
-        parents=True, exist_ok=True
-    )
+    pathlib.Path(exp_dir).mkdir(parents=True, exist_ok=True)
+    zip_path = os.path.join(exp_dir, "exp.zip")
 
-    experiment.save(
-        f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}{os.sep}exp.zip"
-    )
+    experiment.save(zip_path, buffer_size=_UPLOAD_SAVE_BUFFER_SIZE)
     # unzip the file
-    shutil.unpack_archive(
-        f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}{os.sep}exp.zip",
-        f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}",
-    )
+    _extract_zip(zip_path, exp_dir)
     # remove the zip file
-    os.remove(f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}{os.sep}exp.zip")
+    os.remove(zip_path)
 
     # Handle ZIP files with nested directory structure
     # If config_server.json is not at the expected location, look for it in subdirectories
-    exp_dir = f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}"
     expected_config = os.path.join(exp_dir, "config_server.json")
 
     if not os.path.exists(expected_config):
@@ -845,9 +1070,7 @@ def upload_experiment():
                     break
 
     # Determine database type
-    db_type = "sqlite"
-    if current_app.config["SQLALCHEMY_DATABASE_URI"].startswith("postgresql"):
-        db_type = "postgresql"
+    db_type = _get_database_type()
 
     # Get suggested port for new experiment
     suggested_port = get_suggested_port()
@@ -855,21 +1078,18 @@ def upload_experiment():
         flash(
             "Error: No available port found in range 5000-6000. Cannot upload experiment."
         )
-        shutil.rmtree(
-            f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}",
-            ignore_errors=True,
-        )
+        _discard_upload_dir(exp_dir)
         return redirect(request.referrer)
 
     # create the experiment in the database from the config_server.json file
     try:
-        # list the files in the directory
-        files = os.listdir(f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}")
+        # list the files in the directory once; every later lookup reuses it
+        exp_files = os.listdir(exp_dir)
 
         # Detect simulator type by checking which config file exists
         # Standard experiments use config_server.json, HPC use server_config.json
-        config_path_standard = f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}{os.sep}config_server.json"
-        config_path_hpc = f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}{os.sep}server_config.json"
+        config_path_standard = expected_config
+        config_path_hpc = os.path.join(exp_dir, "server_config.json")
 
         is_hpc_experiment = False
         if os.path.exists(config_path_hpc):
@@ -883,41 +1103,42 @@ def upload_experiment():
                 "No server configuration file found (config_server.json or server_config.json)"
             )
 
-        with open(config_path, "r") as f:
-            experiment_config = json.load(f)
+        experiment_config = _load_json(config_path)
 
         # Use override name if provided, otherwise use name from config
         name = exp_name_override if exp_name_override else experiment_config["name"]
 
         # check if the experiment already exists
-        exp = Exps.query.filter_by(exp_name=name).first()
-
-        if exp:
+        if _row_exists(Exps.query.filter_by(exp_name=name)):
             flash(
                 "The experiment already exists. Please check the experiment name and try again."
             )
-            shutil.rmtree(
-                f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}",
-                ignore_errors=True,
-            )
+            _discard_upload_dir(exp_dir)
             return settings()
 
-        # Check client configuration files for llm_agents setting
-        # Default to enabled (1) unless we find [null] in any client config
-        llm_agents_enabled = 1
+        # Parse each client configuration once; the llm_agents check, the
+        # port rewrite and the per-population client setup reuse the result
         client_files = [
-            f
-            for f in os.listdir(
-                f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}"
-            )
-            if f.endswith(".json") and f.startswith("client")
+            f for f in exp_files if f.endswith(".json") and f.startswith("client")
         ]
+        client_configs = {}
+        client_config_errors = {}
+        for client_file in client_files:
+            try:
+                client_configs[client_file] = _load_json(
+                    os.path.join(exp_dir, client_file)
+                )
+            except Exception as e:
+                client_config_errors[client_file] = e
 
+        # Check client configuration files for llm_agents setting
+        # Default to enabled (1) unless we find [null] in any client config
+        llm_agents_enabled = 1
         for client_file in client_files:
             try:
-                client_config_path = f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}{os.sep}{client_file}"
-                with open(client_config_path, "r") as f:
-                    client_config = json.load(f)
+                if client_file in client_config_errors:
+                    raise client_config_errors[client_file]
+                client_config = client_configs[client_file]
 
                 # Check if agents.llm_agents exists and equals [null]
                 if (
@@ -945,18 +1166,11 @@ def upload_experiment():
 
         if db_type == "sqlite":
             db_name = f"experiments{os.sep}{uid}{os.sep}database_server.db"
-            db_uri = os.path.abspath(
-                f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}{os.sep}database_server.db"
-            )
+            db_uri = os.path.abspath(os.path.join(exp_dir, "database_server.db"))
         elif db_type == "postgresql":
-            from urllib.parse import urlparse
-
-            from sqlalchemy import create_engine, text
-            from werkzeug.security import generate_password_hash
-
             # Get current URI and parse it
             current_uri = current_app.config["SQLALCHEMY_DATABASE_URI"]
-            parsed_uri = urlparse(current_uri)
+            parsed_uri = _parse_database_uri(current_uri)
 
             # Extract components
             user = parsed_uri.username or "postgres"
@@ -973,9 +1187,7 @@ def upload_experiment():
             db_uri = f"postgresql://{user}:{password}@{host}:{port_db}/{dbname}"
 
             # Connect to the default 'postgres' DB to check/create the new one
-            admin_engine = create_engine(
-                f"postgresql://{user}:{password}@{host}:{port_db}/postgres"
-            )
+            admin_engine = _postgres_admin_engine(user, password, host, port_db)
 
             # Check and create database if needed
             with admin_engine.connect() as conn:
@@ -994,58 +1206,15 @@ def upload_experiment():
                     conn.execute(text(f'CREATE DATABASE "{dbname}"'))
 
                 # Connect to the newly created database
-                experiment_engine = create_engine(db_uri)
-                with experiment_engine.connect() as dummy_conn:
-                    # Load and execute schema
-                    schema_path = get_resource_path(
-                        os.path.join("data_schema", "postgre_server.sql")
-                    )
-                    try:
-                        with open(schema_path, "r") as schema_file:
-                            schema_sql = schema_file.read()
-                            dummy_conn.execute(text(schema_sql))
-                    except Exception as e:
-                        # If schema execution fails, log and re-raise
-                        current_app.logger.error(
-                            f"Failed to execute schema for database {dbname}: {str(e)}"
-                        )
-                        raise
-
-                    # Insert initial admin user
-                    hashed_pw = generate_password_hash("admin", method="pbkdf2:sha256")
-                    stmt = text("""
-                        INSERT INTO user_mgmt (username, email, password, user_type, leaning, age,
-                                               language, owner, joined_on, frecsys_type,
-                                               round_actions, toxicity, is_page, daily_activity_level, cover_image)
-                        VALUES (:username, :email, :password, :user_type, :leaning, :age,
-                                :language, :owner, :joined_on, :frecsys_type,
-                                :round_actions, :toxicity, :is_page, :daily_activity_level, :cover_image)
-                        """)
-
-                    dummy_conn.execute(
-                        stmt,
-                        {
-                            "username": "Admin",
-                            "email": "admin@y-not.social",
-                            "password": hashed_pw,
-                            "user_type": "user",
-                            "leaning": "none",
-                            "age": 0,
-                            "language": "en",
-                            "owner": "admin",
-                            "joined_on": 0,
-                            "frecsys_type": "default",
-                            "round_actions": 3,
-                            "toxicity": "none",
-                            "is_page": 0,
-                            "daily_activity_level": 1,
-                            "cover_image": random_cover_image_url(),
-                        },
+                experiment_engine = create_engine(db_uri, poolclass=NullPool)
+                try:
+                    _bootstrap_postgresql_experiment_db(experiment_engine)
+                except Exception as e:
+                    # If schema execution fails, log and re-raise
+                    current_app.logger.error(
+                        f"Failed to execute schema for database {dbname}: {str(e)}"
                     )
-
-                experiment_engine.dispose()
-
-            admin_engine.dispose()
+                    raise
 
         from y_web.src.experiment.schema import ensure_experiment_schema_for_uri
 
@@ -1059,52 +1228,48 @@ def upload_experiment():
         experiment_config["port"] = suggested_port
         experiment_config["database_uri"] = db_uri
         # Add data_path so YServer knows where to write logs (e.g., _server.log)
-        exp_data_path = os.path.join(BASE_DIR, "y_web", "experiments", uid) + os.sep
+        exp_data_path = exp_dir + os.sep
         experiment_config["data_path"] = exp_data_path
 
         with open(config_path, "w") as f:
             json.dump(experiment_config, f, indent=4)
 
         # Update all client configuration files with new port
-        for item in os.listdir(
-            f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}"
-        ):
-            if item.startswith("client") and item.endswith(".json"):
-                client_config_path = f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}{os.sep}{item}"
+        for item in client_files:
+            client_config_path = os.path.join(exp_dir, item)
+            try:
+                if item in client_config_errors:
+                    raise client_config_errors[item]
+                client_config = client_configs[item]
+            except json.JSONDecodeError as e:
+                flash(f"Warning: Failed to parse client config {item}: {str(e)}")
+                continue
+            except IOError as e:
+                flash(f"Warning: Failed to read client config {item}: {str(e)}")
+                continue
+
+            # Update the API endpoint in servers section
+            if "servers" in client_config and "api" in client_config["servers"]:
                 try:
-                    with open(client_config_path, "r") as f:
-                        client_config = json.load(f)
-                except json.JSONDecodeError as e:
-                    flash(f"Warning: Failed to parse client config {item}: {str(e)}")
-                    continue
+                    # Update the port in the API URL
+                    old_api = client_config["servers"]["api"]
+                    # Replace port in URL - handles both with and without trailing slash
+                    # Pattern matches :port/ or :port at end of string
+                    new_api = re.sub(r":(\d+)(/|$)", f":{suggested_port}\\2", old_api)
+                    client_config["servers"]["api"] = new_api
+
+                    with open(client_config_path, "w") as f:
+                        json.dump(client_config, f, indent=4)
                 except IOError as e:
-                    flash(f"Warning: Failed to read client config {item}: {str(e)}")
-                    continue
-
-                # Update the API endpoint in servers section
-                if "servers" in client_config and "api" in client_config["servers"]:
-                    try:
-                        # Update the port in the API URL
-                        import re
-
-                        old_api = client_config["servers"]["api"]
-                        # Replace port in URL - handles both with and without trailing slash
-                        # Pattern matches :port/ or :port at end of string
-                        new_api = re.sub(
-                            r":(\d+)(/|$)", f":{suggested_port}\\2", old_api
-                        )
-                        client_config["servers"]["api"] = new_api
-
-                        with open(client_config_path, "w") as f:
-                            json.dump(client_config, f, indent=4)
-                    except IOError as e:
-                        flash(
-                            f"Warning: Failed to write updated client config {item}: {str(e)}"
-                        )
-                    except Exception as e:
-                        flash(
-                            f"Warning: Failed to update port in client config {item}: {str(e)}"
-                        )
+                    client_configs.pop(item, None)
+                    flash(
+                        f"Warning: Failed to write updated client config {item}: {str(e)}"
+                    )
+                except Exception as e:
+                    client_configs.pop(item, None)
+                    flash(
+                        f"Warning: Failed to update port in client config {item}: {str(e)}"
+                    )
 
         exp = Exps(
             exp_name=name,
@@ -1142,35 +1307,20 @@ def upload_experiment():
         if not topics:
             topics = ["Topic 1"]
 
-        for topic_name in topics:
-            topic_name = topic_name.strip()
-            if topic_name:
-                # Check if topic already exists in Topic_List
-                existing_topic = Topic_List.query.filter_by(name=topic_name).first()
-                if not existing_topic:
-                    existing_topic = Topic_List(name=topic_name)
-                    db.session.add(existing_topic)
-                    db.session.commit()
-
-                # Add topic to experiment
-                exp_topic = Exp_Topic(exp_id=exp.idexp, topic_id=existing_topic.id)
-                db.session.add(exp_topic)
-                db.session.commit()
+        _add_experiment_topics(exp.idexp, topics)
+        db.session.commit()
 
     except Exception as e:
         flash(f"There was an error loading the experiment files: {str(e)}")
         # remove the directory containing the files
-        shutil.rmtree(
-            f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}",
-            ignore_errors=True,
-        )
+        _discard_upload_dir(exp_dir)
         return redirect(request.referrer)
 
     # get the json files that do not start with "client"
     # Also exclude server_config.json for HPC experiments
     populations = [
         f
-        for f in os.listdir(f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}")
+        for f in exp_files
         if f.endswith(".json")
         and not f.startswith("client")
         and f != "config_server.json"
@@ -1180,11 +1330,7 @@ def upload_experiment():
 
     for population_file in populations:
         original_name = population_file.split(".")[0]
-        pop = json.load(
-            open(
-                f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}{os.sep}{population_file}"
-            )
-        )
+        pop = _load_json(os.path.join(exp_dir, population_file))
 
         # check if the population already exists
         existing_population = Population.query.filter_by(name=original_name).first()
@@ -1225,7 +1371,6 @@ def upload_experiment():
                     id_exp=exp.idexp, id_population=population.id
                 )
                 db.session.add(pop_exp)
-                db.session.commit()
 
                 # Skip agent creation - use existing agents
                 population_created_or_reused = population
@@ -1234,12 +1379,12 @@ def upload_experiment():
                 # Find a unique name by appending a counter
                 counter = 1
                 new_name = f"{original_name}_{counter}"
-                while Population.query.filter_by(name=new_name).first():
+                while _row_exists(Population.query.filter_by(name=new_name)):
                     counter += 1
                     new_name = f"{original_name}_{counter}"
 
                 # Rename population and client JSON files to match the new population name
-                exp_folder = f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}"
+                exp_folder = exp_dir
 
                 # Rename population JSON file
                 old_pop_file = os.path.join(exp_folder, f"{original_name}.json")
@@ -1249,31 +1394,30 @@ def upload_experiment():
 
                 # Rename client JSON file(s) that contain the original population name
                 # Client files follow the pattern: client_{client_name}-{population_name}.json
-                for f in os.listdir(exp_folder):
-                    if f.startswith("client") and f.endswith(".json"):
-                        # Check if the filename ends with -{original_name}.json
-                        expected_suffix = f"-{original_name}.json"
-                        if f.endswith(expected_suffix):
-                            old_client_file = os.path.join(exp_folder, f)
-                            # Replace only the population name at the end
-                            new_client_filename = (
-                                f[: -len(expected_suffix)] + f"-{new_name}.json"
-                            )
-                            new_client_file = os.path.join(
-                                exp_folder, new_client_filename
-                            )
-                            os.rename(old_client_file, new_client_file)
+                expected_suffix = f"-{original_name}.json"
+                for idx, f in enumerate(client_files):
+                    # Check if the filename ends with -{original_name}.json
+                    if f.endswith(expected_suffix):
+                        old_client_file = os.path.join(exp_folder, f)
+                        # Replace only the population name at the end
+                        new_client_filename = (
+                            f[: -len(expected_suffix)] + f"-{new_name}.json"
+                        )
+                        new_client_file = os.path.join(exp_folder, new_client_filename)
+                        os.rename(old_client_file, new_client_file)
+                        client_files[idx] = new_client_filename
+                        if f in client_configs:
+                            client_configs[new_client_filename] = client_configs.pop(f)
 
                 # Create new population with unique name
                 population = Population(name=new_name, descr="")
                 db.session.add(population)
-                db.session.commit()
+                db.session.flush()
 
                 pop_exp = Population_Experiment(
                     id_exp=exp.idexp, id_population=population.id
                 )
                 db.session.add(pop_exp)
-                db.session.commit()
 
                 # Mark that we need to create agents for this new population
                 population_created_or_reused = None
@@ -1281,33 +1425,46 @@ def upload_experiment():
             # Create new population and its agents
             population = Population(name=original_name, descr="")
             db.session.add(population)
-            db.session.commit()
+            db.session.flush()
 
             pop_exp = Population_Experiment(
                 id_exp=exp.idexp, id_population=population.id
             )
             db.session.add(pop_exp)
-            db.session.commit()
 
             # Mark that we need to create agents for this new population
             population_created_or_reused = None
 
-        # Only create agents if this is a new population or agents are different
+        # Only create agents if this is a new population or agents are different.
+        # Rows are flushed in batches and committed once per population.
         if population_created_or_reused is None:
+            activity_profile_ids = _activity_profile_ids_by_name(
+                agent.get("activity_profile", "default")
+                for agent in pop["agents"]
+                if agent["is_page"] != 1
+            )
+
+            # Resolve existing pages with one query (lowest ID wins on duplicates)
+            page_names = [
+                agent["name"] for agent in pop["agents"] if agent["is_page"] == 1
+            ]
+            pages_by_name = {}
+            if page_names:
+                pages_by_name = {
+                    page.name: page
+                    for page in Page.query.filter(Page.name.in_(page_names)).order_by(
+                        Page.id.desc()
+                    )
+                }
+
+            new_agents = []
+            new_pages = []
+            population_pages = []
             for agent in pop["agents"]:
                 if agent["is_page"] == 1:
-                    # check if the page already exists
-                    page = Page.query.filter_by(name=agent["name"]).first()
-
-                    if page:
-                        # add page to the population
-                        ap = Page_Population(
-                            page_id=page.id, population_id=population.id
-                        )
-                        db.session.add(ap)
-                        db.session.commit()
+                    page = pages_by_name.get(agent["name"])
 
-                    else:
+                    if not page:
                         # add page to the database
                         page = Page(
                             name=agent["name"],
@@ -1319,38 +1476,13 @@ def upload_experiment():
                             leaning=agent["leaning"],
                             logo="",
                         )
-                        db.session.add(page)
-                        db.session.commit()
+                        new_pages.append(page)
+                        pages_by_name[page.name] = page
 
-                        # add page to the population
-                        ap = Page_Population(
-                            page_id=page.id, population_id=population.id
-                        )
-                        db.session.add(ap)
-                        db.session.commit()
+                    population_pages.append(page)
 
                 # add agent to the database
                 else:
-                    # Handle activity_profile - look up by name or create default
-                    activity_profile_id = None
-                    activity_profile_name = agent.get("activity_profile", "default")
-                    if activity_profile_name:
-                        existing_profile = ActivityProfile.query.filter_by(
-                            name=activity_profile_name
-                        ).first()
-                        if existing_profile:
-                            activity_profile_id = existing_profile.id
-                        else:
-                            # Create a default activity profile if it doesn't exist
-                            # Default hours: 9am-5pm working hours
-                            new_profile = ActivityProfile(
-                                name=activity_profile_name,
-                                hours="9,10,11,12,13,14,15,16,17",
-                            )
-                            db.session.add(new_profile)
-                            db.session.commit()
-                            activity_profile_id = new_profile.id
-
                     ag = Agent(
                         name=agent["name"],
                         age=agent["age"],
@@ -1373,43 +1505,54 @@ def upload_experiment():
                         cover_image=random_cover_image_url(),
                         daily_activity_level=agent["daily_activity_level"],
                         profession=agent["profession"] if "profession" in agent else "",
-                        activity_profile=activity_profile_id,
+                        activity_profile=activity_profile_ids.get(
+                            agent.get("activity_profile", "default")
+                        ),
                     )
-                    db.session.add(ag)
-                    db.session.commit()
+                    new_agents.append((agent, ag))
+
+            # Flush all new pages and agents at once to obtain their IDs
+            db.session.add_all(new_pages)
+            db.session.add_all([ag for _, ag in new_agents])
+            db.session.flush()
+
+            db.session.bulk_insert_mappings(
+                Page_Population,
+                [
+                    {"page_id": page.id, "population_id": population.id}
+                    for page in population_pages
+                ],
+            )
 
-                    if "prompts" in agent and agent["prompts"] is not None:
-                        ag_profile = Agent_Profile(
-                            agent_id=ag.id, profile=agent["prompts"]
-                        )
-                        db.session.add(ag_profile)
-                        db.session.commit()
+            db.session.bulk_insert_mappings(
+                Agent_Profile,
+                [
+                    {"agent_id": ag.id, "profile": agent["prompts"]}
+                    for agent, ag in new_agents
+                    if "prompts" in agent and agent["prompts"] is not None
+                ],
+            )
+            db.session.bulk_insert_mappings(
+                Agent_Population,
+                [
+                    {"agent_id": ag.id, "population_id": population.id}
+                    for _, ag in new_agents
+                ],
+            )
 
-                    # add agent to population
-                    ap = Agent_Population(agent_id=ag.id, population_id=population.id)
-                    db.session.add(ap)
-                    db.session.commit()
+        db.session.commit()
 
         # Get client configuration file for this population
         # For Standard: client_*.json files containing population name
         # For HPC: client_{name}-{population}.json files
-        client = [
-            f
-            for f in os.listdir(
-                f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}"
-            )
-            if f.endswith(".json") and f.startswith("client") and original_name in f
-        ]
+        client = [f for f in client_files if original_name in f]
 
         # Handle missing client configs
         if len(client) == 0:
             if not is_hpc_experiment:
                 # Standard experiments REQUIRE client config
                 flash("No client file found for the population")
-                shutil.rmtree(
-                    f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}",
-                    ignore_errors=True,
-                )
+                _discard_upload_dir(exp_dir)
                 return redirect(request.referrer)
             else:
                 # HPC experiments: Auto-create default client if config missing
@@ -1453,7 +1596,7 @@ def upload_experiment():
                     llm_v_temperature=0.7,
                 )
                 db.session.add(cl)
-                db.session.commit()
+                db.session.flush()
 
                 # Create Client_Execution for progress tracking
                 expected_rounds = cl.days * 24  # HPC uses 24 hourly slots
@@ -1472,11 +1615,10 @@ def upload_experiment():
                 )
                 continue  # Skip to next population
 
-        client_config = json.load(
-            open(
-                f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}{os.sep}{client[0]}"
-            )
-        )
+        client_config = client_configs.get(client[0])
+        if client_config is None:
+            # Not parsed earlier, or its port rewrite failed
+            client_config = _load_json(os.path.join(exp_dir, client[0]))
 
         # Parse client configuration based on experiment type
         if is_hpc_experiment:
@@ -1564,7 +1706,7 @@ def upload_experiment():
                 llm_v_temperature=client_config["servers"]["llm_v_temperature"],
             )
         db.session.add(cl)
-        db.session.commit()
+        db.session.flush()
 
         # For infinite clients (days = -1), set expected_duration_rounds to -1
         # For HPC, slots default to 24 (one per hour)
@@ -1599,36 +1741,25 @@ def upload_database():
     database = request.files["sqlite_filename"]
     config = request.files["yserver_filename"]
     uid = uuid.uuid4()
-    pathlib.Path(f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}").mkdir(
-        parents=True, exist_ok=True
-    )
+    exp_dir = os.path.join(BASE_DIR, "y_web", "experiments", str(uid))
+    pathlib.Path(exp_dir).mkdir(parents=True, exist_ok=True)
 
     database.save(
-        f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}{os.sep}database_server.db"
-    )
-    config.save(
-        f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}{os.sep}config_server.json"
+        os.path.join(exp_dir, "database_server.db"),
+        buffer_size=_UPLOAD_SAVE_BUFFER_SIZE,
     )
+    config.save(os.path.join(exp_dir, "config_server.json"))
 
     try:
-        experiment = json.load(
-            open(
-                f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}{os.sep}config_server.json"
-            )
-        )
+        experiment = _load_json(os.path.join(exp_dir, "config_server.json"))
         experiment = experiment["name"]
 
         # check if the experiment already exists
-        exp = Exps.query.filter_by(exp_name=experiment).first()
-
-        if exp:
+        if _row_exists(Exps.query.filter_by(exp_name=experiment)):
             flash(
                 "The experiment already exists. Please check the experiment name and try again."
             )
-            shutil.rmtree(
-                f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}",
-                ignore_errors=True,
-            )
+            _discard_upload_dir(exp_dir)
             return settings()
 
         exp = Exps(
@@ -1656,10 +1787,7 @@ def upload_database():
             "There was an error loading the experiment files. Please check the files and try again."
         )
         # remove the directory containing the files
-        shutil.rmtree(
-            f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}",
-            ignore_errors=True,
-        )
+        _discard_upload_dir(exp_dir)
 
     return settings()
 
@@ -1893,8 +2021,6 @@ def create_experiment():
         # Basic validation for hostname/IP format
         # Allow: IP addresses (IPv4), domain names, and localhost
         # This is a basic check - actual connectivity validation happens at runtime
-        import re
-
         # Pattern allows: alphanumeric, dots, hyphens, and colons (for IPv6)
         if not re.match(r"^[a-zA-Z0-9\.\-\:]+$", host):
             flash("Invalid remote host format. Use IP address or domain name.")
@@ -1963,20 +2089,17 @@ def create_experiment():
     topics = request.form.get("tags").split(",")
 
     # identify db type
-    db_type = "sqlite"
-    if current_app.config["SQLALCHEMY_DATABASE_URI"].startswith("postgresql"):
-        db_type = "postgresql"
+    db_type = _get_database_type()
 
     from y_web.src.system.path_utils import get_writable_path
 
     BASE_DIR = get_writable_path()
 
     uid = str(uuid.uuid4()).replace("-", "_")
-    pathlib.Path(f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}").mkdir(
-        parents=True, exist_ok=True
-    )
+    exp_dir = os.path.join(BASE_DIR, "y_web", "experiments", uid)
+    pathlib.Path(exp_dir).mkdir(parents=True, exist_ok=True)
 
-    db_uri = f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}{os.sep}database_server.db"
+    db_uri = os.path.join(exp_dir, "database_server.db")
 
     # copy the clean database to the experiments folder
     if platform_type == "microblogging" or platform_type == "forum":
@@ -1989,17 +2112,12 @@ def create_experiment():
                 )
                 shutil.copyfile(
                     clean_db_source,
-                    f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}{os.sep}database_server.db",
+                    os.path.join(exp_dir, "database_server.db"),
                 )
         elif db_type == "postgresql":
-            from urllib.parse import urlparse
-
-            from sqlalchemy import create_engine, text
-            from werkzeug.security import generate_password_hash
-
             # Get current URI and parse it
             current_uri = current_app.config["SQLALCHEMY_DATABASE_URI"]
-            parsed_uri = urlparse(current_uri)
+            parsed_uri = _parse_database_uri(current_uri)
 
             # Extract components
             user = parsed_uri.username or "postgres"
@@ -2012,9 +2130,7 @@ def create_experiment():
             db_uri = f"postgresql://{user}:{password}@{host}:{port_db}/{dbname}"
 
             # Connect to the default 'postgres' DB to check/create the new one
-            admin_engine = create_engine(
-                f"postgresql://{user}:{password}@{host}:{port_db}/postgres"
-            )
+            admin_engine = _postgres_admin_engine(user, password, host, port_db)
 
             # --- Check and create dummy DB if needed ---
             with admin_engine.connect() as conn:
@@ -2034,52 +2150,8 @@ def create_experiment():
                     )  # quoted for safety
 
                 # ✅ Now connect to the *newly created* database
-                experiment_engine = create_engine(db_uri)
-                with experiment_engine.connect() as dummy_conn:
-                    # Load schema
-                    schema_path = get_resource_path(
-                        os.path.join("data_schema", "postgre_server.sql")
-                    )
-                    with open(schema_path, "r") as schema_file:
-                        schema_sql = schema_file.read()
-                        dummy_conn.execute(text(schema_sql))
-
-                    # Insert initial admin user
-                    hashed_pw = generate_password_hash("admin", method="pbkdf2:sha256")
-
-                    stmt = text("""
-                                INSERT INTO user_mgmt (username, email, password, user_type, leaning, age,
-                                                       language, owner, joined_on, frecsys_type,
-                                                       round_actions, toxicity, is_page, daily_activity_level, cover_image)
-                                VALUES (:username, :email, :password, :user_type, :leaning, :age,
-                                        :language, :owner, :joined_on, :frecsys_type,
-                                        :round_actions, :toxicity, :is_page, :daily_activity_level, :cover_image)
-                                """)
-
-                    dummy_conn.execute(
-                        stmt,
-                        {
-                            "username": "Admin",
-                            "email": "admin@y-not.social",
-                            "password": hashed_pw,
-                            "user_type": "user",
-                            "leaning": "none",
-                            "age": 0,
-                            "language": "en",
-                            "owner": "admin",
-                            "joined_on": 0,
-                            "frecsys_type": "default",
-                            "round_actions": 3,
-                            "toxicity": "none",
-                            "is_page": 0,
-                            "daily_activity_level": 1,
-                            "cover_image": random_cover_image_url(),
-                        },
-                    )
-
-                experiment_engine.dispose()
-
-            admin_engine.dispose()
+                experiment_engine = create_engine(db_uri, poolclass=NullPool)
+                _bootstrap_postgresql_experiment_db(experiment_engine)
 
         from y_web.src.experiment.schema import ensure_experiment_schema_for_uri
 
@@ -2095,16 +2167,16 @@ def create_experiment():
         raise NotImplementedError(f"Unsupported platform {platform_type}")
 
     # Generate data_path
-    data_path = f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}{os.sep}"
+    data_path = exp_dir + os.sep
 
     # Generate config based on simulator type
     if simulator_type == "HPC":
         # For HPC, extract PostgreSQL connection details if using postgresql
         db_config_dict = None
         if db_type == "postgresql":
-            from urllib.parse import urlparse
-
-            parsed_uri = urlparse(current_app.config["SQLALCHEMY_DATABASE_URI"])
+            parsed_uri = _parse_database_uri(
+                current_app.config["SQLALCHEMY_DATABASE_URI"]
+            )
             db_config_dict = {
                 "host": parsed_uri.hostname or "localhost",
                 "port": parsed_uri.port or 5432,
@@ -2161,13 +2233,13 @@ def create_experiment():
 
     if simulator_type == "HPC":
         with open(
-            f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}{os.sep}server_config.json",
+            os.path.join(exp_dir, "server_config.json"),
             "w",
         ) as f:
             json.dump(config, f, indent=4)
     else:
         with open(
-            f"{BASE_DIR}{os.sep}y_web{os.sep}experiments{os.sep}{uid}{os.sep}config_server.json",
+            os.path.join(exp_dir, "config_server.json"),
             "w",
         ) as f:
             json.dump(config, f, indent=4)
@@ -2221,20 +2293,8 @@ def create_experiment():
     db.session.add(rnd)
     db.session.commit()
 
-    for topic in topics:
-        # check if the topic already exists in Topics
-        topic = topic.strip()
-        if topic:
-            existing_topic = Topic_List.query.filter_by(name=topic).first()
-            if not existing_topic:
-                existing_topic = Topic_List(name=topic)
-                db.session.add(existing_topic)
-                db.session.commit()
-
-            # add the topic to the experiment
-            exp_topic = Exp_Topic(exp_id=exp.idexp, topic_id=existing_topic.id)
-            db.session.add(exp_topic)
-            db.session.commit()
+    _add_experiment_topics(exp.idexp, topics)
+    db.session.commit()
 
     jn_instance = Jupyter_instances(
         port=-1, notebook_dir="", exp_id=exp.idexp, status="stopped"
@@ -2266,7 +2326,7 @@ def delete_simulation(exp_id):
     """Delete a single simulation."""
     check_privileges(current_user.username)
     admin_user = _current_admin_user_or_none()
-    exp = Exps.query.filter_by(idexp=exp_id).first()
+    exp = db.session.get(Exps, exp_id)
     if exp and not user_can_manage_experiment(admin_user, exp):
         flash("You do not have permission to delete this experiment.", "error")
         return settings()
@@ -2289,42 +2349,25 @@ def _delete_simulation_internal(exp_id):
         tuple(bool, str|None): (deleted, error_message)
     """
     # get the experiment
-    exp = Exps.query.filter_by(idexp=exp_id).first()
+    exp = db.session.get(Exps, exp_id)
     if exp:
         # remove the experiment folder
         # check database type
-        if current_app.config["SQLALCHEMY_BINDS"]["db_exp"].startswith("sqlite"):
+        exp_bind = current_app.config["SQLALCHEMY_BINDS"]["db_exp"]
+        if exp_bind.startswith(("sqlite", "postgresql")):
             from y_web.src.system.path_utils import get_writable_path
 
-            BASE_DIR = get_writable_path()
+            db_type = "sqlite" if exp_bind.startswith("sqlite") else "postgresql"
             shutil.rmtree(
-                os.path.join(
-                    BASE_DIR,
-                    f"y_web{os.sep}experiments{os.sep}{exp.db_name.split(os.sep)[1]}",
-                ),
-                ignore_errors=True,
-            )
-        elif current_app.config["SQLALCHEMY_BINDS"]["db_exp"].startswith("postgresql"):
-            # Remove experiment folder
-            from y_web.src.system.path_utils import get_writable_path
-
-            BASE_DIR = get_writable_path()
-            shutil.rmtree(
-                os.path.join(
-                    BASE_DIR,
-                    f"y_web{os.sep}experiments{os.sep}{exp.db_name.removeprefix('experiments_')}",
-                ),
+                _get_experiment_folder(get_writable_path(), exp, db_type),
                 ignore_errors=True,
             )
 
+        if exp_bind.startswith("postgresql"):
             # Drop the PostgreSQL database
             try:
-                from urllib.parse import urlparse
-
-                from sqlalchemy import create_engine, text
-
                 current_uri = current_app.config["SQLALCHEMY_DATABASE_URI"]
-                parsed_uri = urlparse(current_uri)
+                parsed_uri = _parse_database_uri(current_uri)
 
                 user = parsed_uri.username or "postgres"
                 password = parsed_uri.password or "password"
@@ -2332,9 +2375,7 @@ def _delete_simulation_internal(exp_id):
                 port_db = parsed_uri.port or 5432
 
                 # Connect to postgres database
-                admin_engine = create_engine(
-                    f"postgresql://{user}:{password}@{host}:{port_db}/postgres"
-                )
+                admin_engine = _postgres_admin_engine(user, password, host, port_db)
 
                 # Drop the database if it exists
                 with admin_engine.connect().execution_options(
@@ -2352,57 +2393,13 @@ def _delete_simulation_internal(exp_id):
                     )
                     # Drop the database
                     conn.execute(text(f'DROP DATABASE IF EXISTS "{exp.db_name}"'))
-
-                admin_engine.dispose()
             except Exception as e:
                 # Log error but continue with deletion
                 current_app.logger.error(
                     f"Error dropping PostgreSQL database: {str(e)}", exc_info=True
                 )
 
-        # delete the experiment
-        db.session.delete(exp)
-        db.session.commit()
-
-        # Delete log metrics and offsets (should cascade but we do it explicitly for safety)
-        db.session.query(LogFileOffset).filter_by(exp_id=exp_id).delete()
-        db.session.query(ServerLogMetrics).filter_by(exp_id=exp_id).delete()
-        db.session.query(ClientLogMetrics).filter_by(exp_id=exp_id).delete()
-        db.session.commit()
-
-        # remove populaiton_experiment
-        db.session.query(Population_Experiment).filter_by(id_exp=exp_id).delete()
-        db.session.commit()
-
-        # delete user experiment
-        db.session.query(User_Experiment).filter_by(exp_id=exp_id).delete()
-        db.session.commit()
-
-        # get clients ids for the experiment
-        clients = db.session.query(Client).filter_by(id_exp=exp_id).all()
-        cids = [c.id for c in clients]
-
-        # delete the clients
-        db.session.query(Client).filter_by(id_exp=exp_id).delete()
-        db.session.commit()
-
-        # delete exp stats
-        db.session.query(Exp_stats).filter_by(exp_id=exp_id).delete()
-        db.session.commit()
-
-        for cid in cids:
-            # delete the client executions
-            db.session.query(Client_Execution).filter_by(client_id=cid).delete()
-            db.session.commit()
-
-            db.session.query(Client).filter_by(id=cid).delete()
-            db.session.commit()
-
-        # delete experiment topics
-        db.session.query(Exp_Topic).filter_by(exp_id=exp_id).delete()
-        db.session.commit()
-
-        # delete jupyter instances
+        # stop any running jupyter instances before removing their rows
         instances = db.session.query(Jupyter_instances).filter_by(exp_id=exp_id).all()
         for instance in instances:
             try:
@@ -2410,7 +2407,30 @@ def _delete_simulation_internal(exp_id):
                     stop_process(instance.process, instance.exp_id)
             except Exception:
                 pass
-        db.session.query(Jupyter_instances).filter_by(exp_id=exp_id).delete()
+
+        # Delete all related rows and the experiment in a single transaction
+        client_ids = db.select(Client.id).where(Client.id_exp == exp_id)
+        db.session.query(Client_Execution).filter(
+            Client_Execution.client_id.in_(client_ids)
+        ).delete(synchronize_session=False)
+        db.session.query(Client).filter_by(id_exp=exp_id).delete(
+            synchronize_session=False
+        )
+
+        # log metrics and offsets (should cascade but we do it explicitly for safety)
+        for model in (LogFileOffset, ServerLogMetrics, ClientLogMetrics):
+            db.session.query(model).filter_by(exp_id=exp_id).delete(
+                synchronize_session=False
+            )
+        db.session.query(Population_Experiment).filter_by(id_exp=exp_id).delete(
+            synchronize_session=False
+        )
+        for model in (User_Experiment, Exp_stats, Exp_Topic, Jupyter_instances):
+            db.session.query(model).filter_by(exp_id=exp_id).delete(
+                synchronize_session=False
+            )
+
+        db.session.delete(exp)
         db.session.commit()
 
         return True, None
@@ -2442,7 +2462,7 @@ def delete_simulations_bulk():
     failed_ids = []
 
     for eid in normalized_ids:
-        exp = Exps.query.filter_by(idexp=eid).first()
+        exp = db.session.get(Exps, eid)
         if exp and not user_can_manage_experiment(admin_user, exp):
             failed_ids.append(eid)
             continue
@@ -2463,6 +2483,17 @@ def delete_simulations_bulk():
     return redirect(url_for("experiments.settings"))
 
 
+def _redirect_to_details(uid):
+    """
+    Redirect (303) to the experiment details page after a start/stop request.
+
+    The details page is rendered by its own GET request instead of inside the
+    mutating one, so it loads fresh rows and a browser reload does not repeat
+    the start/stop.
+    """
+    return redirect(url_for("experiments.experiment_details", uid=uid), code=303)
+
+
 @experiments.route("/admin/start_experiment/<int:uid>")
 @login_required
 def start_experiment(uid):
@@ -2470,7 +2501,7 @@ def start_experiment(uid):
     check_privileges(current_user.username)
 
     # get experiment
-    exp = Exps.query.filter_by(idexp=uid).first()
+    exp = db.session.get(Exps, uid)
     admin_user = _current_admin_user_or_none()
     if not user_can_view_experiment(admin_user, exp):
         flash("You are not allowed to start this experiment.", "error")
@@ -2481,11 +2512,11 @@ def start_experiment(uid):
             "Update Experiment Configuration before starting the server or creating clients.",
             "warning",
         )
-        return experiment_details(uid)
+        return _redirect_to_details(uid)
 
     # check if the experiment is already running
     if exp.running == 1:
-        return experiment_details(uid)
+        return _redirect_to_details(uid)
 
     # update the experiment status
     db.session.query(Exps).filter_by(idexp=uid).update(
@@ -2495,7 +2526,7 @@ def start_experiment(uid):
 
     start_server_for_experiment(exp)
 
-    return experiment_details(uid)
+    return _redirect_to_details(uid)
 
 
 @experiments.route("/admin/stop_experiment/<int:uid>")
@@ -2515,7 +2546,7 @@ def stop_experiment(uid):
     check_privileges(current_user.username)
 
     # get experiment
-    exp = Exps.query.filter_by(idexp=uid).first()
+    exp = db.session.get(Exps, uid)
     admin_user = _current_admin_user_or_none()
     if not user_can_manage_experiment(admin_user, exp):
         flash("You do not have permission to stop this experiment.", "error")
@@ -2526,53 +2557,33 @@ def stop_experiment(uid):
             "Update Experiment Configuration before changing server or client execution state.",
             "warning",
         )
-        return experiment_details(uid)
+        return _redirect_to_details(uid)
 
     # check if the experiment is already running
     if exp.running == 0:
         stop_all_adhoc_clients(exp, pause=False)
-        return experiment_details(uid)
+        return _redirect_to_details(uid)
 
     # Step 1 & 2: Stop all running clients attached to this experiment first
     # This prevents clients from trying to communicate with a dead server
     clients = Client.query.filter_by(id_exp=uid).all()
-    all_clients_stopped = True
-    for client in clients:
-        # Only terminate clients that are marked as running (status=1)
-        if client.status == 1:
-            stop_result = True
-            # Terminate the client process if it has a PID
-            if client.pid or exp.simulator_type == "HPC":
-                print(
-                    f"Stopping client {client.name} (ID: {client.id}, PID: {client.pid}) for experiment {uid}"
-                )
-                stop_result = stop_client_for_experiment(exp, client, pause=False)
-
-            # Update client status in database
-            if exp.simulator_type == "HPC" and stop_result is False:
-                client.status = 1
-                all_clients_stopped = False
-            else:
-                client.status = 0
-            db.session.commit()
-
-    if not all_clients_stopped:
+    if not _stop_running_clients(exp, clients):
         flash(
             "Unable to confirm stop for one or more HPC clients. Experiment remains active.",
             "warning",
         )
-        return experiment_details(uid)
+        return _redirect_to_details(uid)
 
     # Step 3: Now stop the yserver after all clients are terminated
     # Try the new subprocess-based termination first
     # If that fails or no process is tracked, fall back to port-based termination
     stop_server_for_experiment(exp)
 
-    # Update the experiment status in database
+    # Update the experiment status in database; it is committed together with
+    # the optional schedule log entry below
     db.session.query(Exps).filter_by(idexp=uid).update(
         {Exps.running: 0, Exps.exp_status: "stopped"}
     )
-    db.session.commit()
 
     # Step 5: If the experiment is part of a running schedule, keep it in the group.
     # Manual stop should not advance or reshuffle the schedule; the user can resume
@@ -2594,9 +2605,9 @@ def stop_experiment(uid):
                 f"group '{group_name}' and left in place for later resume."
             )
             db.session.add(ExperimentScheduleLog(message=log_msg, log_type="warning"))
-            db.session.commit()
+    db.session.commit()
 
-    return experiment_details(uid)
+    return _redirect_to_details(uid)
 
 
 @experiments.route("/admin/prompts/<int:uid>")
@@ -2610,7 +2621,7 @@ def prompts(uid):
     BASE_DIR = get_writable_path()
 
     # get experiment details
-    experiment = Exps.query.filter_by(idexp=uid).first()
+    experiment = db.session.get(Exps, uid)
 
     # Route to the configuration page matching the experiment type.
     if experiment.simulator_type == "HPC":
@@ -2619,13 +2630,10 @@ def prompts(uid):
         return redirect(url_for("experiments.prompts_forum", uid=uid))
 
     # get the prompts file for the experiment
-    prompts = os.path.join(
-        BASE_DIR,
-        f"y_web{os.sep}experiments{os.sep}{experiment.db_name.split(os.sep)[1]}{os.sep}prompts.json",
-    )
+    prompts = _prompts_path(BASE_DIR, experiment)
 
     # read the prompts file
-    prompts = json.load(open(prompts))
+    prompts = _load_prompts(prompts)
 
     return render_template("admin/prompts.html", experiment=experiment, prompts=prompts)
 
@@ -2640,7 +2648,7 @@ def prompts_forum(uid):
 
     BASE_DIR = get_writable_path()
 
-    experiment = Exps.query.filter_by(idexp=uid).first()
+    experiment = db.session.get(Exps, uid)
 
     if not experiment:
         flash("Experiment not found.", "error")
@@ -2651,13 +2659,9 @@ def prompts_forum(uid):
     if experiment.platform_type != "forum":
         return redirect(url_for("experiments.prompts", uid=uid))
 
-    prompts_path = os.path.join(
-        BASE_DIR,
-        f"y_web{os.sep}experiments{os.sep}{experiment.db_name.split(os.sep)[1]}{os.sep}prompts.json",
-    )
+    prompts_path = _prompts_path(BASE_DIR, experiment)
 
-    with open(prompts_path) as f:
-        prompts = json.load(f)
+    prompts = _load_prompts(prompts_path)
 
     return render_template(
         "admin/prompts_forum.html", experiment=experiment, prompts=prompts
@@ -2675,7 +2679,7 @@ def prompts_hpc(uid):
     BASE_DIR = get_writable_path()
 
     # get experiment details
-    experiment = Exps.query.filter_by(idexp=uid).first()
+    experiment = db.session.get(Exps, uid)
 
     if not experiment:
         flash("Experiment not found.", "error")
@@ -2690,14 +2694,10 @@ def prompts_hpc(uid):
         return redirect(url_for("experiments.prompts", uid=uid))
 
     # get the prompts file for the experiment
-    prompts_path = os.path.join(
-        BASE_DIR,
-        f"y_web{os.sep}experiments{os.sep}{experiment.db_name.split(os.sep)[1]}{os.sep}prompts.json",
-    )
+    prompts_path = _prompts_path(BASE_DIR, experiment)
 
     # read the prompts file
-    with open(prompts_path) as f:
-        prompts = json.load(f)
+    prompts = _load_prompts(prompts_path)
 
     return render_template(
         "admin/prompts_hpc.html", experiment=experiment, prompts=prompts
@@ -2715,22 +2715,20 @@ def update_prompts(uid):
     BASE_DIR = get_writable_path()
 
     # get experiment details
-    experiment = Exps.query.filter_by(idexp=uid).first()
+    experiment = db.session.get(Exps, uid)
     # get the prompts file for the experiment
-    prompts_filename = os.path.join(
-        BASE_DIR,
-        f"y_web{os.sep}experiments{os.sep}{experiment.db_name.split(os.sep)[1]}{os.sep}prompts.json",
-    )
+    prompts_filename = _prompts_path(BASE_DIR, experiment)
 
     # read the prompts file
-    prompts = json.load(open(prompts_filename))
+    prompts = _load_json(prompts_filename)
 
     # update the prompts
     for key in request.form.keys():
         prompts[key] = request.form[key]
 
     # write the updated prompts
-    json.dump(prompts, open(prompts_filename, "w"), indent=4)
+    with open(prompts_filename, "w") as f:
+        json.dump(prompts, f, indent=4)
 
     return redirect(request.referrer)
 
@@ -2746,7 +2744,7 @@ def update_prompts_hpc(uid):
     BASE_DIR = get_writable_path()
 
     # get experiment details
-    experiment = Exps.query.filter_by(idexp=uid).first()
+    experiment = db.session.get(Exps, uid)
 
     if not experiment:
         flash("Experiment not found.", "error")
@@ -2758,10 +2756,7 @@ def update_prompts_hpc(uid):
         return redirect(request.referrer)
 
     # get the prompts file for the experiment
-    prompts_filename = os.path.join(
-        BASE_DIR,
-        f"y_web{os.sep}experiments{os.sep}{experiment.db_name.split(os.sep)[1]}{os.sep}prompts.json",
-    )
+    prompts_filename = _prompts_path(BASE_DIR, experiment)
 
     # read the prompts file
     with open(prompts_filename) as f:
@@ -2860,7 +2855,7 @@ def copy_experiment():
         num_copies = 1
 
     # Get source experiment
-    source_exp = Exps.query.filter_by(idexp=source_exp_id).first()
+    source_exp = db.session.get(Exps, source_exp_id)
     if not source_exp:
         flash("Source experiment not found.")
         return redirect(url_for("experiments.settings"))
@@ -2870,8 +2865,7 @@ def copy_experiment():
 
     # Validate that none of the names already exist
     for name in exp_names_to_create:
-        existing_exp = Exps.query.filter_by(exp_name=name).first()
-        if existing_exp:
+        if _row_exists(Exps.query.filter_by(exp_name=name)):
             flash(f"An experiment with name '{name}' already exists.")
             return redirect(url_for("experiments.settings"))
 
@@ -2945,9 +2939,7 @@ def _create_single_experiment_copy(source_exp, new_exp_name, exp_group=""):
     new_uid = str(uuid.uuid4()).replace("-", "_")
 
     # Determine database type
-    db_type = "sqlite"
-    if current_app.config["SQLALCHEMY_DATABASE_URI"].startswith("postgresql"):
-        db_type = "postgresql"
+    db_type = _get_database_type()
 
     # Extract source experiment folder
     if db_type == "sqlite":
@@ -2982,8 +2974,6 @@ def _create_single_experiment_copy(source_exp, new_exp_name, exp_group=""):
     is_hpc = os.path.exists(os.path.join(source_folder, "server_config.json"))
 
     # Copy all files from source to new folder, excluding log files and HPC-specific files
-    import re
-
     log_pattern = re.compile(r"\.log(\.\d+)?$")  # Matches .log, .log.1, .log.2, etc.
 
     for item in os.listdir(source_folder):
@@ -3045,8 +3035,6 @@ def _create_single_experiment_copy(source_exp, new_exp_name, exp_group=""):
                 shutil.copy2(clean_db_path, new_db_path)
             else:
                 # If clean DB doesn't exist, create an empty database file
-                import sqlite3
-
                 conn = sqlite3.connect(new_db_path)
                 conn.close()
         # For HPC: Do NOT create any database file - the HPC server will create it on startup
@@ -3059,13 +3047,8 @@ def _create_single_experiment_copy(source_exp, new_exp_name, exp_group=""):
 
     elif db_type == "postgresql":
         # Create new PostgreSQL database with clean schema (no data from source)
-        from urllib.parse import urlparse
-
-        from sqlalchemy import create_engine, text
-        from werkzeug.security import generate_password_hash
-
         current_uri = current_app.config["SQLALCHEMY_DATABASE_URI"]
-        parsed_uri = urlparse(current_uri)
+        parsed_uri = _parse_database_uri(current_uri)
 
         user = parsed_uri.username or "postgres"
         password = parsed_uri.password or "password"
@@ -3077,9 +3060,7 @@ def _create_single_experiment_copy(source_exp, new_exp_name, exp_group=""):
         new_db_uri = f"postgresql://{user}:{password}@{host}:{port_db}/{new_dbname}"
 
         # Connect to postgres database
-        admin_engine = create_engine(
-            f"postgresql://{user}:{password}@{host}:{port_db}/postgres"
-        )
+        admin_engine = _postgres_admin_engine(user, password, host, port_db)
 
         # Check if database already exists
         with admin_engine.connect() as conn:
@@ -3097,51 +3078,8 @@ def _create_single_experiment_copy(source_exp, new_exp_name, exp_group=""):
                 conn.execute(text(f'CREATE DATABASE "{new_dbname}"'))
 
             # Connect to the newly created database and apply schema
-            experiment_engine = create_engine(new_db_uri)
-            with experiment_engine.connect() as conn:
-                # Load schema from SQL file
-                schema_path = get_resource_path(
-                    os.path.join("data_schema", "postgre_server.sql")
-                )
-                with open(schema_path, "r") as schema_file:
-                    schema_sql = schema_file.read()
-                    conn.execute(text(schema_sql))
-
-                # Insert initial admin user
-                hashed_pw = generate_password_hash("admin", method="pbkdf2:sha256")
-
-                stmt = text("""
-                    INSERT INTO user_mgmt (username, email, password, user_type, leaning, age,
-                                           language, owner, joined_on, frecsys_type,
-                                           round_actions, toxicity, is_page, daily_activity_level, cover_image)
-                    VALUES (:username, :email, :password, :user_type, :leaning, :age,
-                            :language, :owner, :joined_on, :frecsys_type,
-                            :round_actions, :toxicity, :is_page, :daily_activity_level, :cover_image)
-                    """)
-                conn.execute(
-                    stmt,
-                    {
-                        "username": "Admin",
-                        "email": "admin@y-not.social",
-                        "password": hashed_pw,
-                        "user_type": "user",
-                        "leaning": "none",
-                        "age": 0,
-                        "language": "en",
-                        "owner": "admin",
-                        "joined_on": 0,
-                        "frecsys_type": "default",
-                        "round_actions": 3,
-                        "toxicity": "none",
-                        "is_page": 0,
-                        "daily_activity_level": 1,
-                        "cover_image": random_cover_image_url(),
-                    },
-                )
-
-            experiment_engine.dispose()
-
-        admin_engine.dispose()
+            experiment_engine = create_engine(new_db_uri, poolclass=NullPool)
+            _bootstrap_postgresql_experiment_db(experiment_engine)
 
     from y_web.src.experiment.schema import ensure_experiment_schema_for_uri
 
@@ -94,9 +94,10 @@ from y_web.src.simulation.execution_backend import (
     stop_server_for_experiment,
 )
 from y_web.src.system.desktop_file_handler import send_file_desktop
-from y_web.src.system.jupyter_utils import stop_process
+from y_web.src.system.jupyter_utils import pids_running, stop_process
 from y_web.src.system.miscellanea import (
     check_privileges,
+    current_admin,
     llm_backend_status,
     ollama_status,
     reload_current_user,
@@ -122,6 +123,7 @@ from ._blueprint import (
 )
 from ._helpers import *  # noqa: F401,F403
 from ._helpers import (
+    _apply_sort,
     _current_admin_user_or_none,
     _experiment_configuration_box_present,
     _experiment_configuration_update_required,
@@ -134,12 +136,57 @@ from ._helpers import (
     _normalize_embedding_service,
     _normalize_forum_embedding_host,
     _normalize_forum_embedding_service,
+    _paginate_columns_with_total,
     _read_forum_feed_health,
     default_stress_reward_config,
     normalize_stress_reward_config,
     sync_stress_reward_client_config,
 )
 
+# experiments_data table column ids -> Exps columns they sort by
+_EXPERIMENT_SORT_COLUMNS = {
+    "exp_name": Exps.exp_name,
+    "owner": Exps.owner,
+    "platform_type": Exps.platform_type,
+    "exp_descr": Exps.exp_descr,
+    "annotations": Exps.annotations,
+    "running": Exps.running,
+    "web": Exps.status,  # web interface status
+    "exp_status": Exps.exp_status,
+}
+
+# lookup table endpoints: sort name -> column (first entry is the default)
+_LANGUAGE_SORT_COLUMNS = {
+    "language": Languages.language,
+}
+_LEANING_SORT_COLUMNS = {
+    "leaning": Leanings.leaning,
+}
+_NATIONALITY_SORT_COLUMNS = {
+    "nationality": Nationalities.nationality,
+}
+_PROFESSION_SORT_COLUMNS = {
+    "profession": Profession.profession,
+    "background": Profession.background,
+}
+_EDUCATION_SORT_COLUMNS = {
+    "education_level": Education.education_level,
+}
+_TOPIC_SORT_COLUMNS = {
+    "name": Topic_List.name,
+}
+_TOXICITY_LEVEL_SORT_COLUMNS = {
+    "toxicity_level": Toxicity_Levels.toxicity_level,
+}
+_AGE_CLASS_SORT_COLUMNS = {
+    "name": AgeClass.name,
+    "age_start": AgeClass.age_start,
+    "age_end": AgeClass.age_end,
+}
+_ACTIVITY_PROFILE_SORT_COLUMNS = {
+    "name": ActivityProfile.name,
+}
+
 
 def _sync_detoxify_download_notification(admin_user, state):
     notification_id = state.get("notification_id")
@@ -235,7 +282,7 @@ def experiments_data():
         Rendered experiments list template
     """
     # Get current user
-    user = Admin_users.query.filter_by(username=current_user.username).first()
+    user = current_admin()
 
     # Filter experiments based on role + visibility grants
     if user.role in ("admin", "researcher"):
@@ -262,28 +309,16 @@ def experiments_data():
     # sorting
     sort = request.args.get("sort")
     if sort:
-        order = []
-        # Map column IDs to actual database field names
-        column_mapping = {
-            "exp_name": "exp_name",
-            "owner": "owner",
-            "platform_type": "platform_type",
-            "exp_descr": "exp_descr",
-            "annotations": "annotations",
-            "running": "running",
-            "web": "status",  # web interface status
-            "exp_status": "exp_status",
-        }
-        for s in sort.split(","):
-            direction = s[0]
-            name = s[1:]
-            # Only sort by columns that have database fields
-            if name in column_mapping:
-                db_field = column_mapping[name]
-                col = getattr(Exps, db_field)
-                if direction == "-":
-                    col = col.desc()
-                order.append(col)
+        # Only sort by columns that have database fields
+        order = [
+            (
+                _EXPERIMENT_SORT_COLUMNS[s[1:]].desc()
+                if s[0] == "-"
+                else _EXPERIMENT_SORT_COLUMNS[s[1:]]
+            )
+            for s in sort.split(",")
+            if s[1:] in _EXPERIMENT_SORT_COLUMNS
+        ]
         if order:
             query = query.order_by(*order)
 
@@ -296,23 +331,31 @@ def experiments_data():
     # response
     res = query.all()
 
-    # Get JupyterLab status for each experiment
-    import psutil
+    exp_ids = [exp.idexp for exp in res]
 
+    # Get JupyterLab status for each experiment on the page (pid checks are
+    # shared across requests for a couple of seconds)
     jupyter_status = {}
-    jupyter_instances = Jupyter_instances.query.all()
+    jupyter_instances = []
+    if exp_ids:
+        jupyter_instances = (
+            db.session.query(Jupyter_instances.exp_id, Jupyter_instances.process)
+            .filter(Jupyter_instances.exp_id.in_(exp_ids))
+            .all()
+        )
+    jupyter_pids = {}
     for jupyter in jupyter_instances:
-        is_running = False
-        if jupyter.process is not None:
-            try:
-                proc = psutil.Process(int(jupyter.process))
-                if proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE:
-                    is_running = True
-            except (psutil.NoSuchProcess, ValueError, TypeError):
-                pass
-        jupyter_status[jupyter.exp_id] = is_running
+        try:
+            pid = int(jupyter.process) if jupyter.process is not None else None
+        except (ValueError, TypeError):
+            pid = None
+        jupyter_pids[jupyter.exp_id] = pid
+    pid_running = pids_running(
+        [pid for pid in jupyter_pids.values() if pid is not None]
+    )
+    for exp_id, pid in jupyter_pids.items():
+        jupyter_status[exp_id] = pid_running.get(pid, False)
 
-    exp_ids = [exp.idexp for exp in res]
     clients_by_exp = defaultdict(list)
     client_ids = []
     if exp_ids:
@@ -380,12 +423,12 @@ def experiment_clients(exp_id):
     """
     try:
         # Get experiment
-        experiment = Exps.query.filter_by(idexp=exp_id).first()
+        experiment = db.session.get(Exps, exp_id)
         if not experiment:
             return jsonify({"error": "Experiment not found"}), 404
 
         # Check user permissions
-        user = Admin_users.query.filter_by(username=current_user.username).first()
+        user = current_admin()
         if not user_can_view_experiment(user, experiment):
             return jsonify({"error": "Access denied"}), 403
 
@@ -508,7 +551,7 @@ def experiment_details(uid):
     check_privileges(current_user.username)
 
     # get experiment details
-    experiment = Exps.query.filter_by(idexp=uid).first()
+    experiment = db.session.get(Exps, uid)
     admin_user = _current_admin_user_or_none()
     if not user_can_view_experiment(admin_user, experiment):
         flash("You are not allowed to view this experiment.", "error")
@@ -540,14 +583,27 @@ def experiment_details(uid):
     clients = Client.query.filter_by(id_exp=uid).all()
 
     # get client execution data to check if clients have been run
+    # (one query for all clients; the first row per client wins, as before)
+    executions_by_client = {}
+    if clients:
+        for execution in (
+            Client_Execution.query.filter(
+                Client_Execution.client_id.in_([client.id for client in clients])
+            )
+            .order_by(Client_Execution.id)
+            .all()
+        ):
+            executions_by_client.setdefault(execution.client_id, execution)
     client_executions = {}
     for client in clients:
-        execution = Client_Execution.query.filter_by(client_id=client.id).first()
+        execution = executions_by_client.get(client.id)
         # Client has been run at least once if execution exists and elapsed_time > 0
         client_executions[client.id] = execution and execution.elapsed_time > 0
 
     # HPC reset availability: only stopped experiments that already started once.
-    has_started_once = _experiment_has_started_once(experiment, clients=clients)
+    has_started_once = _experiment_has_started_once(
+        experiment, clients=clients, executions=executions_by_client
+    )
     hpc_reset_available = (
         experiment.simulator_type == "HPC"
         and experiment.running == 0
@@ -776,7 +832,7 @@ def update_experiment_descr(uid):
     """Update a forum experiment description shown to forum agents."""
     check_privileges(current_user.username)
 
-    exp = Exps.query.filter_by(idexp=uid).first()
+    exp = db.session.get(Exps, uid)
     if not exp:
         return jsonify({"success": False, "message": "Experiment not found"}), 404
 
@@ -818,7 +874,7 @@ def update_experiment_config(uid):
     """Update experiment config toggles and persist changes in server/client JSON files."""
     check_privileges(current_user.username)
 
-    exp = Exps.query.filter_by(idexp=uid).first()
+    exp = db.session.get(Exps, uid)
     if not exp:
         flash("Experiment not found.", "error")
         return redirect(url_for("experiments.settings"))
@@ -1183,7 +1239,7 @@ def update_experiment_topics(uid):
     """Update experiment topics in admin DB and persisted server config."""
     check_privileges(current_user.username)
 
-    exp = Exps.query.filter_by(idexp=uid).first()
+    exp = db.session.get(Exps, uid)
     if not exp:
         flash("Experiment not found.", "error")
         return redirect(url_for("experiments.settings"))
@@ -1252,7 +1308,7 @@ def reset_hpc_experiment(uid):
     """Reset stopped HPC experiment state to initial conditions."""
     check_privileges(current_user.username)
 
-    exp = Exps.query.filter_by(idexp=uid).first()
+    exp = db.session.get(Exps, uid)
     if not exp:
         flash("Experiment not found.", "error")
         return redirect(url_for("experiments.settings"))
@@ -1395,7 +1451,7 @@ def submit_experiment_logs(exp_id):
     from y_web.src.telemetry import Telemetry
 
     # Get experiment details
-    experiment = Exps.query.filter_by(idexp=exp_id).first()
+    experiment = db.session.get(Exps, exp_id)
     if not experiment:
         return jsonify({"success": False, "message": "Experiment not found"}), 404
 
@@ -1449,7 +1505,7 @@ def experiment_logs(exp_id):
         check_privileges(current_user.username)
 
         # Get experiment details
-        experiment = Exps.query.filter_by(idexp=exp_id).first()
+        experiment = db.session.get(Exps, exp_id)
         if not experiment:
             return jsonify({"error": "Experiment not found"}), 404
 
@@ -1555,7 +1611,7 @@ def experiment_trends(exp_id):
         check_privileges(current_user.username)
 
         # Get experiment details
-        experiment = Exps.query.filter_by(idexp=exp_id).first()
+        experiment = db.session.get(Exps, exp_id)
         if not experiment:
             return jsonify({"error": "Experiment not found"}), 404
 
@@ -1823,12 +1879,12 @@ def client_logs(client_id):
         check_privileges(current_user.username)
 
         # Get client details
-        client = Client.query.filter_by(id=client_id).first()
+        client = db.session.get(Client, client_id)
         if not client:
             return jsonify({"error": "Client not found"}), 404
 
         # Get experiment details
-        experiment = Exps.query.filter_by(idexp=client.id_exp).first()
+        experiment = db.session.get(Exps, client.id_exp)
         if not experiment:
             return jsonify({"error": "Experiment not found"}), 404
 
@@ -1949,7 +2005,7 @@ def miscellanea():
     from y_web.src.llm.vllm_manager import get_llm_models
 
     # Check if user is admin (researchers should not access this page)
-    user = Admin_users.query.filter_by(username=current_user.username).first()
+    user = current_admin()
     if user.role != "admin":
         flash("Access denied. This page is only accessible to administrators.", "error")
         return redirect(url_for("admin.dashboard"))
@@ -2004,7 +2060,7 @@ def miscellanea():
 @experiments.route("/admin/detoxify_download/status", methods=["GET"])
 @login_required
 def detoxify_download_status():
-    user = Admin_users.query.filter_by(username=current_user.username).first()
+    user = current_admin()
     if user.role != "admin":
         return jsonify({"error": "Access denied"}), 403
 
@@ -2017,7 +2073,7 @@ def detoxify_download_status():
 @experiments.route("/admin/detoxify_download/start", methods=["POST"])
 @login_required
 def detoxify_download_start():
-    user = Admin_users.query.filter_by(username=current_user.username).first()
+    user = current_admin()
     if user.role != "admin":
         return jsonify({"error": "Access denied"}), 403
 
@@ -2068,45 +2124,20 @@ def languages_data():
     search = request.args.get("search")
     if search:
         query = query.filter(db.or_(Languages.language.like(f"%{search}%")))
-    total = query.count()
 
     # sorting
-    sort = request.args.get("sort")
-    if sort:
-        order = []
-        for s in sort.split(","):
-            direction = s[0]
-            name = s[1:]
-            if name not in ["language"]:
-                name = "language"
-            col = getattr(Languages, name)
-            if direction == "-":
-                col = col.desc()
-            order.append(col)
-        if order:
-            query = query.order_by(*order)
+    query = _apply_sort(query, request.args.get("sort"), _LANGUAGE_SORT_COLUMNS)
 
     # pagination
     start = request.args.get("start", type=int, default=-1)
     length = request.args.get("length", type=int, default=-1)
-    if start != -1 and length != -1:
-        query = query.offset(start).limit(length)
-
-    # response
-    res = query.all()
 
-    res = {
-        "data": [
-            {
-                "id": exp.id,
-                "language": exp.language,
-            }
-            for exp in res
-        ],
-        "total": total,
-    }
+    # response (the page and the filtered total come from one query)
+    rows, total = _paginate_columns_with_total(
+        query, (Languages.id, Languages.language), start, length
+    )
 
-    return res
+    return {"data": rows, "total": total}
 
 
 @experiments.route("/admin/leanings_data")
@@ -2119,45 +2150,20 @@ def leanings_data():
     search = request.args.get("search")
     if search:
         query = query.filter(db.or_(Leanings.leaning.like(f"%{search}%")))
-    total = query.count()
 
     # sorting
-    sort = request.args.get("sort")
-    if sort:
-        order = []
-        for s in sort.split(","):
-            direction = s[0]
-            name = s[1:]
-            if name not in ["leaning"]:
-                name = "leaning"
-            col = getattr(Leanings, name)
-            if direction == "-":
-                col = col.desc()
-            order.append(col)
-        if order:
-            query = query.order_by(*order)
+    query = _apply_sort(query, request.args.get("sort"), _LEANING_SORT_COLUMNS)
 
     # pagination
     start = request.args.get("start", type=int, default=-1)
     length = request.args.get("length", type=int, default=-1)
-    if start != -1 and length != -1:
-        query = query.offset(start).limit(length)
-
-    # response
-    res = query.all()
 
-    res = {
-        "data": [
-            {
-                "id": exp.id,
-                "leaning": exp.leaning,
-            }
-            for exp in res
-        ],
-        "total": total,
-    }
+    # response (the page and the filtered total come from one query)
+    rows, total = _paginate_columns_with_total(
+        query, (Leanings.id, Leanings.leaning), start, length
+    )
 
-    return res
+    return {"data": rows, "total": total}
 
 
 @experiments.route("/admin/nationalities_data")
@@ -2170,45 +2176,20 @@ def nationalities_data():
     search = request.args.get("search")
     if search:
         query = query.filter(db.or_(Nationalities.nationality.like(f"%{search}%")))
-    total = query.count()
 
     # sorting
-    sort = request.args.get("sort")
-    if sort:
-        order = []
-        for s in sort.split(","):
-            direction = s[0]
-            name = s[1:]
-            if name not in ["nationality"]:
-                name = "nationality"
-            col = getattr(Nationalities, name)
-            if direction == "-":
-                col = col.desc()
-            order.append(col)
-        if order:
-            query = query.order_by(*order)
+    query = _apply_sort(query, request.args.get("sort"), _NATIONALITY_SORT_COLUMNS)
 
     # pagination
     start = request.args.get("start", type=int, default=-1)
     length = request.args.get("length", type=int, default=-1)
-    if start != -1 and length != -1:
-        query = query.offset(start).limit(length)
 
-    # response
-    res = query.all()
-
-    res = {
-        "data": [
-            {
-                "id": exp.id,
-                "nationality": exp.nationality,
-            }
-            for exp in res
-        ],
-        "total": total,
-    }
+    # response (the page and the filtered total come from one query)
+    rows, total = _paginate_columns_with_total(
+        query, (Nationalities.id, Nationalities.nationality), start, length
+    )
 
-    return res
+    return {"data": rows, "total": total}
 
 
 @experiments.route("/admin/professions_data")
@@ -2220,46 +2201,23 @@ def professions_data():
     search = request.args.get("search")
     if search:
         query = query.filter(db.or_(Profession.profession.like(f"%{search}%")))
-    total = query.count()
 
     # sorting
-    sort = request.args.get("sort")
-    if sort:
-        order = []
-        for s in sort.split(","):
-            direction = s[0]
-            name = s[1:]
-            if name not in ["profession", "background"]:
-                name = "profession"
-            col = getattr(Profession, name)
-            if direction == "-":
-                col = col.desc()
-            order.append(col)
-        if order:
-            query = query.order_by(*order)
+    query = _apply_sort(query, request.args.get("sort"), _PROFESSION_SORT_COLUMNS)
 
     # pagination
     start = request.args.get("start", type=int, default=-1)
     length = request.args.get("length", type=int, default=-1)
-    if start != -1 and length != -1:
-        query = query.offset(start).limit(length)
-
-    # response
-    res = query.all()
 
-    res = {
-        "data": [
-            {
-                "id": exp.id,
-                "profession": exp.profession,
-                "background": exp.background,
-            }
-            for exp in res
-        ],
-        "total": total,
-    }
+    # response (the page and the filtered total come from one query)
+    rows, total = _paginate_columns_with_total(
+        query,
+        (Profession.id, Profession.profession, Profession.background),
+        start,
+        length,
+    )
 
-    return res
+    return {"data": rows, "total": total}
 
 
 @experiments.route("/admin/educations_data")
@@ -2271,45 +2229,50 @@ def educations_data():
     search = request.args.get("search")
     if search:
         query = query.filter(db.or_(Education.education_level.like(f"%{search}%")))
-    total = query.count()
 
     # sorting
-    sort = request.args.get("sort")
-    if sort:
-        order = []
-        for s in sort.split(","):
-            direction = s[0]
-            name = s[1:]
-            if name not in ["education_level"]:
-                name = "education_level"
-            col = getattr(Education, name)
-            if direction == "-":
-                col = col.desc()
-            order.append(col)
-        if order:
-            query = query.order_by(*order)
+    query = _apply_sort(query, request.args.get("sort"), _EDUCATION_SORT_COLUMNS)
 
     # pagination
     start = request.args.get("start", type=int, default=-1)
     length = request.args.get("length", type=int, default=-1)
-    if start != -1 and length != -1:
-        query = query.offset(start).limit(length)
 
-    # response
-    res = query.all()
+    # response (the page and the filtered total come from one query)
+    rows, total = _paginate_columns_with_total(
+        query, (Education.id, Education.education_level), start, length
+    )
 
-    res = {
-        "data": [
-            {
-                "id": exp.id,
-                "education_level": exp.education_level,
-            }
-            for exp in res
-        ],
-        "total": total,
-    }
+    return {"data": rows, "total": total}
+
+
+# The lookup-table create handlers only stage their insert; the after_request
+# hook below ends the request with a single commit, or a rollback when the
+# response is an error.
+_COMMIT_AT_END_ENDPOINTS = frozenset(
+    f"experiments.{name}"
+    for name in (
+        "create_language",
+        "create_leaning",
+        "create_nationality",
+        "create_profession",
+        "create_education",
+        "create_topic",
+        "create_toxicity_level",
+        "create_age_class",
+        "create_activity_profile",
+    )
+)
 
-    return res
+
+@experiments.after_request
+def _commit_staged_lookup_inserts(response):
+    """Commit (or roll back) the inserts staged by the create handlers."""
+    if request.endpoint in _COMMIT_AT_END_ENDPOINTS:
+        if response.status_code < 400:
+            db.session.commit()
+        else:
+            db.session.rollback()
+    return response
 
 
 @experiments.route("/admin/create_language", methods=["POST"])
@@ -2322,7 +2285,6 @@ def create_language():
 
     lang = Languages(language=language)
     db.session.add(lang)
-    db.session.commit()
 
     return redirect(request.referrer)
 
@@ -2337,7 +2299,6 @@ def create_leaning():
 
     lean = Leanings(leaning=leaning)
     db.session.add(lean)
-    db.session.commit()
 
     return redirect(request.referrer)
 
@@ -2352,7 +2313,6 @@ def create_nationality():
     nat = Nationalities(nationality=nationality)
 
     db.session.add(nat)
-    db.session.commit()
 
     return redirect(request.referrer)
 
@@ -2368,7 +2328,6 @@ def create_profession():
 
     prof = Profession(profession=profession, background=background)
     db.session.add(prof)
-    db.session.commit()
 
     return redirect(request.referrer)
 
@@ -2383,7 +2342,6 @@ def create_education():
 
     ed = Education(education_level=education_level)
     db.session.add(ed)
-    db.session.commit()
 
     return redirect(request.referrer)
 
@@ -2404,7 +2362,6 @@ def create_topic():
 
     new_topic = Topic_List(name=topic)
     db.session.add(new_topic)
-    db.session.commit()
 
     return redirect(request.referrer)
 
@@ -2419,43 +2376,20 @@ def topic_data():
     search = request.args.get("search")
     if search:
         query = query.filter(db.or_(Topic_List.name.like(f"%{search}%")))
-    total = query.count()
 
     # sorting
-    sort = request.args.get("sort")
-    if sort:
-        order = []
-        for s in sort.split(","):
-            direction = s[0]
-            name = s[1:]
-            if name not in ["name"]:
-                name = "name"
-            col = getattr(Topic_List, name)
-            if direction == "-":
-                col = col.desc()
-            order.append(col)
-        if order:
-            query = query.order_by(*order)
+    query = _apply_sort(query, request.args.get("sort"), _TOPIC_SORT_COLUMNS)
 
     # pagination
     start = request.args.get("start", type=int, default=-1)
     length = request.args.get("length", type=int, default=-1)
-    if start != -1 and length != -1:
-        query = query.offset(start).limit(length)
 
-    # response
-    res = query.all()
+    # response (the page and the filtered total come from one query)
+    rows, total = _paginate_columns_with_total(
+        query, (Topic_List.id, Topic_List.name), start, length
+    )
 
-    return {
-        "data": [
-            {
-                "id": exp.id,
-                "name": exp.name,
-            }
-            for exp in res
-        ],
-        "total": total,
-    }
+    return {"data": rows, "total": total}
 
 
 @experiments.route("/admin/delete_topic/<int:topic_id>", methods=["DELETE"])
@@ -2464,13 +2398,12 @@ def delete_topic(topic_id):
     """Delete topic."""
     check_privileges(current_user.username)
 
-    topic = Topic_List.query.filter_by(id=topic_id).first()
+    topic = db.session.get(Topic_List, topic_id)
     if not topic:
-        flash("Topic not found.")
-        return miscellanea()
+        return "", 404
     db.session.delete(topic)
     db.session.commit()
-    return miscellanea()
+    return "", 204
 
 
 @experiments.route("/admin/delete_language/<int:language_id>", methods=["DELETE"])
@@ -2479,13 +2412,12 @@ def delete_language(language_id):
     """Delete language."""
     check_privileges(current_user.username)
 
-    language = Languages.query.filter_by(id=language_id).first()
+    language = db.session.get(Languages, language_id)
     if not language:
-        flash("Language not found.")
-        return miscellanea()
+        return "", 404
     db.session.delete(language)
     db.session.commit()
-    return miscellanea()
+    return "", 204
 
 
 @experiments.route("/admin/delete_leaning/<int:leaning_id>", methods=["DELETE"])
@@ -2494,13 +2426,12 @@ def delete_leaning(leaning_id):
     """Delete leaning."""
     check_privileges(current_user.username)
 
-    leaning = Leanings.query.filter_by(id=leaning_id).first()
+    leaning = db.session.get(Leanings, leaning_id)
     if not leaning:
-        flash("Leaning not found.")
-        return miscellanea()
+        return "", 404
     db.session.delete(leaning)
     db.session.commit()
-    return miscellanea()
+    return "", 204
 
 
 @experiments.route("/admin/delete_nationality/<int:nationality_id>", methods=["DELETE"])
@@ -2509,13 +2440,12 @@ def delete_nationality(nationality_id):
     """Delete nationality."""
     check_privileges(current_user.username)
 
-    nationality = Nationalities.query.filter_by(id=nationality_id).first()
+    nationality = db.session.get(Nationalities, nationality_id)
     if not nationality:
-        flash("Nationality not found.")
-        return miscellanea()
+        return "", 404
     db.session.delete(nationality)
     db.session.commit()
-    return miscellanea()
+    return "", 204
 
 
 @experiments.route(
@@ -2526,13 +2456,12 @@ def delete_education_level(education_level_id):
     """Delete education level."""
     check_privileges(current_user.username)
 
-    education_level = Education.query.filter_by(id=education_level_id).first()
+    education_level = db.session.get(Education, education_level_id)
     if not education_level:
-        flash("Education level not found.")
-        return miscellanea()
+        return "", 404
     db.session.delete(education_level)
     db.session.commit()
-    return miscellanea()
+    return "", 204
 
 
 @experiments.route("/admin/delete_profession/<int:profession_id>", methods=["DELETE"])
@@ -2541,13 +2470,12 @@ def delete_profession(profession_id):
     """Delete profession."""
     check_privileges(current_user.username)
 
-    profession = Profession.query.filter_by(id=profession_id).first()
+    profession = db.session.get(Profession, profession_id)
     if not profession:
-        flash("Profession not found.")
-        return miscellanea()
+        return "", 404
     db.session.delete(profession)
     db.session.commit()
-    return miscellanea()
+    return "", 204
 
 
 @experiments.route("/admin/toxicity_levels_data")
@@ -2559,45 +2487,20 @@ def toxicity_levels_data():
     search = request.args.get("search")
     if search:
         query = query.filter(db.or_(Toxicity_Levels.toxicity_level.like(f"%{search}%")))
-    total = query.count()
 
     # sorting
-    sort = request.args.get("sort")
-    if sort:
-        order = []
-        for s in sort.split(","):
-            direction = s[0]
-            name = s[1:]
-            if name not in ["toxicity_level"]:
-                name = "toxicity_level"
-            col = getattr(Toxicity_Levels, name)
-            if direction == "-":
-                col = col.desc()
-            order.append(col)
-        if order:
-            query = query.order_by(*order)
+    query = _apply_sort(query, request.args.get("sort"), _TOXICITY_LEVEL_SORT_COLUMNS)
 
     # pagination
     start = request.args.get("start", type=int, default=-1)
     length = request.args.get("length", type=int, default=-1)
-    if start != -1 and length != -1:
-        query = query.offset(start).limit(length)
-
-    # response
-    res = query.all()
 
-    res = {
-        "data": [
-            {
-                "id": exp.id,
-                "toxicity_level": exp.toxicity_level,
-            }
-            for exp in res
-        ],
-        "total": total,
-    }
+    # response (the page and the filtered total come from one query)
+    rows, total = _paginate_columns_with_total(
+        query, (Toxicity_Levels.id, Toxicity_Levels.toxicity_level), start, length
+    )
 
-    return res
+    return {"data": rows, "total": total}
 
 
 @experiments.route("/admin/create_toxicity_level", methods=["POST"])
@@ -2610,7 +2513,6 @@ def create_toxicity_level():
 
     tox = Toxicity_Levels(toxicity_level=toxicity_level)
     db.session.add(tox)
-    db.session.commit()
 
     return redirect(request.referrer)
 
@@ -2623,13 +2525,12 @@ def delete_toxicity_level(toxicity_level_id):
     """Delete toxicity level."""
     check_privileges(current_user.username)
 
-    toxicity_level = Toxicity_Levels.query.filter_by(id=toxicity_level_id).first()
+    toxicity_level = db.session.get(Toxicity_Levels, toxicity_level_id)
     if not toxicity_level:
-        flash("Toxicity level not found.")
-        return miscellanea()
+        return "", 404
     db.session.delete(toxicity_level)
     db.session.commit()
-    return miscellanea()
+    return "", 204
 
 
 @experiments.route("/admin/age_classes_data", methods=["GET", "POST"])
@@ -2640,7 +2541,7 @@ def age_classes_data():
         # Handle inline edit
         data = request.get_json()
         age_class_id = data.get("id")
-        age_class = AgeClass.query.filter_by(id=age_class_id).first()
+        age_class = db.session.get(AgeClass, age_class_id)
         if age_class:
             try:
                 if "name" in data:
@@ -2661,47 +2562,23 @@ def age_classes_data():
     search = request.args.get("search")
     if search:
         query = query.filter(db.or_(AgeClass.name.like(f"%{search}%")))
-    total = query.count()
 
     # sorting
-    sort = request.args.get("sort")
-    if sort:
-        order = []
-        for s in sort.split(","):
-            direction = s[0]
-            name = s[1:]
-            if name not in ["name", "age_start", "age_end"]:
-                name = "name"
-            col = getattr(AgeClass, name)
-            if direction == "-":
-                col = col.desc()
-            order.append(col)
-        if order:
-            query = query.order_by(*order)
+    query = _apply_sort(query, request.args.get("sort"), _AGE_CLASS_SORT_COLUMNS)
 
     # pagination
     start = request.args.get("start", type=int, default=-1)
     length = request.args.get("length", type=int, default=-1)
-    if start != -1 and length != -1:
-        query = query.offset(start).limit(length)
 
-    # response
-    res = query.all()
-
-    res = {
-        "data": [
-            {
-                "id": ac.id,
-                "name": ac.name,
-                "age_start": ac.age_start,
-                "age_end": ac.age_end,
-            }
-            for ac in res
-        ],
-        "total": total,
-    }
+    # response (the page and the filtered total come from one query)
+    rows, total = _paginate_columns_with_total(
+        query,
+        (AgeClass.id, AgeClass.name, AgeClass.age_start, AgeClass.age_end),
+        start,
+        length,
+    )
 
-    return res
+    return {"data": rows, "total": total}
 
 
 @experiments.route("/admin/create_age_class", methods=["POST"])
@@ -2724,7 +2601,6 @@ def create_age_class():
         age_end=age_end,
     )
     db.session.add(age_class)
-    db.session.commit()
 
     return miscellanea()
 
@@ -2735,13 +2611,12 @@ def delete_age_class(age_class_id):
     """Delete age class."""
     check_privileges(current_user.username)
 
-    age_class = AgeClass.query.filter_by(id=age_class_id).first()
+    age_class = db.session.get(AgeClass, age_class_id)
     if not age_class:
-        flash("Age class not found.")
-        return miscellanea()
+        return "", 404
     db.session.delete(age_class)
     db.session.commit()
-    return miscellanea()
+    return "", 204
 
 
 @experiments.route("/admin/activity_profiles_data", methods=["GET", "POST"])
@@ -2752,7 +2627,7 @@ def activity_profiles_data():
         # Handle inline edit
         data = request.get_json()
         profile_id = data.get("id")
-        profile = ActivityProfile.query.filter_by(id=profile_id).first()
+        profile = db.session.get(ActivityProfile, profile_id)
         if profile:
             if "name" in data:
                 profile.name = data["name"]
@@ -2764,46 +2639,23 @@ def activity_profiles_data():
     search = request.args.get("search")
     if search:
         query = query.filter(db.or_(ActivityProfile.name.like(f"%{search}%")))
-    total = query.count()
 
     # sorting
-    sort = request.args.get("sort")
-    if sort:
-        order = []
-        for s in sort.split(","):
-            direction = s[0]
-            name = s[1:]
-            if name not in ["name"]:
-                name = "name"
-            col = getattr(ActivityProfile, name)
-            if direction == "-":
-                col = col.desc()
-            order.append(col)
-        if order:
-            query = query.order_by(*order)
+    query = _apply_sort(query, request.args.get("sort"), _ACTIVITY_PROFILE_SORT_COLUMNS)
 
     # pagination
     start = request.args.get("start", type=int, default=-1)
     length = request.args.get("length", type=int, default=-1)
-    if start != -1 and length != -1:
-        query = query.offset(start).limit(length)
 
-    # response
-    res = query.all()
-
-    res = {
-        "data": [
-            {
-                "id": profile.id,
-                "name": profile.name,
-                "hours": profile.hours,
-            }
-            for profile in res
-        ],
-        "total": total,
-    }
+    # response (the page and the filtered total come from one query)
+    rows, total = _paginate_columns_with_total(
+        query,
+        (ActivityProfile.id, ActivityProfile.name, ActivityProfile.hours),
+        start,
+        length,
+    )
 
-    return res
+    return {"data": rows, "total": total}
 
 
 @experiments.route("/admin/create_activity_profile", methods=["POST"])
@@ -2827,7 +2679,6 @@ def create_activity_profile():
 
     profile = ActivityProfile(name=name, hours=hours)
     db.session.add(profile)
-    db.session.commit()
 
     return redirect(request.referrer)
 
@@ -2840,10 +2691,9 @@ def delete_activity_profile(profile_id):
     """Delete activity profile."""
     check_privileges(current_user.username)
 
-    profile = ActivityProfile.query.filter_by(id=profile_id).first()
+    profile = db.session.get(ActivityProfile, profile_id)
     if not profile:
-        flash("Activity profile not found.")
-        return miscellanea()
+        return "", 404
     db.session.delete(profile)
     db.session.commit()
-    return miscellanea()
+    return "", 204
@@ -28,8 +28,8 @@ from y_web.src.external_runtime import (
     update_runtime_repo,
     validate_runtime_repo,
 )
-from y_web.src.models import Admin_users, Exps
-from y_web.src.system.miscellanea import check_privileges
+from y_web.src.models import Exps
+from y_web.src.system.miscellanea import check_privileges, current_admin
 
 from ._blueprint import experiments
 
@@ -48,7 +48,7 @@ _GITHUB_TOKEN_SESSION_KEY = "external_runtime_github_token"
 
 def _require_admin_user():
     check_privileges(current_user.username)
-    admin_user = Admin_users.query.filter_by(username=current_user.username).first()
+    admin_user = current_admin()
     if admin_user is None or admin_user.role != "admin":
         flash("Only administrators can manage external runtime repositories.", "error")
         return None
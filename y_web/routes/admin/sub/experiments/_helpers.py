@@ -19,6 +19,7 @@ import uuid
 from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime, timedelta
+from functools import lru_cache
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote, urlparse
 from urllib.request import Request, urlopen
@@ -35,6 +36,7 @@ from flask import (
     url_for,
 )
 from flask_login import current_user, login_required, login_user
+from sqlalchemy import create_engine, func
 
 from y_web import db  # , app
 from y_web.src.content.avatars import normalize_forum_avatar_mode
@@ -96,6 +98,7 @@ from y_web.src.system.desktop_file_handler import send_file_desktop
 from y_web.src.system.jupyter_utils import stop_process
 from y_web.src.system.miscellanea import (
     check_privileges,
+    current_admin,
     llm_backend_status,
     ollama_status,
     reload_current_user,
@@ -217,10 +220,38 @@ def sync_stress_reward_client_config(client_config, stress_reward_config):
 
 
 def _get_database_type():
-    """Get active admin database backend type."""
-    if current_app.config["SQLALCHEMY_DATABASE_URI"].startswith("postgresql"):
-        return "postgresql"
-    return "sqlite"
+    """Get active admin database backend type (cached in the app config)."""
+    db_type = current_app.config.get("DB_TYPE")
+    if db_type is None:
+        uri = current_app.config["SQLALCHEMY_DATABASE_URI"]
+        db_type = "postgresql" if uri.startswith("postgresql") else "sqlite"
+        current_app.config["DB_TYPE"] = db_type
+    return db_type
+
+
+@lru_cache(maxsize=8)
+def _parse_database_uri(uri):
+    """Parse a database URI once and reuse the result across requests."""
+    return urlparse(uri)
+
+
+_postgres_admin_engines = {}
+
+
+def _postgres_admin_engine(user, password, host, port):
+    """
+    Return a pooled engine on the server's ``postgres`` maintenance database.
+
+    Engines are cached per connection URI so creating, copying and dropping
+    experiment databases reuse open connections instead of reconnecting.
+    """
+    uri = f"postgresql://{user}:{password}@{host}:{port}/postgres"
+    engine = _postgres_admin_engines.get(uri)
+    if engine is None:
+        engine = _postgres_admin_engines.setdefault(
+            uri, create_engine(uri, pool_size=2, pool_pre_ping=True)
+        )
+    return engine
 
 
 def _get_experiment_folder(base_dir, experiment, db_type):
@@ -514,9 +545,106 @@ def _sanitize_filename(name, fallback):
     return safe_name or fallback
 
 
+def _stop_running_clients(exp, clients):
+    """
+    Stop the running clients of *exp* and persist their statuses in one commit.
+
+    HPC clients whose stop cannot be confirmed stay marked as running.
+
+    Args:
+        exp: Experiment the clients belong to
+        clients: Client rows of the experiment
+
+    Returns:
+        True if every running client was stopped, False otherwise
+    """
+    all_stopped = True
+    try:
+        for client in clients:
+            if client.status != 1:
+                continue
+            stop_result = True
+            if client.pid or exp.simulator_type == "HPC":
+                print(
+                    f"Stopping client {client.name} (ID: {client.id}, PID: {client.pid}) for experiment {exp.idexp}"
+                )
+                stop_result = stop_client_for_experiment(exp, client, pause=False)
+            if exp.simulator_type == "HPC" and stop_result is False:
+                all_stopped = False
+            else:
+                client.status = 0
+    finally:
+        # Statuses of clients already stopped are kept even if a later stop fails
+        db.session.commit()
+    return all_stopped
+
+
+def _row_exists(query):
+    """Return True if *query* matches any row, via ``SELECT EXISTS`` (no row load)."""
+    return db.session.query(query.exists()).scalar()
+
+
+def _apply_sort(query, sort, columns):
+    """
+    Order a table endpoint query by its ``sort`` request argument.
+
+    ``sort`` is a comma separated list of ``+column`` / ``-column`` entries.
+    Names missing from ``columns`` sort by its first (default) column.
+
+    Args:
+        query: Query to order
+        sort: Raw ``sort`` argument, may be None or empty
+        columns: Module-level ``{sort name: column}`` map, default first
+    """
+    if not sort:
+        return query
+    default = next(iter(columns.values()))
+    order = []
+    for s in sort.split(","):
+        col = columns.get(s[1:], default)
+        order.append(col.desc() if s[0] == "-" else col)
+    return query.order_by(*order)
+
+
+def _paginate_columns_with_total(query, columns, start, length):
+    """
+    Return ``(rows, total)`` for a table endpoint page as plain dicts.
+
+    Only ``columns`` are selected and each row is returned as a
+    ``{column key: value}`` dict, so no ORM instances are built for rows
+    that are only serialized to JSON. When a page window is requested the
+    filtered total is read from a ``COUNT(*) OVER ()`` column of the page
+    query itself, so one statement replaces the separate ``count()``. A page
+    past the end has no row to carry the total, so only then is ``count()``
+    issued.
+
+    Args:
+        query: Filtered (and optionally ordered) single-entity query
+        columns: Model attributes to return, keyed by attribute name
+        start: Offset of the page, -1 for all rows
+        length: Page size, -1 for all rows
+    """
+    query = query.with_entities(*columns)
+    if start == -1 or length == -1:
+        rows = [dict(row._mapping) for row in query]
+        return rows, len(rows)
+
+    page = (
+        query.add_columns(func.count().over().label("_total"))
+        .offset(start)
+        .limit(length)
+        .all()
+    )
+    if not page:
+        return [], query.count()
+    width = len(columns)
+    keys = page[0]._fields[:width]
+    return [dict(zip(keys, row[:width])) for row in page], page[0][width]
+
+
 def _current_admin_user():
-    """Resolve current authenticated admin user record."""
-    return Admin_users.query.filter_by(username=current_user.username).first()
+    """Resolve current authenticated admin user record (memoized per request)."""
+    return current_admin()
 
 
 def _current_admin_user_or_none():
@@ -535,8 +663,13 @@ def _notifications_temp_data_dir():
     return os.path.join(base_dir, f"y_web{os.sep}experiments{os.sep}temp_data")
 
 
-def _experiment_has_started_once(experiment, clients=None):
-    """Best-effort started-once detection that also works for legacy experiments."""
+def _experiment_has_started_once(experiment, clients=None, executions=None):
+    """
+    Best-effort started-once detection that also works for legacy experiments.
+
+    ``executions`` optionally maps client ids to their Client_Execution row so
+    callers that already loaded them avoid one query per client.
+    """
     if not experiment:
         return False
 
@@ -554,7 +687,10 @@ def _experiment_has_started_once(experiment, clients=None):
         clients = Client.query.filter_by(id_exp=experiment.idexp).all()
 
     for client in clients:
-        ce = Client_Execution.query.filter_by(client_id=client.id).first()
+        if executions is not None:
+            ce = executions.get(client.id)
+        else:
+            ce = Client_Execution.query.filter_by(client_id=client.id).first()
         if not ce:
             continue
         if (ce.elapsed_time or 0) > 0:
@@ -608,7 +744,7 @@ def _load_forum_experiment_context(uid, require_manage=True):
     """Load a forum experiment and its writable directory."""
     check_privileges(current_user.username)
 
-    experiment = Exps.query.filter_by(idexp=uid).first()
+    experiment = db.session.get(Exps, uid)
     if not experiment:
         flash("Experiment not found", "error")
         return None, None, redirect(url_for("experiments.settings"))
@@ -647,7 +783,7 @@ def _load_memory_capable_experiment_context(uid, require_manage=True):
     """Load a memory-capable experiment and its writable directory."""
     check_privileges(current_user.username)
 
-    experiment = Exps.query.filter_by(idexp=uid).first()
+    experiment = db.session.get(Exps, uid)
     if not experiment:
         flash("Experiment not found", "error")
         return None, None, redirect(url_for("experiments.settings"))
@@ -678,7 +814,7 @@ def _load_stress_reward_experiment_context(uid, require_manage=True):
     """Load a stress/reward-enabled experiment and its directory."""
     check_privileges(current_user.username)
 
-    experiment = Exps.query.filter_by(idexp=uid).first()
+    experiment = db.session.get(Exps, uid)
     if not experiment:
         flash("Experiment not found", "error")
         return None, None, redirect(url_for("experiments.settings"))
@@ -200,7 +200,7 @@ def update_remote_server(exp_id):
             return jsonify({"success": False, "message": "Invalid port number"})
 
         # Get experiment
-        exp = Exps.query.filter_by(idexp=exp_id).first()
+        exp = db.session.get(Exps, exp_id)
         if not exp:
             return jsonify({"success": False, "message": "Experiment not found"})
 
@@ -16,6 +16,7 @@ import socket
 import threading
 import time
 import uuid
+import zipfile
 from collections import defaultdict
 from datetime import datetime, timedelta
 from urllib.error import HTTPError, URLError
@@ -198,7 +199,7 @@ def _build_single_experiment_zip(eid, output_zip_path):
     from y_web.src.system.path_utils import get_writable_path
 
     base_dir = get_writable_path()
-    experiment = Exps.query.filter_by(idexp=eid).first()
+    experiment = db.session.get(Exps, eid)
     if not experiment:
         raise ValueError(f"Experiment {eid} not found")
 
@@ -221,56 +222,79 @@ def _build_single_experiment_zip(eid, output_zip_path):
     return f"{safe_exp_name}.zip"
 
 
+def _zip_folder_into(zf, folder):
+    """Add ``folder``'s tree to ``zf`` with the layout of ``shutil.make_archive``."""
+    for dirpath, dirnames, filenames in os.walk(folder):
+        rel_dir = os.path.relpath(dirpath, folder)
+        for name in sorted(dirnames):
+            zf.write(
+                os.path.join(dirpath, name),
+                os.path.normpath(os.path.join(rel_dir, name)),
+            )
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            if os.path.isfile(path):
+                zf.write(path, os.path.normpath(os.path.join(rel_dir, name)))
+
+
 def _build_bulk_experiments_zip(exp_ids, output_zip_path):
-    """Build a bulk zip containing one zip per experiment."""
+    """
+    Build a bulk zip containing one zip per experiment.
+
+    Each experiment zip is compressed straight into its entry of the bulk
+    archive, so no per-experiment temporary zip is written to disk. The
+    entries are stored, not deflated again, since they are already compressed.
+    """
     from y_web.src.system.path_utils import get_writable_path
 
     base_dir = get_writable_path()
     db_type = _get_database_type()
-    bulk_download_dir = os.path.join(
-        base_dir, f"y_web{os.sep}experiments{os.sep}temp_bulk_{uuid.uuid4().hex}"
+
+    output_base = (
+        output_zip_path[:-4] if output_zip_path.endswith(".zip") else output_zip_path
     )
-    os.makedirs(bulk_download_dir, exist_ok=True)
+    if os.path.exists(f"{output_base}.zip"):
+        os.remove(f"{output_base}.zip")
 
     used_names = set()
     try:
-        for eid in exp_ids:
-            experiment = Exps.query.filter_by(idexp=eid).first()
-            if not experiment:
-                continue
-
-            folder = _get_experiment_folder(base_dir, experiment, db_type)
-            if not os.path.exists(folder):
-                continue
-
-            if db_type == "postgresql":
-                try:
-                    _create_sqlite_copy_for_postgresql(experiment, folder)
-                except Exception as exc:
-                    current_app.logger.error(
-                        f"Error creating SQLite copy for {experiment.exp_name}: {exc}",
-                        exc_info=True,
-                    )
+        with zipfile.ZipFile(f"{output_base}.zip", "w", zipfile.ZIP_STORED) as bulk_zip:
+            for eid in exp_ids:
+                experiment = db.session.get(Exps, eid)
+                if not experiment:
                     continue
 
-            safe_exp_name = _sanitize_filename(experiment.exp_name, f"experiment_{eid}")
-            if safe_exp_name in used_names:
-                safe_exp_name = f"{safe_exp_name}_{eid}"
-            used_names.add(safe_exp_name)
-
-            exp_zip_path = os.path.join(bulk_download_dir, safe_exp_name)
-            shutil.make_archive(exp_zip_path, "zip", folder)
+                folder = _get_experiment_folder(base_dir, experiment, db_type)
+                if not os.path.exists(folder):
+                    continue
 
-        output_base = (
-            output_zip_path[:-4]
-            if output_zip_path.endswith(".zip")
-            else output_zip_path
-        )
+                if db_type == "postgresql":
+                    try:
+                        _create_sqlite_copy_for_postgresql(experiment, folder)
+                    except Exception as exc:
+                        current_app.logger.error(
+                            f"Error creating SQLite copy for {experiment.exp_name}: {exc}",
+                            exc_info=True,
+                        )
+                        continue
+
+                safe_exp_name = _sanitize_filename(
+                    experiment.exp_name, f"experiment_{eid}"
+                )
+                if safe_exp_name in used_names:
+                    safe_exp_name = f"{safe_exp_name}_{eid}"
+                used_names.add(safe_exp_name)
+
+                with bulk_zip.open(
+                    f"{safe_exp_name}.zip", "w", force_zip64=True
+                ) as entry:
+                    with zipfile.ZipFile(entry, "w", zipfile.ZIP_DEFLATED) as exp_zip:
+                        _zip_folder_into(exp_zip, folder)
+    except Exception:
+        # do not leave a truncated archive behind
         if os.path.exists(f"{output_base}.zip"):
             os.remove(f"{output_base}.zip")
-        shutil.make_archive(output_base, "zip", bulk_download_dir)
-    finally:
-        shutil.rmtree(bulk_download_dir, ignore_errors=True)
+        raise
 
     return "experiments.zip"
 
@@ -451,7 +475,7 @@ def download_experiment_file(eid):
     """Queue asynchronous experiment archive generation and notify when ready."""
     check_privileges(current_user.username)
 
-    experiment = Exps.query.filter_by(idexp=eid).first()
+    experiment = db.session.get(Exps, eid)
     if not experiment:
         flash("Experiment not found.", "error")
         return redirect(url_for("experiments.settings"))
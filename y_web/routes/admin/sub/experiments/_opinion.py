@@ -116,10 +116,22 @@ from ._blueprint import (
 )
 from ._helpers import *  # noqa: F401,F403
 from ._helpers import (
+    _apply_sort,
     _current_admin_user_or_none,
     _load_stress_reward_experiment_context,
 )
 
+# opinion table endpoints: sort name -> column (first entry is the default)
+_OPINION_GROUP_SORT_COLUMNS = {
+    "name": OpinionGroup.name,
+    "lower_bound": OpinionGroup.lower_bound,
+    "upper_bound": OpinionGroup.upper_bound,
+}
+_OPINION_DISTRIBUTION_SORT_COLUMNS = {
+    "name": OpinionDistribution.name,
+    "distribution_type": OpinionDistribution.distribution_type,
+}
+
 
 def _resolve_opinion_evolution_topics(expid):
     """Return topic metadata for opinion evolution pages.
@@ -1254,20 +1266,7 @@ def opinion_groups_data():
     total = query.count()
 
     # sorting
-    sort = request.args.get("sort")
-    if sort:
-        order = []
-        for s in sort.split(","):
-            direction = s[0]
-            name = s[1:]
-            if name not in ["name", "lower_bound", "upper_bound"]:
-                name = "name"
-            col = getattr(OpinionGroup, name)
-            if direction == "-":
-                col = col.desc()
-            order.append(col)
-        if order:
-            query = query.order_by(*order)
+    query = _apply_sort(query, request.args.get("sort"), _OPINION_GROUP_SORT_COLUMNS)
 
     # pagination
     start = request.args.get("start", type=int, default=-1)
@@ -1455,20 +1454,9 @@ def opinion_distributions_data():
     total = query.count()
 
     # sorting
-    sort = request.args.get("sort")
-    if sort:
-        order = []
-        for s in sort.split(","):
-            direction = s[0]
-            name = s[1:]
-            if name not in ["name", "distribution_type"]:
-                name = "name"
-            col = getattr(OpinionDistribution, name)
-            if direction == "-":
-                col = col.desc()
-            order.append(col)
-        if order:
-            query = query.order_by(*order)
+    query = _apply_sort(
+        query, request.args.get("sort"), _OPINION_DISTRIBUTION_SORT_COLUMNS
+    )
 
     # pagination
     start = request.args.get("start", type=int, default=-1)
@@ -2571,7 +2559,7 @@ def opinion_evolution(expid):
     check_privileges(current_user.username)
 
     # Get experiment
-    experiment = Exps.query.filter_by(idexp=expid).first()
+    experiment = db.session.get(Exps, expid)
     if not experiment:
         flash("Experiment not found.")
         return redirect("/admin/experiments")
@@ -2877,7 +2865,7 @@ def opinion_evolution_data(expid):
     check_privileges(current_user.username)
 
     # Get experiment
-    experiment = Exps.query.filter_by(idexp=expid).first()
+    experiment = db.session.get(Exps, expid)
     if not experiment:
         return jsonify({"error": "Experiment not found"}), 404
 
@@ -3899,7 +3887,7 @@ def _load_annotation_experiment_context(
     """Load an experiment where a specific annotation is enabled."""
     check_privileges(current_user.username)
 
-    experiment = Exps.query.filter_by(idexp=uid).first()
+    experiment = db.session.get(Exps, uid)
     if not experiment:
         flash("Experiment not found", "error")
         return None, None, redirect(url_for("experiments.settings"))
@@ -3946,7 +3934,7 @@ def _load_network_experiment_context(uid, require_manage=False):
     """Load an experiment for network analytics."""
     check_privileges(current_user.username)
 
-    experiment = Exps.query.filter_by(idexp=uid).first()
+    experiment = db.session.get(Exps, uid)
     if not experiment:
         flash("Experiment not found", "error")
         return None, None, redirect(url_for("experiments.settings"))
@@ -33,6 +33,7 @@ from flask import (
     url_for,
 )
 from flask_login import current_user, login_required, login_user
+from sqlalchemy.exc import IntegrityError
 
 from y_web import db  # , app
 from y_web.migrations.add_hpc_monitor_settings import (
@@ -97,6 +98,7 @@ from y_web.src.system.desktop_file_handler import send_file_desktop
 from y_web.src.system.jupyter_utils import stop_process
 from y_web.src.system.miscellanea import (
     check_privileges,
+    current_admin,
     llm_backend_status,
     ollama_status,
     reload_current_user,
@@ -116,6 +118,28 @@ from ._blueprint import (
     experiments,
 )
 from ._helpers import *  # noqa: F401,F403
+from ._helpers import _stop_running_clients
+
+
+def _next_order_index(column, *criteria):
+    """
+    Build a scalar subquery yielding ``COALESCE(MAX(column), 0) + 1``.
+
+    Assigning the result to a model attribute embeds the lookup in the
+    INSERT statement, so the next order index is read and written in a
+    single round trip.
+
+    Args:
+        column: Order index column to take the maximum of
+        *criteria: Optional filter expressions restricting the scanned rows
+
+    Returns:
+        Scalar subquery usable as a column value
+    """
+    query = db.select(db.func.coalesce(db.func.max(column), 0) + 1)
+    if criteria:
+        query = query.where(*criteria)
+    return query.scalar_subquery()
 
 
 @experiments.route("/admin/schedule/groups", methods=["GET"])
@@ -190,12 +214,11 @@ def create_schedule_group():
     if not data or "name" not in data:
         return jsonify({"success": False, "message": "Name is required"}), 400
 
-    # Get max order index
-    max_order = (
-        db.session.query(db.func.max(ExperimentScheduleGroup.order_index)).scalar() or 0
+    # The next order index is computed inside the INSERT itself
+    group = ExperimentScheduleGroup(
+        name=data["name"],
+        order_index=_next_order_index(ExperimentScheduleGroup.order_index),
     )
-
-    group = ExperimentScheduleGroup(name=data["name"], order_index=max_order + 1)
     db.session.add(group)
     db.session.commit()
 
@@ -278,16 +301,6 @@ def add_experiment_to_group(group_id):
     if not exp:
         return jsonify({"success": False, "message": "Experiment not found"}), 404
 
-    # Check if already in this group
-    existing = ExperimentScheduleItem.query.filter_by(
-        group_id=group_id, experiment_id=data["experiment_id"]
-    ).first()
-    if existing:
-        return (
-            jsonify({"success": False, "message": "Experiment already in group"}),
-            400,
-        )
-
     # HPC experiment validation: keep HPC and Standard experiments separate.
     is_hpc = exp.simulator_type == "HPC"
     hpc_settings = HpcMonitorSettings.query.first()
@@ -361,21 +374,24 @@ def add_experiment_to_group(group_id):
                 400,
             )
 
-    # Get max order index for this group
-    max_order = (
-        db.session.query(db.func.max(ExperimentScheduleItem.order_index))
-        .filter(ExperimentScheduleItem.group_id == group_id)
-        .scalar()
-        or 0
-    )
-
     item = ExperimentScheduleItem(
         group_id=group_id,
         experiment_id=data["experiment_id"],
-        order_index=max_order + 1,
+        order_index=_next_order_index(
+            ExperimentScheduleItem.order_index,
+            ExperimentScheduleItem.group_id == group_id,
+        ),
     )
     db.session.add(item)
-    db.session.commit()
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # uq_sched_item_group_exp: the experiment is already in this group
+        db.session.rollback()
+        return (
+            jsonify({"success": False, "message": "Experiment already in group"}),
+            400,
+        )
 
     return jsonify(
         {
@@ -713,19 +729,9 @@ def stop_schedule():
             exp = Exps.query.get(item.experiment_id)
             if exp and exp.running == 1:
                 # Stop all clients first
-                clients = Client.query.filter_by(id_exp=exp.idexp).all()
-                for client in clients:
-                    if client.status == 1:
-                        stop_result = True
-                        if client.pid or exp.simulator_type == "HPC":
-                            stop_result = stop_client_for_experiment(
-                                exp, client, pause=False
-                            )
-                        if exp.simulator_type == "HPC" and stop_result is False:
-                            client.status = 1
-                        else:
-                            client.status = 0
-                        db.session.commit()
+                _stop_running_clients(
+                    exp, Client.query.filter_by(id_exp=exp.idexp).all()
+                )
 
                 # Stop server
                 stop_server_for_experiment(exp)
@@ -817,19 +823,9 @@ def _do_check_schedule_progress():
                 logs.append(msg)
                 db.session.add(ExperimentScheduleLog(message=msg, log_type="info"))
                 # Stop clients
-                clients = Client.query.filter_by(id_exp=exp.idexp).all()
-                for client in clients:
-                    if client.status == 1:
-                        stop_result = True
-                        if client.pid or exp.simulator_type == "HPC":
-                            stop_result = stop_client_for_experiment(
-                                exp, client, pause=False
-                            )
-                        if exp.simulator_type == "HPC" and stop_result is False:
-                            client.status = 1
-                        else:
-                            client.status = 0
-                        db.session.commit()
+                _stop_running_clients(
+                    exp, Client.query.filter_by(id_exp=exp.idexp).all()
+                )
 
                 # Stop server
                 stop_server_for_experiment(exp)
@@ -991,7 +987,7 @@ def get_available_experiments_for_schedule():
     check_privileges(current_user.username)
 
     # Get current user
-    user = Admin_users.query.filter_by(username=current_user.username).first()
+    user = current_admin()
 
     # Get experiments based on role
     if user.role == "admin":
@@ -1182,7 +1178,7 @@ def auto_create_groups():
     group_filter = data.get("group_filter", None)
 
     # Get current user
-    user = Admin_users.query.filter_by(username=current_user.username).first()
+    user = current_admin()
 
     if user.role == "admin":
         experiments_query = Exps.query
@@ -1246,10 +1242,6 @@ def auto_create_groups():
         db.session.query(db.func.max(ExperimentScheduleGroup.order_index)).scalar() or 0
     )
 
-    # Create groups and assign experiments
-    created_groups = []
-    group_num = 1
-
     # Use the configured HPC grouping size when limited; otherwise honor user input.
     hpc_per_group = (
         max(1, min(max_hpc_per_group, experiments_per_group))
@@ -1257,65 +1249,45 @@ def auto_create_groups():
         else max(1, experiments_per_group)
     )
 
-    # First, create groups for HPC experiments using the requested group size
-    for i in range(0, len(hpc_exps), hpc_per_group):
-        group_hpc_exps = hpc_exps[i : i + hpc_per_group]
+    # HPC batches come first, then Standard batches
+    batches = [
+        (hpc_exps[i : i + hpc_per_group], " (HPC)")
+        for i in range(0, len(hpc_exps), hpc_per_group)
+    ] + [
+        (standard_exps[i : i + experiments_per_group], "")
+        for i in range(0, len(standard_exps), experiments_per_group)
+    ]
 
-        group = ExperimentScheduleGroup(
-            name=f"Auto Group {max_order + group_num} (HPC)",
+    # Create every group, then flush once to obtain their IDs
+    groups = [
+        ExperimentScheduleGroup(
+            name=f"Auto Group {max_order + group_num}{suffix}",
             order_index=max_order + group_num,
             is_completed=0,
         )
-        db.session.add(group)
-        db.session.commit()
-
-        # Add HPC experiments to the group
-        for idx, exp in enumerate(group_hpc_exps):
-            item = ExperimentScheduleItem(
-                group_id=group.id, experiment_id=exp.idexp, order_index=idx
-            )
-            db.session.add(item)
-        db.session.commit()
+        for group_num, (_, suffix) in enumerate(batches, start=1)
+    ]
+    db.session.add_all(groups)
+    db.session.flush()
 
-        created_groups.append(
-            {
-                "id": group.id,
-                "name": group.name,
-                "experiment_count": len(group_hpc_exps),
-            }
+    items = [
+        ExperimentScheduleItem(
+            group_id=group.id, experiment_id=exp.idexp, order_index=idx
         )
-        group_num += 1
-
-    # Then, create groups for Standard experiments
-    for i in range(0, len(standard_exps), experiments_per_group):
-        group_exps = standard_exps[i : i + experiments_per_group]
-
-        # Create group
-        group = ExperimentScheduleGroup(
-            name=f"Auto Group {max_order + group_num}",
-            order_index=max_order + group_num,
-            is_completed=0,
-        )
-        db.session.add(group)
-        db.session.commit()
-
-        # Add experiments to group
-        for idx, exp in enumerate(group_exps):
-            item = ExperimentScheduleItem(
-                group_id=group.id, experiment_id=exp.idexp, order_index=idx
-            )
-            db.session.add(item)
-
-        db.session.commit()
+        for group, (group_exps, _) in zip(groups, batches)
+        for idx, exp in enumerate(group_exps)
+    ]
+    db.session.bulk_save_objects(items)
 
-        created_groups.append(
-            {
-                "id": group.id,
-                "name": group.name,
-                "experiment_count": len(group_exps),
-            }
-        )
-        group_num += 1
+    created_groups = [
+        {
+            "id": group.id,
+            "name": group.name,
+            "experiment_count": len(group_exps),
+        }
+        for group, (group_exps, _) in zip(groups, batches)
+    ]
+    db.session.commit()
 
     add_schedule_log(
         f"Auto-created {len(created_groups)} group(s) with {len(available_exps)} experiment(s)",
@@ -1,10 +1,10 @@
-import psutil
 from flask import Blueprint, current_app, jsonify, render_template, request
 from flask_login import login_required
 
 from y_web import db
 from y_web.routes.admin.sub.experiments import experiment_details
 from y_web.src.models import Exps, Jupyter_instances
+from y_web.src.system.json_response import json_response
 from y_web.src.system.jupyter_utils import *
 from y_web.src.system.miscellanea import ollama_status
 
@@ -27,7 +27,7 @@ def __check_notebook_enabled():
         )
 
 
-@lab.route("/admin/lab_start/<experiment_id>", methods=["GET"])
+@lab.route("/admin/lab_start/<int:experiment_id>", methods=["GET"])
 @login_required
 def api_start_jupyter(experiment_id):
     """API endpoint to start Jupyter Lab"""
@@ -35,20 +35,12 @@ def api_start_jupyter(experiment_id):
     if disabled is not False:
         return disabled
 
-    try:
-        exp_id = int(experiment_id)
-    except (ValueError, TypeError):
+    exp_db_name = db.session.query(Exps.db_name).filter_by(idexp=experiment_id).scalar()
+    if exp_db_name is None:
         return (
             jsonify(
-                {"success": False, "message": f"Invalid experiment ID: {experiment_id}"}
+                {"success": False, "message": f"Experiment not found: {experiment_id}"}
             ),
-            400,
-        )
-
-    exp = db.session.query(Exps).filter_by(idexp=exp_id).first()
-    if not exp:
-        return (
-            jsonify({"success": False, "message": f"Experiment not found: {exp_id}"}),
             404,
         )
 
@@ -58,11 +50,10 @@ def api_start_jupyter(experiment_id):
         db_type = "postgresql"
 
     if db_type == "sqlite":
-        path = exp.db_name.split(os.sep)
+        path = exp_db_name.split(os.sep)
         notebook_dir = f"y_web{os.sep}{path[0]}{os.sep}{path[1]}{os.sep}notebooks"
     elif db_type == "postgresql":
-        db_name = exp.db_name
-        db_name = db_name.split("experiments_")[-1]
+        db_name = exp_db_name.split("experiments_")[-1]
         notebook_dir = f"y_web{os.sep}experiments{os.sep}{db_name}{os.sep}notebooks"
     else:
         return (
@@ -75,16 +66,18 @@ def api_start_jupyter(experiment_id):
             400,
         )
 
+    current_host, _, current_port = request.host.partition(":")
     success, message, instance_id = start_jupyter(
-        exp_id,
+        experiment_id,
         notebook_dir,
-        current_host=request.host.split(":")[0],
-        current_port=request.host.split(":")[1],
+        current_host=current_host,
+        current_port=current_port or "80",
+        db_name=exp_db_name,
     )
     return jsonify({"success": success, "message": message, "instance_id": instance_id})
 
 
-@lab.route("/admin/lab_stop/<instance_id>", methods=["GET"])
+@lab.route("/admin/lab_stop/<int:instance_id>", methods=["GET"])
 @login_required
 def api_stop_jupyter(instance_id):
     """API endpoint to stop Jupyter Lab"""
@@ -92,17 +85,7 @@ def api_stop_jupyter(instance_id):
     if disabled is not False:
         return disabled
 
-    try:
-        instance_id_int = int(instance_id)
-    except (ValueError, TypeError):
-        return (
-            jsonify(
-                {"success": False, "message": f"Invalid instance ID: {instance_id}"}
-            ),
-            400,
-        )
-
-    success, message = stop_jupyter(instance_id_int)
+    success, message = stop_jupyter(instance_id)
     return jsonify({"success": success, "message": message})
 
 
@@ -115,10 +98,10 @@ def api_jupyter_instances():
         return disabled
 
     instances = get_jupyter_instances()
-    return jsonify({"instances": instances})
+    return json_response({"instances": instances})
 
 
-@lab.route("/admin/lab_create/<expid>", methods=["POST"])
+@lab.route("/admin/lab_create/<int:expid>", methods=["POST"])
 @login_required
 def api_create_notebook(expid):
     """API endpoint to create a new notebook"""
@@ -126,10 +109,14 @@ def api_create_notebook(expid):
     if disabled is not False:
         return disabled
 
-    path = (
-        db.session.query(Exps).filter_by(idexp=int(expid)).first().db_name.split(os.sep)
-    )
+    exp_db_name = db.session.query(Exps.db_name).filter_by(idexp=expid).scalar()
+    if exp_db_name is None:
+        return (
+            jsonify({"success": False, "message": f"Experiment not found: {expid}"}),
+            404,
+        )
 
+    path = exp_db_name.split(os.sep)
     notebook_dir = f"y_web{os.sep}{path[0]}{os.sep}{path[1]}{os.sep}notebooks"
 
     try:
@@ -154,29 +141,17 @@ def jupyter_page(exp_id):
     if disabled is not False:
         return disabled
 
-    instances = db.session.query(Jupyter_instances).all()
-    JUPYTER_INSTANCES = {
-        inst.exp_id: {
-            "port": inst.port,
-            "process": inst.process,
-            "notebook_dir": Path(inst.notebook_dir),
-        }
-        for inst in instances
-    }
-
-    if exp_id not in JUPYTER_INSTANCES:
+    instance = Jupyter_instances.query.filter_by(exp_id=exp_id).first()
+    if instance is None:
         return experiment_details(exp_id)
 
-    inst = JUPYTER_INSTANCES[exp_id]
-    try:
-        proc = psutil.Process(int(inst["process"]))
-        if not proc.is_running():
-            return experiment_details(exp_id)
-    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+    # liveness is shared with the dashboard polls for a couple of seconds
+    pid = int(instance.process) if instance.process else None
+    if pid is None or not pids_running([pid])[pid]:
         return experiment_details(exp_id)
 
-    current_host = request.host.split(":")[0]
-    jupyter_url = f"http://{current_host}:{inst['port']}/lab?token=embed-jupyter-token"
+    current_host = request.host.partition(":")[0]
+    jupyter_url = f"http://{current_host}:{instance.port}/lab?token=embed-jupyter-token"
 
     experiment = Exps.query.filter_by(idexp=exp_id).first()
 
@@ -184,9 +159,9 @@ def jupyter_page(exp_id):
         "admin/jupyter.html",
         jupyter_url=jupyter_url,
         expid=exp_id,
-        jupyter_port=inst["port"],
+        jupyter_port=instance.port,
         jupyter_token="embed-jupyter-token",
-        notebook_dir=str(inst["notebook_dir"]),
+        notebook_dir=instance.notebook_dir,
         experiment=experiment,
         current_host=current_host,
     )
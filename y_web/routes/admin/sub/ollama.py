@@ -7,11 +7,14 @@ download progress.
 """
 
 import json
+import time
 
 from flask import (
     Blueprint,
+    Response,
     redirect,
     request,
+    stream_with_context,
 )
 from flask_login import current_user, login_required
 
@@ -19,28 +22,24 @@ from y_web import db
 from y_web.src.llm.ollama_manager import (
     delete_model_pull,
     delete_ollama_model,
-    is_ollama_installed,
-    is_ollama_running,
     pull_ollama_model,
     start_ollama_server,
 )
+from y_web.src.llm.vllm_manager import forget_llm_models
 from y_web.src.models import Ollama_Pull
-from y_web.src.system.miscellanea import check_privileges
+from y_web.src.system.json_response import json_response
+from y_web.src.system.miscellanea import check_privileges, forget_llm_backend_status
 
 ollama = Blueprint("ollama", __name__)
 
-
-def ollama_status():
-    """
-    Get Ollama service status.
-
-    Returns:
-        Dictionary with 'status' (running) and 'installed' flags
-    """
-    return {
-        "status": is_ollama_running(),
-        "installed": is_ollama_installed(),
-    }
+# seconds between progress reads of the pull progress stream
+PULL_PROGRESS_STREAM_INTERVAL = 0.5
+# seconds the stream waits for the pull's progress row to appear
+PULL_PROGRESS_STREAM_START_TIMEOUT = 10
+# seconds without a progress change after which the stream ends
+PULL_PROGRESS_STREAM_IDLE_TIMEOUT = 300
+# seconds between keepalive comments while progress does not change
+PULL_PROGRESS_STREAM_KEEPALIVE_INTERVAL = 15
 
 
 @ollama.route("/admin/start_ollama/", methods=["POST", "GET"])
@@ -56,6 +55,8 @@ def start_ollama():
 
     # start the ollama server
     start_ollama_server()
+    forget_llm_backend_status()
+    forget_llm_models()
 
     return redirect(request.referrer)
 
@@ -121,6 +122,7 @@ def delete_model(model_name):
 
     # delete the model from the ollama server
     delete_ollama_model(model_name)
+    forget_llm_models()
 
     Ollama_Pull.query.filter_by(model_name=model_name).delete()
     db.session.commit()
@@ -143,11 +145,79 @@ def get_pull_progress(model_name):
     model = Ollama_Pull.query.filter_by(model_name=model_name).first()
 
     if model is None:
-        return json.dumps({"progress": 0})
+        return json_response({"progress": 0})
     progress = int(100 * float(model.status))
 
     if progress == 100:
-        # delete the model from the table
-        db.session.query(Ollama_Pull).delete()
+        # delete the finished model's row; other pulls keep reporting progress
+        Ollama_Pull.query.filter_by(model_name=model_name).delete()
+        db.session.commit()
+        forget_llm_models()
+
+    return json_response({"progress": progress, "model_name": model.model_name})
+
+
+@ollama.route("/admin/pull_progress_stream/<string:model_name>")
+@login_required
+def stream_pull_progress(model_name):
+    """
+    Stream download progress for an Ollama model as Server-Sent Events.
+
+    One connection replaces repeated polling of ``get_pull_progress``: the
+    progress row is read every ``PULL_PROGRESS_STREAM_INTERVAL`` seconds and
+    an event is sent only when the value changes. The stream ends after
+    reporting 100, removing the finished model's progress row, or when the
+    row disappears because the pull was cancelled. It also ends when no
+    row shows up within ``PULL_PROGRESS_STREAM_START_TIMEOUT`` seconds or
+    progress stalls for ``PULL_PROGRESS_STREAM_IDLE_TIMEOUT`` seconds.
+    While progress stalls, a keepalive comment is sent so a disconnected
+    client makes the write fail and the stream stop.
+
+    Args:
+        model_name: Name of model to follow
+
+    Returns:
+        ``text/event-stream`` response of ``{"progress", "model_name"}`` events
+    """
 
-    return json.dumps({"progress": progress, "model_name": model.model_name})
+    def events():
+        last = None
+        seen = False
+        started = last_change = last_write = time.monotonic()
+        while True:
+            status = (
+                db.session.query(Ollama_Pull.status)
+                .filter_by(model_name=model_name)
+                .scalar()
+            )
+            now = time.monotonic()
+            if status is None and (
+                seen or now - started >= PULL_PROGRESS_STREAM_START_TIMEOUT
+            ):
+                return
+            seen = seen or status is not None
+            progress = int(100 * float(status)) if status is not None else 0
+            if progress != last:
+                last = progress
+                last_change = last_write = now
+                payload = json.dumps({"progress": progress, "model_name": model_name})
+                yield f"data: {payload}\n\n"
+            elif now - last_change >= PULL_PROGRESS_STREAM_IDLE_TIMEOUT:
+                return
+            elif now - last_write >= PULL_PROGRESS_STREAM_KEEPALIVE_INTERVAL:
+                last_write = now
+                yield ": keepalive\n\n"
+            if progress == 100:
+                Ollama_Pull.query.filter_by(model_name=model_name).delete()
+                db.session.commit()
+                forget_llm_models()
+                return
+            # end the read transaction so the next poll sees new progress
+            db.session.rollback()
+            time.sleep(PULL_PROGRESS_STREAM_INTERVAL)
+
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -13,6 +13,7 @@ from flask import Blueprint, flash, redirect, render_template, request
 from flask_login import current_user, login_required
 
 from y_web import db
+from y_web.routes.admin.sub.experiments._helpers import _apply_sort
 from y_web.src.content.feeds import get_feed
 from y_web.src.llm.ollama_manager import get_ollama_models
 from y_web.src.llm.vllm_manager import get_llm_models
@@ -27,6 +28,8 @@ from y_web.src.models import (
     Topic_List,
 )
 from y_web.src.system.desktop_file_handler import send_file_desktop
+from y_web.src.system.json_response import json_response
+from y_web.src.system.lookup_cache import lookup_rows
 from y_web.src.system.miscellanea import (
     check_privileges,
     llm_backend_status,
@@ -35,6 +38,16 @@ from y_web.src.system.miscellanea import (
 
 pages = Blueprint("pages", __name__)
 
+# pages_data table column ids -> Page columns they sort by
+_PAGE_SORT_COLUMNS = {
+    "name": Page.name,
+    "descr": Page.descr,
+    "keywords": Page.keywords,
+    "page_type": Page.page_type,
+    "logo": Page.logo,
+    "leaning": Page.leaning,
+}
+
 
 @pages.route("/admin/pages")
 @login_required
@@ -49,8 +62,8 @@ def page_data():
 
     models = get_llm_models()  # Use generic function for any LLM server
     llm_backend = llm_backend_status()
-    leanings = Leanings.query.all()
-    activity_profiles = ActivityProfile.query.all()
+    leanings = lookup_rows(Leanings)
+    activity_profiles = lookup_rows(ActivityProfile)
     return render_template(
         "admin/pages.html",
         models=models,
@@ -100,7 +113,7 @@ def create_page():
     from y_web.src.telemetry import Telemetry
 
     telemetry = Telemetry(user=current_user)
-    telemetry.log_event(
+    telemetry.log_event_async(
         {
             "action": "create_page",
             "data": {
@@ -134,67 +147,48 @@ def pages_data():
 
     # sorting
     sort = request.args.get("sort")
-    if sort:
-        order = []
-        for s in sort.split(","):
-            direction = s[0]
-            name = s[1:]
-            if name not in [
-                "name",
-                "descr",
-                "keywords",
-                "page_type",
-                "logo",
-                "leaning",
-            ]:
-                name = "name"
-            col = getattr(Page, name)
-            if direction == "-":
-                col = col.desc()
-            order.append(col)
-        if order:
-            query = query.order_by(*order)
-
-    # pagination
+    query = _apply_sort(query, sort, _PAGE_SORT_COLUMNS)
+
+    # activity profile names come with the page rows
+    query = query.outerjoin(
+        ActivityProfile, ActivityProfile.id == Page.activity_profile
+    ).add_columns(ActivityProfile.name)
+
+    # pagination; an unsorted table can continue from the last id it shows
+    # (after_id) instead of an offset, so deep pages skip no rows
     start = request.args.get("start", type=int, default=-1)
     length = request.args.get("length", type=int, default=-1)
-    if start != -1 and length != -1:
+    after_id = request.args.get("after_id", type=int)
+    if after_id is not None and not sort and length != -1:
+        query = query.filter(Page.id > after_id).order_by(Page.id).limit(length)
+    elif start != -1 and length != -1:
         query = query.offset(start).limit(length)
 
-    # get host and port of the server
-    host = request.host.split(":")[0]
-    port = request.host.split(":")[1] if ":" in request.host else "80"
+    # default logo URL on this server, shared by every row without a logo
+    host, _, port = request.host.partition(":")
+    default_logo = (
+        f"http://{host}:{port or '80'}/static/assets/img/vector/logo/Ysocial_l.png"
+    )
 
     # response
     res = query.all()
-    return {
-        "data": [
-            {
-                "id": page.id,
-                "name": page.name,
-                "keywords": page.keywords,
-                "page_type": page.page_type,
-                "logo": (
-                    page.logo
-                    if page.logo != ""
-                    else f"http://{host}:{port}/static/assets/img/vector/logo/Ysocial_l.png"
-                ),
-                "leaning": page.leaning,
-                "activity_profile": (
-                    [
-                        db.session.query(ActivityProfile)
-                        .filter(ActivityProfile.id == int(page.activity_profile))
-                        .first()
-                        .name
-                    ]
-                    if page.activity_profile
-                    else []
-                ),
-            }
-            for page in res
-        ],
-        "total": total,
-    }
+    return json_response(
+        {
+            "data": [
+                {
+                    "id": page.id,
+                    "name": page.name,
+                    "keywords": page.keywords,
+                    "page_type": page.page_type,
+                    "logo": page.logo if page.logo != "" else default_logo,
+                    "leaning": page.leaning,
+                    "activity_profile": [profile_name] if profile_name else [],
+                }
+                for page, profile_name in res
+            ],
+            "total": total,
+        }
+    )
 
 
 @pages.route("/admin/delete_page/<int:uid>")
@@ -212,15 +206,10 @@ def delete_page(uid):
         flash("Page is assigned to a population. Cannot delete.")
         return page_data()
 
+    # no Page_Population rows can reference the page past the check above
     db.session.delete(page)
     db.session.commit()
 
-    # delete page_population entries
-    page_population = Page_Population.query.filter_by(page_id=uid).all()
-    for pp in page_population:
-        db.session.delete(pp)
-        db.session.commit()
-
     return page_data()
 
 
@@ -244,14 +233,17 @@ def page_details(uid):
     pops = [(p[1].name, p[1].id) for p in page_populations]
 
     # get all populations
-    populations = Population.query.all()
+    populations = lookup_rows(Population)
 
-    topics = Topic_List.query.all()
-    page_topics = Page_Topic.query.filter_by(page_id=uid).all()
+    topics = lookup_rows(Topic_List)
 
-    # get topic names for page_topics from Topic_List
+    # get topic names of the page in one query
     page_topics = [
-        Topic_List.query.filter_by(id=pt.topic_id).first().name for pt in page_topics
+        name
+        for (name,) in db.session.query(Topic_List.name)
+        .join(Page_Topic, Page_Topic.topic_id == Topic_List.id)
+        .filter(Page_Topic.page_id == uid)
+        .order_by(Page_Topic.id)
     ]
 
     feed = get_feed(page.feed)
@@ -329,58 +321,51 @@ def upload_page_collection():
 
     collection = request.files["collection"]
 
-    from y_web.src.system.path_utils import get_writable_path
-
-    BASE = get_writable_path()
+    if collection:
+        # parse the upload in memory, no temp file round-trip
+        pages_data = json.load(collection.stream)
 
-    # Ensure temp_data directory exists
-    temp_data_dir = os.path.join(BASE, f"experiments{os.sep}temp_data")
-    os.makedirs(temp_data_dir, exist_ok=True)
+        # existing names, (name, feed) pairs and profile ids are loaded once
+        existing_pages = set(db.session.query(Page.name, Page.feed))
+        taken_names = {name for name, _ in existing_pages}
+        profile_ids = dict(db.session.query(ActivityProfile.name, ActivityProfile.id))
 
-    if collection:
-        collection.save(os.path.join(temp_data_dir, collection.filename))
-        pages_data = json.load(open(os.path.join(temp_data_dir, collection.filename)))
+        new_pages = []
         for page_data in pages_data:
             # check if the page already exists (by name and feed)
-            existing_page = Page.query.filter_by(
-                name=page_data["name"], feed=page_data["feed"]
-            ).first()
-            if existing_page:
+            if (page_data["name"], page_data["feed"]) in existing_pages:
                 continue
 
             # Handle name duplicates by adding incremental suffix
             base_name = page_data["name"]
             page_name = base_name
             suffix = 0
-            while Page.query.filter_by(name=page_name).first():
+            while page_name in taken_names:
                 suffix += 1
                 page_name = f"{base_name}_{suffix}"
+            taken_names.add(page_name)
+            existing_pages.add((page_name, page_data["feed"]))
 
             # Resolve activity_profile by name if provided
-            activity_profile_id = None
-            if page_data.get("activity_profile"):
-                activity_profile_obj = ActivityProfile.query.filter_by(
-                    name=page_data["activity_profile"]
-                ).first()
-                if activity_profile_obj:
-                    activity_profile_id = activity_profile_obj.id
-
-            page = Page(
-                name=page_name,
-                descr=page_data["descr"],
-                page_type=page_data["page_type"],
-                feed=page_data["feed"],
-                keywords=page_data["keywords"],
-                logo=page_data["logo"],
-                pg_type=page_data["pg_type"],
-                leaning=page_data["leaning"],
-                activity_profile=activity_profile_id,
+            activity_profile_id = profile_ids.get(page_data.get("activity_profile"))
+
+            new_pages.append(
+                {
+                    "name": page_name,
+                    "descr": page_data["descr"],
+                    "page_type": page_data["page_type"],
+                    "feed": page_data["feed"],
+                    "keywords": page_data["keywords"],
+                    "logo": page_data["logo"],
+                    "pg_type": page_data["pg_type"],
+                    "leaning": page_data["leaning"],
+                    "activity_profile": activity_profile_id,
+                }
             )
-            db.session.add(page)
-            db.session.commit()
 
-    # delete the file
-    os.remove(os.path.join(temp_data_dir, collection.filename))
+        # plain rows: no ORM instances are needed for a one-shot import
+        db.session.bulk_insert_mappings(Page, new_pages)
+        db.session.commit()
 
     return redirect(request.referrer)
 
@@ -396,17 +381,16 @@ def download_pages():
     """
     check_privileges(current_user.username)
 
-    pages = Page.query.all()
+    pages = (
+        Page.query.outerjoin(
+            ActivityProfile, ActivityProfile.id == Page.activity_profile
+        )
+        .add_columns(ActivityProfile.name)
+        .all()
+    )
 
     data = []
-    for page in pages:
-        # Get activity profile name if set
-        activity_profile_name = None
-        if page.activity_profile:
-            activity_profile_obj = ActivityProfile.query.get(page.activity_profile)
-            if activity_profile_obj:
-                activity_profile_name = activity_profile_obj.name
-
+    for page, activity_profile_name in pages:
         data.append(
             {
                 "name": page.name,
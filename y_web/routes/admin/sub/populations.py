@@ -6,8 +6,8 @@ including demographics, personality traits, recommendation systems, and
 association with experiments and pages.
 """
 
-import json
 import os
+from collections import Counter, defaultdict
 
 from flask import (
     Blueprint,
@@ -17,8 +17,11 @@ from flask import (
     request,
 )
 from flask_login import current_user, login_required
+from sqlalchemy import func
+from sqlalchemy.orm import load_only
 
 from y_web import db
+from y_web.routes.admin.sub.experiments._helpers import _apply_sort
 from y_web.src.agents.custom_features import (
     feature_entries_from_population_agent_payload,
     replace_agent_custom_features,
@@ -57,6 +60,8 @@ from y_web.src.models import (
     Toxicity_Levels,
 )
 from y_web.src.system.desktop_file_handler import send_file_desktop
+from y_web.src.system.json_response import json_dumps, json_loads
+from y_web.src.system.lookup_cache import lookup_rows
 from y_web.src.system.miscellanea import (
     check_privileges,
     llm_backend_status,
@@ -65,16 +70,62 @@ from y_web.src.system.miscellanea import (
 
 population = Blueprint("population", __name__)
 
+# populations_data table column ids -> Population columns they sort by
+_POPULATION_SORT_COLUMNS = {
+    "name": Population.name,
+    "descr": Population.descr,
+    "size": Population.size,
+    "pop_type": Population.pop_type,
+}
+
 STANDARD_POPULATION_TYPE = None
 
 
+def _profession_backgrounds():
+    """Return the distinct profession backgrounds in sorted order."""
+    rows = lookup_rows(Profession, Profession.background)
+    return sorted({background for (background,) in rows})
+
+
+def _profile_label_maps():
+    """
+    Map stored education, leaning and toxicity ids to their labels.
+
+    Returns:
+        Tuple of ``{str(id): label}`` dicts for education levels, leanings
+        and toxicity levels
+    """
+    education = lookup_rows(Education, Education.id, Education.education_level)
+    leanings = lookup_rows(Leanings, Leanings.id, Leanings.leaning)
+    toxicity = lookup_rows(
+        Toxicity_Levels, Toxicity_Levels.id, Toxicity_Levels.toxicity_level
+    )
+    return (
+        {str(row_id): label for row_id, label in education},
+        {str(row_id): label for row_id, label in leanings},
+        {str(row_id): label for row_id, label in toxicity},
+    )
+
+
+def _activity_profile_names(profile_ids):
+    """Map the given activity profile ids to their names with one IN query."""
+    profile_ids = [profile_id for profile_id in profile_ids if profile_id]
+    if not profile_ids:
+        return {}
+    return dict(
+        db.session.query(ActivityProfile.id, ActivityProfile.name).filter(
+            ActivityProfile.id.in_(profile_ids)
+        )
+    )
+
+
 def _render_custom_population_details(population, exps, agents):
+    profile_names = _activity_profile_names(
+        {agent.activity_profile for agent in agents}
+    )
     agent_rows = []
-    for agent, _ in agents:
-        activity_profile_name = None
-        if agent.activity_profile:
-            profile = ActivityProfile.query.get(agent.activity_profile)
-            activity_profile_name = profile.name if profile else None
+    for agent in agents:
+        activity_profile_name = profile_names.get(agent.activity_profile)
         ext_fields = {
             ext.feature_name: ext.feature_value
             for ext in Agent_Ext.query.filter_by(agent_id=agent.id).all()
@@ -135,6 +186,45 @@ def _normalize_percentage_distribution(raw_distribution, selected_ids):
     return normalized
 
 
+def _join_csv(values):
+    """
+    Join form values into the comma-separated form stored on a population.
+
+    Entries are stripped and empty ones dropped, so readers can split the
+    stored string without cleaning every element.
+
+    Args:
+        values: List of strings, a comma-separated string, or None
+
+    Returns:
+        Comma-separated string, or None when ``values`` is None
+    """
+    if values is None:
+        return None
+    if isinstance(values, str):
+        values = values.split(",")
+    stripped = (str(value).strip() for value in values)
+    return ",".join(value for value in stripped if value)
+
+
+def _csv_labels(ids, labels):
+    """Map a stored comma-separated id string to its labels."""
+    # ids are integers, so dropping every space at once also handles rows
+    # written before _join_csv without stripping each element
+    return [labels.get(i, i) for i in (ids or "").replace(" ", "").split(",") if i]
+
+
+def _load_form_json(raw, default):
+    """Parse a JSON form field, falling back to ``default`` when empty or invalid."""
+    if not raw:
+        return default
+    try:
+        return json_loads(raw)
+    except ValueError:
+        # orjson.JSONDecodeError and json.JSONDecodeError both subclass it
+        return default
+
+
 def _distribution_total_is_valid(distribution):
     if not distribution:
         return False
@@ -220,9 +310,9 @@ def create_population():
     political_leaning_ids = request.form.getlist("political_leanings")
     toxicity_level_ids = request.form.getlist("toxicity_levels")
 
-    education_levels = ",".join(education_level_ids)
-    political_leanings = ",".join(political_leaning_ids)
-    toxicity_levels = ",".join(toxicity_level_ids)
+    education_levels = _join_csv(education_level_ids)
+    political_leanings = _join_csv(political_leaning_ids)
+    toxicity_levels = _join_csv(toxicity_level_ids)
 
     # Retrieve percentage data for education, political leanings, toxicity, and age classes
     # These will be used in future implementations for weighted distribution
@@ -231,16 +321,10 @@ def create_population():
     toxicity_percentages_str = request.form.get("toxicity_levels_percentages", "{}")
     age_classes_percentages_str = request.form.get("age_classes_percentages", "{}")
 
-    try:
-        education_percentages = json.loads(education_percentages_str)
-        political_percentages = json.loads(political_percentages_str)
-        toxicity_percentages = json.loads(toxicity_percentages_str)
-        age_classes_percentages = json.loads(age_classes_percentages_str)
-    except (json.JSONDecodeError, ValueError):
-        education_percentages = {}
-        political_percentages = {}
-        toxicity_percentages = {}
-        age_classes_percentages = {}
+    education_percentages = _load_form_json(education_percentages_str, {})
+    political_percentages = _load_form_json(political_percentages_str, {})
+    toxicity_percentages = _load_form_json(toxicity_percentages_str, {})
+    age_classes_percentages = _load_form_json(age_classes_percentages_str, {})
 
     education_percentages = _normalize_percentage_distribution(
         education_percentages, education_level_ids
@@ -295,23 +379,19 @@ def create_population():
             flash(f"The {label} percentages must sum to 100%.", "error")
             return redirect(request.referrer)
 
-    nationalities = request.form.get("nationalities")
-    languages = request.form.get("languages")
-    interests = request.form.get("tags")
+    nationalities = _join_csv(request.form.get("nationalities"))
+    languages = _join_csv(request.form.get("languages"))
+    interests = _join_csv(request.form.get("tags"))
 
     # Get selected profession backgrounds
     profession_backgrounds = request.form.getlist("profession_backgrounds")
     # If no profession backgrounds selected, use all available
     if not profession_backgrounds:
-        all_backgrounds = db.session.query(Profession.background).distinct().all()
-        profession_backgrounds = [bg[0] for bg in all_backgrounds]
+        profession_backgrounds = _profession_backgrounds()
 
     # Get activity profiles data from the hidden field
     activity_profiles_data = request.form.get("activity_profiles_data", "[]")
-    try:
-        activity_profiles_json = json.loads(activity_profiles_data)
-    except:
-        activity_profiles_json = []
+    activity_profiles_json = _load_form_json(activity_profiles_data, [])
 
     # Get actions per user once active data
     actions_min = request.form.get("actions_min", "1")
@@ -353,16 +433,20 @@ def create_population():
     )
 
     db.session.add(population)
-    db.session.commit()
+    db.session.flush()
 
     # Store population-activity profile associations
-    for profile_data in activity_profiles_json:
-        profile_assoc = PopulationActivityProfile(
-            population=population.id,
-            activity_profile=int(profile_data["id"]),
-            percentage=float(profile_data["percentage"]),
-        )
-        db.session.add(profile_assoc)
+    db.session.bulk_insert_mappings(
+        PopulationActivityProfile,
+        [
+            {
+                "population": population.id,
+                "activity_profile": int(profile_data["id"]),
+                "percentage": float(profile_data["percentage"]),
+            }
+            for profile_data in activity_profiles_json
+        ],
+    )
     db.session.commit()
 
     try:
@@ -416,47 +500,41 @@ def populations_data():
 
     # sorting
     sort = request.args.get("sort")
-    if sort:
-        order = []
-        for s in sort.split(","):
-            direction = s[0]
-            name = s[1:]
-            if name not in ["name", "descr", "size", "pop_type"]:
-                name = "name"
-            col = getattr(Population, name)
-            if direction == "-":
-                col = col.desc()
-            order.append(col)
-        if order:
-            query = query.order_by(*order)
-
-    # pagination
+    query = _apply_sort(query, sort, _POPULATION_SORT_COLUMNS)
+
+    # pagination; an unsorted table can continue from the last id it shows
+    # (after_id) instead of an offset, so deep pages skip no rows
     start = request.args.get("start", type=int, default=-1)
     length = request.args.get("length", type=int, default=-1)
-    if start != -1 and length != -1:
+    after_id = request.args.get("after_id", type=int)
+    if after_id is not None and not sort and length != -1:
+        query = (
+            query.filter(Population.id > after_id).order_by(Population.id).limit(length)
+        )
+    elif start != -1 and length != -1:
         query = query.offset(start).limit(length)
 
     # response
     res = query.all()
 
-    # Get activity profiles for each population
-    population_profiles = {}
-    for pop in res:
-        profiles = (
-            db.session.query(ActivityProfile)
+    # Get activity profiles of all listed populations in one query
+    population_profiles = defaultdict(list)
+    if res:
+        pop_ids = [pop.id for pop in res]
+        profile_rows = (
+            db.session.query(PopulationActivityProfile.population, ActivityProfile.name)
             .join(
-                PopulationActivityProfile,
+                ActivityProfile,
                 ActivityProfile.id == PopulationActivityProfile.activity_profile,
             )
-            .filter(PopulationActivityProfile.population == pop.id)
+            .filter(PopulationActivityProfile.population.in_(pop_ids))
             .all()
         )
-        population_profiles[pop.id] = [p.name for p in profiles]
+        for pop_id, profile_name in profile_rows:
+            population_profiles[pop_id].append(profile_name)
 
     # Get lookup dictionaries for education, leanings, and toxicity
-    education_dict = {str(e.id): e.education_level for e in Education.query.all()}
-    leanings_dict = {str(l.id): l.leaning for l in Leanings.query.all()}
-    toxicity_dict = {str(t.id): t.toxicity_level for t in Toxicity_Levels.query.all()}
+    education_dict, leanings_dict, toxicity_dict = _profile_label_maps()
 
     return {
         "data": [
@@ -464,21 +542,9 @@ def populations_data():
                 "id": pop.id,
                 "name": pop.name,
                 "size": pop.size,
-                "education": [
-                    education_dict.get(e_id.strip(), e_id.strip())
-                    for e_id in (pop.education or "").split(",")
-                    if e_id.strip()
-                ],
-                "leanings": [
-                    leanings_dict.get(l_id.strip(), l_id.strip())
-                    for l_id in (pop.leanings or "").split(",")
-                    if l_id.strip()
-                ],
-                "toxicity": [
-                    toxicity_dict.get(t_id.strip(), t_id.strip())
-                    for t_id in (pop.toxicity or "").split(",")
-                    if t_id.strip()
-                ],
+                "education": _csv_labels(pop.education, education_dict),
+                "leanings": _csv_labels(pop.leanings, leanings_dict),
+                "toxicity": _csv_labels(pop.toxicity, toxicity_dict),
                 "username_type": infer_population_username_type(pop) or "microblogging",
                 "pop_type": pop.pop_type or "standard",
                 "activity_profiles": population_profiles.get(pop.id, []),
@@ -514,13 +580,7 @@ def populations():
     activity_profiles = ActivityProfile.query.all()
 
     # Get unique profession backgrounds
-    profession_backgrounds = (
-        db.session.query(Profession.background)
-        .distinct()
-        .order_by(Profession.background)
-        .all()
-    )
-    profession_backgrounds = [bg[0] for bg in profession_backgrounds]
+    profession_backgrounds = _profession_backgrounds()
 
     return render_template(
         "admin/populations.html",
@@ -556,205 +616,147 @@ def population_details(uid):
     exps = [(p[1].exp_name, p[1].idexp) for p in experiment_populations]
 
     # get all agents in the population
-    agents = (
-        db.session.query(Agent, Agent_Population)
+    agents_query = (
+        db.session.query(Agent)
         .join(Agent_Population)
         .filter(Agent_Population.population_id == uid)
-        .all()
     )
 
     if population.pop_type is not None:
-        return _render_custom_population_details(population, exps, agents)
+        # the custom view never renders the rows, so load only what it reads
+        custom_agents = agents_query.options(
+            load_only(
+                Agent.name,
+                Agent.ag_type,
+                Agent.daily_activity_level,
+                Agent.activity_profile,
+            )
+        ).all()
+        return _render_custom_population_details(population, exps, custom_agents)
+
+    agents = agents_query.add_entity(Agent_Population).all()
 
     # Fetch label mappings from database
-    leanings_map = {str(l.id): l.leaning for l in Leanings.query.all()}
-    education_map = {str(e.id): e.education_level for e in Education.query.all()}
-    toxicity_map = {str(t.id): t.toxicity_level for t in Toxicity_Levels.query.all()}
-
-    ln = {"leanings": [], "total": []}
-
-    for a in agents:
-        # Convert ID to label
-        leaning_label = leanings_map.get(a[0].leaning, a[0].leaning)
-        if leaning_label in ln["leanings"]:
-            ln["total"][ln["leanings"].index(leaning_label)] += 1
-        else:
-            ln["leanings"].append(leaning_label)
-            ln["total"].append(1)
-
-    # Bin ages according to AgeClass ranges
-    age_classes = AgeClass.query.order_by(AgeClass.age_start).all()
-    age = {"age": [], "total": []}
+    education_map, leanings_map, toxicity_map = _profile_label_maps()
 
-    # Initialize bins for each age class
-    for age_class in age_classes:
-        age["age"].append(
-            f"{age_class.name} ({age_class.age_start}-{age_class.age_end})"
-        )
-        age["total"].append(0)
+    age_classes = AgeClass.query.order_by(AgeClass.age_start).all()
 
-    # Count agents in each age class bin
-    for a in agents:
-        agent_age = a[0].age
-        if agent_age is None:
-            continue
-        for idx, age_class in enumerate(age_classes):
-            if age_class.age_start <= agent_age <= age_class.age_end:
-                age["total"][idx] += 1
-                break
-
-    edu = {"education": [], "total": []}
-
-    for a in agents:
-        # Convert ID to label
-        education_label = education_map.get(a[0].education_level, a[0].education_level)
-        if education_label in edu["education"]:
-            edu["total"][edu["education"].index(education_label)] += 1
-        else:
-            edu["education"].append(education_label)
-            edu["total"].append(1)
-
-    nat = {"nationalities": [], "total": []}
-    for a in agents:
-        if a[0].nationality in nat["nationalities"]:
-            nat["total"][nat["nationalities"].index(a[0].nationality)] += 1
-        else:
-            nat["nationalities"].append(a[0].nationality)
-            nat["total"].append(1)
-
-    lang = {"languages": [], "total": []}
-    for a in agents:
-        if a[0].language in lang["languages"]:
-            lang["total"][lang["languages"].index(a[0].language)] += 1
-        else:
-            lang["languages"].append(a[0].language)
-            lang["total"].append(1)
-
-    tox = {"toxicity": [], "total": []}
-    for a in agents:
-        if a[0].toxicity is not None:
-            # Convert ID to label
-            toxicity_label = toxicity_map.get(a[0].toxicity, a[0].toxicity)
-            if toxicity_label in tox["toxicity"]:
-                tox["total"][tox["toxicity"].index(toxicity_label)] += 1
-            else:
-                tox["toxicity"].append(toxicity_label)
-                tox["total"].append(1)
-
-    activity = {"activity": [], "total": []}
-    for a in agents:
-        if a[0].daily_activity_level in activity["activity"]:
-            activity["total"][
-                activity["activity"].index(a[0].daily_activity_level)
-            ] += 1
-        else:
-            if a[0].daily_activity_level is not None:
-                activity["activity"].append(a[0].daily_activity_level)
-                activity["total"].append(1)
-
-    sorted_activity = dict(sorted(zip(activity["activity"], activity["total"])))
-
-    # Convert back to dictionary format with separate lists
-    activity = {
-        "activity": list(sorted_activity.keys()),
-        "total": list(sorted_activity.values()),
-    }
+    # tally every distribution in a single pass over the agents
+    leaning_ctr = Counter()
+    education_ctr = Counter()
+    nationality_ctr = Counter()
+    language_ctr = Counter()
+    toxicity_ctr = Counter()
+    activity_ctr = Counter()
+    gender_ctr = Counter()
+    profession_ctr = Counter()
+    activity_profile_id_ctr = Counter()
+    crecsys = Counter()
+    frecsys = Counter()
+    llm = Counter()
+    age_totals = [0] * len(age_classes)
+    age_ranges = [(c.age_start, c.age_end) for c in age_classes]
+    agent_ages = []
 
-    # Gender distribution
-    gender = {"genders": [], "total": []}
-    for a in agents:
-        if a[0].gender:
-            if a[0].gender in gender["genders"]:
-                gender["total"][gender["genders"].index(a[0].gender)] += 1
-            else:
-                gender["genders"].append(a[0].gender)
-                gender["total"].append(1)
-
-    # Professions distribution (top-k for wordcloud)
-    professions = {}
-    for a in agents:
-        if a[0].profession:
-            professions[a[0].profession] = professions.get(a[0].profession, 0) + 1
-
-    # Sort professions by frequency and prepare for word cloud
-    sorted_professions = dict(
-        sorted(professions.items(), key=lambda x: x[1], reverse=True)
-    )
-    prof = {
-        "professions": list(sorted_professions.keys()),
-        "total": list(sorted_professions.values()),
+    for agent, _ in agents:
+        # Convert IDs to labels
+        leaning_ctr[leanings_map.get(agent.leaning, agent.leaning)] += 1
+        education_ctr[
+            education_map.get(agent.education_level, agent.education_level)
+        ] += 1
+        if agent.toxicity is not None:
+            toxicity_ctr[toxicity_map.get(agent.toxicity, agent.toxicity)] += 1
+
+        # Bin ages according to AgeClass ranges; age classes may overlap or
+        # share a boundary, so the first matching class (by age_start) wins
+        if agent.age is not None:
+            agent_ages.append(agent.age)
+            for idx, (age_start, age_end) in enumerate(age_ranges):
+                if age_start <= agent.age <= age_end:
+                    age_totals[idx] += 1
+                    break
+
+        nationality_ctr[agent.nationality] += 1
+        language_ctr[agent.language] += 1
+        if agent.daily_activity_level is not None:
+            activity_ctr[agent.daily_activity_level] += 1
+        if agent.gender:
+            gender_ctr[agent.gender] += 1
+        if agent.profession:
+            profession_ctr[agent.profession] += 1
+        if agent.activity_profile:
+            activity_profile_id_ctr[agent.activity_profile] += 1
+        if agent.crecsys:
+            crecsys[agent.crecsys] += 1
+        if agent.frecsys:
+            frecsys[agent.frecsys] += 1
+        if agent.ag_type:
+            llm[agent.ag_type] += 1
+
+    age = {
+        "age": [f"{c.name} ({c.age_start}-{c.age_end})" for c in age_classes],
+        "total": age_totals,
     }
-
-    # Activity profiles distribution
-    activity_prof = {"profiles": [], "total": []}
-    for a in agents:
-        if a[0].activity_profile:
-            # Get activity profile name
-            profile = ActivityProfile.query.get(a[0].activity_profile)
-            if profile:
-                profile_name = profile.name
-                if profile_name in activity_prof["profiles"]:
-                    activity_prof["total"][
-                        activity_prof["profiles"].index(profile_name)
-                    ] += 1
-                else:
-                    activity_prof["profiles"].append(profile_name)
-                    activity_prof["total"].append(1)
+    # activity levels are listed in ascending order
+    sorted_activity = sorted(activity_ctr.items())
+    # professions are listed by frequency (top-k for wordcloud)
+    sorted_professions = profession_ctr.most_common()
+    # resolve the referenced activity profile names in one query
+    profile_names = _activity_profile_names(activity_profile_id_ctr)
+    profile_totals = [
+        (profile_names[profile_id], total)
+        for profile_id, total in activity_profile_id_ctr.items()
+        if profile_id in profile_names
+    ]
 
     dd = {
         "age": age,
-        "leaning": ln,
-        "education": edu,
-        "nationalities": nat,
-        "languages": lang,
-        "toxicity": tox,
-        "activity": activity,
-        "gender": gender,
-        "professions": prof,
-        "activity_profiles": activity_prof,
+        "leaning": {
+            "leanings": list(leaning_ctr),
+            "total": list(leaning_ctr.values()),
+        },
+        "education": {
+            "education": list(education_ctr),
+            "total": list(education_ctr.values()),
+        },
+        "nationalities": {
+            "nationalities": list(nationality_ctr),
+            "total": list(nationality_ctr.values()),
+        },
+        "languages": {
+            "languages": list(language_ctr),
+            "total": list(language_ctr.values()),
+        },
+        "toxicity": {
+            "toxicity": list(toxicity_ctr),
+            "total": list(toxicity_ctr.values()),
+        },
+        "activity": {
+            "activity": [level for level, _ in sorted_activity],
+            "total": [total for _, total in sorted_activity],
+        },
+        "gender": {"genders": list(gender_ctr), "total": list(gender_ctr.values())},
+        "professions": {
+            "professions": [name for name, _ in sorted_professions],
+            "total": [total for _, total in sorted_professions],
+        },
+        "activity_profiles": {
+            "profiles": [name for name, _ in profile_totals],
+            "total": [total for _, total in profile_totals],
+        },
     }
 
-    # most frequent crecsys amon agents
-    crecsys = {}
-    for a in agents:
-        if a[0].crecsys:
-            if a[0].crecsys in crecsys:
-                crecsys[a[0].crecsys] += 1
-            else:
-                crecsys[a[0].crecsys] = 1
-
-    # most frequent crecsys amon agents
-    frecsys = {}
-    for a in agents:
-        if a[0].frecsys:
-            if a[0].frecsys in frecsys:
-                frecsys[a[0].frecsys] += 1
-            else:
-                frecsys[a[0].frecsys] = 1
-
-    # most frequent crecsys amon agents
-    llm = {}
-    for a in agents:
-        if a[0].ag_type:
-            if a[0].ag_type in llm:
-                llm[a[0].ag_type] += 1
-            else:
-                llm[a[0].ag_type] = 1
-
     # get topics associated to the experiments this population is part of
-    exp_topics = (
-        db.session.query(Exp_Topic, Topic_List)
-        .join(Topic_List)
-        .join(Exps, Exp_Topic.exp_id == Exps.idexp)
-        .join(Population_Experiment, Population_Experiment.id_exp == Exps.idexp)
+    topics = [
+        name
+        for (name,) in db.session.query(Topic_List.name)
+        .join(Exp_Topic, Exp_Topic.topic_id == Topic_List.id)
+        .join(Population_Experiment, Population_Experiment.id_exp == Exp_Topic.exp_id)
         .filter(Population_Experiment.id_population == uid)
-        .all()
-    )
-    topics = [t[1].name for t in exp_topics]
+    ]
 
     try:
         # Calculate actual age min/max from agents
-        agent_ages = [a[0].age for a in agents if a[0].age is not None]
         age_min_val = min(agent_ages) if agent_ages else None
         age_max_val = max(agent_ages) if agent_ages else None
 
@@ -793,8 +795,7 @@ def population_details(uid):
         agent_profiles["profiles"].append(profile.name)
         agent_profiles["expected_pct"].append(dist.percentage)
         # Count actual agents with this profile
-        actual_count = sum(1 for a in agents if a[0].activity_profile == profile.id)
-        agent_profiles["assigned_count"].append(actual_count)
+        agent_profiles["assigned_count"].append(activity_profile_id_ctr[profile.id])
 
     models = get_llm_models()  # Use generic function for any LLM server
     llm_backend = llm_backend_status()
@@ -874,28 +875,69 @@ def delete_population(uid):
                 )
                 return redirect(f"/admin/custom_agent/{population.pop_type}")
 
+    # no Population_Experiment rows can reference it past the check above
+    Agent_Population.query.filter_by(population_id=uid).delete(
+        synchronize_session=False
+    )
     db.session.delete(population)
     db.session.commit()
 
-    # delete agent_population entries
-    agent_population = Agent_Population.query.filter_by(population_id=uid).all()
-    for ap in agent_population:
-        db.session.delete(ap)
-        db.session.commit()
-
-    # delete population_experiment entries
-    population_experiment = Population_Experiment.query.filter_by(
-        id_population=uid
-    ).all()
-    for pe in population_experiment:
-        db.session.delete(pe)
-        db.session.commit()
-
     if population.pop_type is not None:
         return redirect(f"/admin/custom_agent/{population.pop_type}")
     return populations()
 
 
+def _population_agent_row(agent, activity_profile_name, profile, structured):
+    """Build the exported JSON record of one population agent."""
+    agent_row = {
+        "id": agent.id,
+        "name": agent.name,
+        "ag_type": agent.ag_type,
+        "leaning": agent.leaning,
+        "oe": agent.oe,
+        "co": agent.co,
+        "ex": agent.ex,
+        "ag": agent.ag,
+        "ne": agent.ne,
+        "language": agent.language,
+        "education": agent.education_level,
+        "round_actions": agent.round_actions,
+        "nationality": agent.nationality,
+        "toxicity": agent.toxicity,
+        "age": agent.age,
+        "gender": agent.gender,
+        "crecsys": agent.crecsys,
+        "frecsys": agent.frecsys,
+        "profile_pic": agent.profile_pic,
+        "cover_image": agent.cover_image,
+        "daily_activity_level": agent.daily_activity_level,
+        "profession": agent.profession,
+        "activity_profile": activity_profile_name,
+        "profile": profile,
+    }
+    if structured.get("interests"):
+        agent_row["interests"] = [
+            list(structured["interests"]),
+            len(structured["interests"]),
+        ]
+    if structured.get("opinions"):
+        agent_row["opinions"] = dict(structured["opinions"])
+    if structured.get("stubborn_topics"):
+        agent_row["stubborn_topics"] = dict(structured["stubborn_topics"])
+    if structured.get("custom_features"):
+        agent_row["custom_features"] = dict(structured["custom_features"])
+    return agent_row
+
+
+def _write_json_array(f, rows):
+    """Write *rows* to the binary file *f* as a JSON array, one record per line."""
+    f.write(b"[")
+    for i, row in enumerate(rows):
+        f.write(b",\n" if i else b"\n")
+        f.write(json_dumps(row))
+    f.write(b"\n]")
+
+
 @population.route("/admin/download_population/<int:uid>")
 @login_required
 def download_population(uid):
@@ -922,91 +964,47 @@ def download_population(uid):
     population = Population.query.filter_by(id=uid).first()
     feature_map = summarize_agent_custom_features_bulk([a[0].id for a in agents])
 
-    res = {
-        "population_data": {
-            "name": population.name,
-            "descr": population.descr,
-            "username_type": infer_population_username_type(population)
-            or "microblogging",
-        },
-        "agents": [],
-        "pages": [],
-    }
+    # profiles and activity profile names are resolved with one query each;
+    # the lowest Agent_Profile id wins, as with .first()
+    agent_profiles = dict(
+        db.session.query(Agent_Profile.agent_id, Agent_Profile.profile)
+        .join(Agent_Population, Agent_Population.agent_id == Agent_Profile.agent_id)
+        .filter(Agent_Population.population_id == uid)
+        .order_by(Agent_Profile.id.desc())
+    )
+    profile_names = _activity_profile_names(
+        {a[0].activity_profile for a in agents} | {p[0].activity_profile for p in pages}
+    )
 
-    for a in agents:
-        structured = feature_map.get(a[0].id, {})
-        # Get activity profile name if set
-        activity_profile_name = None
-        if a[0].activity_profile:
-            activity_profile_obj = ActivityProfile.query.get(a[0].activity_profile)
-            if activity_profile_obj:
-                activity_profile_name = activity_profile_obj.name
-
-        agent_row = {
-            "id": a[0].id,
-            "name": a[0].name,
-            "ag_type": a[0].ag_type,
-            "leaning": a[0].leaning,
-            "oe": a[0].oe,
-            "co": a[0].co,
-            "ex": a[0].ex,
-            "ag": a[0].ag,
-            "ne": a[0].ne,
-            "language": a[0].language,
-            "education": a[0].education_level,
-            "round_actions": a[0].round_actions,
-            "nationality": a[0].nationality,
-            "toxicity": a[0].toxicity,
-            "age": a[0].age,
-            "gender": a[0].gender,
-            "crecsys": a[0].crecsys,
-            "frecsys": a[0].frecsys,
-            "profile_pic": a[0].profile_pic,
-            "cover_image": a[0].cover_image,
-            "daily_activity_level": a[0].daily_activity_level,
-            "profession": a[0].profession,
-            "activity_profile": activity_profile_name,
-            "profile": (
-                Agent_Profile.query.filter_by(agent_id=a[0].id).first().profile
-                if Agent_Profile.query.filter_by(agent_id=a[0].id).first() is not None
-                else None
-            ),
-        }
-        if structured.get("interests"):
-            agent_row["interests"] = [
-                list(structured["interests"]),
-                len(structured["interests"]),
-            ]
-        if structured.get("opinions"):
-            agent_row["opinions"] = dict(structured["opinions"])
-        if structured.get("stubborn_topics"):
-            agent_row["stubborn_topics"] = dict(structured["stubborn_topics"])
-        if structured.get("custom_features"):
-            agent_row["custom_features"] = dict(structured["custom_features"])
-        res["agents"].append(agent_row)
-
-    for p in pages:
-        # Get activity profile name if set
-        page_activity_profile_name = None
-        if p[0].activity_profile:
-            page_activity_profile_obj = ActivityProfile.query.get(p[0].activity_profile)
-            if page_activity_profile_obj:
-                page_activity_profile_name = page_activity_profile_obj.name
-
-        res["pages"].append(
-            {
-                "id": p[0].id,
-                "name": p[0].name,
-                "descr": p[0].descr,
-                "page_type": p[0].page_type,
-                "feed": p[0].feed,
-                "keywords": p[0].keywords,
-                "logo": p[0].logo,
-                "pg_type": p[0].pg_type,
-                "leaning": p[0].leaning,
-                "activity_profile": page_activity_profile_name,
-            }
+    population_data = {
+        "name": population.name,
+        "descr": population.descr,
+        "username_type": infer_population_username_type(population) or "microblogging",
+    }
+    agent_rows = (
+        _population_agent_row(
+            a[0],
+            profile_names.get(a[0].activity_profile),
+            agent_profiles.get(a[0].id),
+            feature_map.get(a[0].id, {}),
         )
+        for a in agents
+    )
+    page_rows = (
+        {
+            "id": p[0].id,
+            "name": p[0].name,
+            "descr": p[0].descr,
+            "page_type": p[0].page_type,
+            "feed": p[0].feed,
+            "keywords": p[0].keywords,
+            "logo": p[0].logo,
+            "pg_type": p[0].pg_type,
+            "leaning": p[0].leaning,
+            "activity_profile": profile_names.get(p[0].activity_profile),
+        }
+        for p in pages
+    )
 
     from y_web.src.system.path_utils import get_writable_path
 
@@ -1016,12 +1014,33 @@ def download_population(uid):
     temp_data_dir = os.path.join(BASE_DIR, f"experiments{os.sep}temp_data")
     os.makedirs(temp_data_dir, exist_ok=True)
 
+    # records are serialized one at a time instead of as one big document
     filename = os.path.join(temp_data_dir, f"population_{population.name}.json")
-    json.dump(res, open(filename, "w"), indent=4)
+    with open(filename, "wb") as f:
+        f.write(b'{"population_data": ')
+        f.write(json_dumps(population_data))
+        f.write(b',\n"agents": ')
+        _write_json_array(f, agent_rows)
+        f.write(b',\n"pages": ')
+        _write_json_array(f, page_rows)
+        f.write(b"}\n")
 
     return send_file_desktop(filename, as_attachment=True)
 
 
+def _insert_named_rows(model, rows, ids_by_name):
+    """
+    Insert *rows* of *model* in bulk and record their ids by name.
+
+    ``return_defaults`` makes each saved object carry its own generated id,
+    so the mapping stays right when rows with the same name are inserted
+    concurrently. ``ids_by_name`` is updated in place.
+    """
+    objects = [model(**row) for row in rows]
+    db.session.bulk_save_objects(objects, return_defaults=True)
+    ids_by_name.update((obj.name, obj.id) for obj in objects)
+
+
 @population.route("/admin/upload_population", methods=["POST"])
 @login_required
 def upload_population():
@@ -1036,18 +1055,8 @@ def upload_population():
 
     population_file = request.files["population_file"]
 
-    from y_web.src.system.path_utils import get_writable_path
-
-    BASE_DIR = get_writable_path()
-
-    # Ensure temp_data directory exists
-    temp_data_dir = os.path.join(BASE_DIR, f"experiments{os.sep}temp_data")
-    os.makedirs(temp_data_dir, exist_ok=True)
-
-    filename = os.path.join(temp_data_dir, population_file.filename)
-    population_file.save(filename)
-
-    data = json.load(open(filename, "r"))
+    # parse the upload in memory, no temp file round-trip
+    data = json_loads(population_file.read())
     population_type = normalize_population_username_type(
         data.get("population_data", {}).get("username_type")
         or request.form.get("upload_population_type")
@@ -1069,104 +1078,110 @@ def upload_population():
         username_type=population_type,
     )
     db.session.add(population)
-    db.session.commit()
+    db.session.flush()
 
-    # add the agents to the database
-    for a in data.get("agents", []):
-        # check if the agent already exists
-        agent = Agent.query.filter_by(name=a["name"]).first()
-        if not agent:
-            # Resolve activity_profile by name if provided
-            activity_profile_id = None
-            if a.get("activity_profile"):
-                activity_profile_obj = ActivityProfile.query.filter_by(
-                    name=a["activity_profile"]
-                ).first()
-                if activity_profile_obj:
-                    activity_profile_id = activity_profile_obj.id
-
-            agent = Agent(
-                name=a["name"],
-                ag_type=a["ag_type"],
-                leaning=a["leaning"],
-                oe=a["oe"],
-                co=a["co"],
-                ex=a["ex"],
-                ag=a["ag"],
-                ne=a["ne"],
-                language=a["language"],
-                education_level=a["education"],
-                round_actions=a["round_actions"],
-                nationality=a["nationality"],
-                toxicity=a["toxicity"],
-                age=a["age"],
-                gender=a["gender"],
-                crecsys=a["crecsys"],
-                frecsys=a["frecsys"],
-                profile_pic=a["profile_pic"],
-                cover_image=a.get("cover_image", ""),
-                daily_activity_level=a.get("daily_activity_level", 1),
-                profession=a.get("profession", ""),
-                activity_profile=activity_profile_id,
-            )
-            db.session.add(agent)
-            db.session.commit()
-
-            if a.get("profile"):
-                agent_profile = Agent_Profile(agent_id=agent.id, profile=a["profile"])
-                db.session.add(agent_profile)
-                db.session.commit()
-            feature_entries = feature_entries_from_population_agent_payload(a)
-            if feature_entries:
-                replace_agent_custom_features(agent.id, feature_entries)
-                db.session.commit()
-        else:
-            feature_entries = feature_entries_from_population_agent_payload(a)
-            if feature_entries:
-                replace_agent_custom_features(agent.id, feature_entries)
-                db.session.commit()
-
-        agent_population = Agent_Population(
-            agent_id=agent.id, population_id=population.id
-        )
-        db.session.add(agent_population)
-        db.session.commit()
+    # existing names are resolved once; the lowest id wins, as with .first()
+    agent_ids = dict(
+        db.session.query(Agent.name, Agent.id).order_by(Agent.id.desc()).all()
+    )
+    page_ids = dict(db.session.query(Page.name, Page.id).order_by(Page.id.desc()).all())
+    profile_ids = dict(db.session.query(ActivityProfile.name, ActivityProfile.id))
+
+    # add the agents that do not exist yet
+    agents_data = data.get("agents", [])
+    new_agents = {}
+    new_profiles = {}
+    for a in agents_data:
+        if a["name"] in agent_ids or a["name"] in new_agents:
+            continue
+        new_agents[a["name"]] = {
+            "name": a["name"],
+            "ag_type": a["ag_type"],
+            "leaning": a["leaning"],
+            "oe": a["oe"],
+            "co": a["co"],
+            "ex": a["ex"],
+            "ag": a["ag"],
+            "ne": a["ne"],
+            "language": a["language"],
+            "education_level": a["education"],
+            "round_actions": a["round_actions"],
+            "nationality": a["nationality"],
+            "toxicity": a["toxicity"],
+            "age": a["age"],
+            "gender": a["gender"],
+            "crecsys": a["crecsys"],
+            "frecsys": a["frecsys"],
+            "profile_pic": a["profile_pic"],
+            "cover_image": a.get("cover_image", ""),
+            "daily_activity_level": a.get("daily_activity_level", 1),
+            "profession": a.get("profession", ""),
+            "activity_profile": profile_ids.get(a.get("activity_profile")),
+        }
+        if a.get("profile"):
+            new_profiles[a["name"]] = a["profile"]
+
+    _insert_named_rows(Agent, list(new_agents.values()), agent_ids)
+    db.session.bulk_insert_mappings(
+        Agent_Profile,
+        [
+            {"agent_id": agent_ids[name], "profile": profile}
+            for name, profile in new_profiles.items()
+        ],
+    )
 
-    # add the pages to the database
-    for p in data.get("pages", []):
-        # check if the page already exists
-        page = Page.query.filter_by(name=p["name"]).first()
-        if not page:
-            # Resolve activity_profile by name if provided
-            page_activity_profile_id = None
-            if p.get("activity_profile"):
-                page_activity_profile_obj = ActivityProfile.query.filter_by(
-                    name=p["activity_profile"]
-                ).first()
-                if page_activity_profile_obj:
-                    page_activity_profile_id = page_activity_profile_obj.id
-
-            page = Page(
-                name=p["name"],
-                descr=p["descr"],
-                page_type=p["page_type"],
-                feed=p["feed"],
-                keywords=p["keywords"],
-                logo=p["logo"],
-                pg_type=p["pg_type"],
-                leaning=p["leaning"],
-                activity_profile=page_activity_profile_id,
-            )
-            db.session.add(page)
-            db.session.commit()
+    for a in agents_data:
+        feature_entries = feature_entries_from_population_agent_payload(a)
+        if feature_entries:
+            replace_agent_custom_features(agent_ids[a["name"]], feature_entries)
 
-        page_population = Page_Population(page_id=page.id, population_id=population.id)
-        db.session.add(page_population)
-        db.session.commit()
+    db.session.bulk_insert_mappings(
+        Agent_Population,
+        [
+            {"agent_id": agent_ids[a["name"]], "population_id": population.id}
+            for a in agents_data
+        ],
+    )
+
+    # add the pages that do not exist yet
+    pages_data = data.get("pages", [])
+    new_pages = {}
+    for p in pages_data:
+        if p["name"] in page_ids or p["name"] in new_pages:
+            continue
+        new_pages[p["name"]] = {
+            "name": p["name"],
+            "descr": p["descr"],
+            "page_type": p["page_type"],
+            "feed": p["feed"],
+            "keywords": p["keywords"],
+            "logo": p["logo"],
+            "pg_type": p["pg_type"],
+            "leaning": p["leaning"],
+            "activity_profile": profile_ids.get(p.get("activity_profile")),
+        }
+
+    _insert_named_rows(Page, list(new_pages.values()), page_ids)
+    db.session.bulk_insert_mappings(
+        Page_Population,
+        [
+            {"page_id": page_ids[p["name"]], "population_id": population.id}
+            for p in pages_data
+        ],
+    )
+
+    db.session.commit()
 
     return redirect(request.referrer)
 
 
+def _population_agent_ids(population_id):
+    """Subquery selecting the ids of the agents of a population."""
+    return db.session.query(Agent_Population.agent_id).filter(
+        Agent_Population.population_id == population_id
+    )
+
+
 @population.route("/admin/update_population_recsys/<int:uid>", methods=["POST"])
 @login_required
 def update_recsys(uid):
@@ -1178,15 +1193,12 @@ def update_recsys(uid):
 
     # get populations for client uid
     population = Population.query.filter_by(id=uid).first()
-    # get agents for the populations
-    agents = Agent_Population.query.filter_by(population_id=uid).all()
 
-    # updating the recommenders of the agents in the specific simulation instance (not in the population)
-    for agent in agents:
-        ag = Agent.query.filter_by(id=agent.agent_id).first()
-        ag.frecsys = frecsys_type
-        ag.crecsys = recsys_type
-        db.session.commit()
+    # update the recommenders of all the population's agents in one statement
+    Agent.query.filter(Agent.id.in_(_population_agent_ids(uid))).update(
+        {Agent.frecsys: frecsys_type, Agent.crecsys: recsys_type},
+        synchronize_session=False,
+    )
 
     population.crecsys = recsys_type
     population.frecsys = frecsys_type
@@ -1205,13 +1217,11 @@ def update_llm(uid):
 
     # get populations for client uid
     population = Population.query.filter_by(id=uid).first()
-    # get agents for the populations
-    agents = Agent_Population.query.filter_by(population_id=population.id).all()
 
-    for agent in agents:
-        ag = Agent.query.filter_by(id=agent.agent_id).first()
-        ag.ag_type = user_type
-        db.session.commit()
+    # update the agent type of all the population's agents in one statement
+    Agent.query.filter(Agent.id.in_(_population_agent_ids(population.id))).update(
+        {Agent.ag_type: user_type}, synchronize_session=False
+    )
 
     population.llm = user_type
 
@@ -1306,43 +1316,82 @@ def merge_populations():
     ).all()
     unique_page_ids = set(pp.page_id for pp in page_populations)
 
-    # Fetch all unique agents to aggregate their properties
+    # the merged agents, selected by subquery rather than a bound id per agent
+    merged_agents = Agent.id.in_(
+        db.session.query(Agent_Population.agent_id).filter(
+            Agent_Population.population_id.in_(population_ids)
+        )
+    )
+
+    # Age range is computed by the database (NULL ages are ignored)
+    age_min, age_max = (
+        db.session.query(func.min(Agent.age), func.max(Agent.age))
+        .filter(merged_agents)
+        .one()
+    )
+
+    # Fetch only the agent columns that are aggregated below, as plain rows
     agents = (
-        Agent.query.filter(Agent.id.in_(unique_agent_ids)).all()
-        if unique_agent_ids
-        else []
+        db.session.query(
+            Agent.education_level,
+            Agent.leaning,
+            Agent.nationality,
+            Agent.language,
+            Agent.toxicity,
+            Agent.ag_type,
+            Agent.crecsys,
+            Agent.frecsys,
+        )
+        .filter(merged_agents)
+        .all()
     )
 
-    # Aggregate properties from all agents
-    ages = [a.age for a in agents if a.age is not None]
-    age_min = min(ages) if ages else None
-    age_max = max(ages) if ages else None
+    # Aggregate properties from all agents in a single pass over the rows
+    education_set = set()
+    leanings_set = set()
+    nationalities_set = set()
+    languages_set = set()
+    toxicity_set = set()
+    llm_ctr = Counter()
+    crecsys_ctr = Counter()
+    frecsys_ctr = Counter()
+    for (
+        education_level,
+        leaning,
+        nationality,
+        language,
+        agent_toxicity,
+        ag_type,
+        agent_crecsys,
+        agent_frecsys,
+    ) in agents:
+        if education_level:
+            education_set.add(education_level)
+        if leaning:
+            leanings_set.add(leaning)
+        if nationality:
+            nationalities_set.add(nationality)
+        if language:
+            languages_set.add(language)
+        if agent_toxicity:
+            toxicity_set.add(agent_toxicity)
+        if ag_type:
+            llm_ctr[ag_type] += 1
+        if agent_crecsys:
+            crecsys_ctr[agent_crecsys] += 1
+        if agent_frecsys:
+            frecsys_ctr[agent_frecsys] += 1
 
-    education_set = set(a.education_level for a in agents if a.education_level)
     education_levels = ",".join(sorted(education_set)) if education_set else None
-
-    leanings_set = set(a.leaning for a in agents if a.leaning)
     leanings = ",".join(sorted(leanings_set)) if leanings_set else None
-
-    nationalities_set = set(a.nationality for a in agents if a.nationality)
     nationalities = ",".join(sorted(nationalities_set)) if nationalities_set else None
-
-    languages_set = set(a.language for a in agents if a.language)
     languages = ",".join(sorted(languages_set)) if languages_set else None
-
-    toxicity_set = set(a.toxicity for a in agents if a.toxicity)
     toxicity = ",".join(sorted(toxicity_set)) if toxicity_set else None
 
-    # Get most common LLM type
-    llm_types = [a.ag_type for a in agents if a.ag_type]
-    llm = max(set(llm_types), key=llm_types.count) if llm_types else None
-
-    # Get most common recommendation systems
-    crecsys_list = [a.crecsys for a in agents if a.crecsys]
-    crecsys = max(set(crecsys_list), key=crecsys_list.count) if crecsys_list else None
-
-    frecsys_list = [a.frecsys for a in agents if a.frecsys]
-    frecsys = max(set(frecsys_list), key=frecsys_list.count) if frecsys_list else None
+    # Get most common LLM type and recommendation systems
+    llm = llm_ctr.most_common(1)[0][0] if llm_ctr else None
+    crecsys = crecsys_ctr.most_common(1)[0][0] if crecsys_ctr else None
+    frecsys = frecsys_ctr.most_common(1)[0][0] if frecsys_ctr else None
 
     # Aggregate interests from source populations
     interests_set = set()
@@ -1381,19 +1430,21 @@ def merge_populations():
     db.session.add(merged_population)
     db.session.flush()  # Flush to get the ID without committing
 
-    # Add unique agents to the new population
-    for agent_id in unique_agent_ids:
-        agent_population = Agent_Population(
-            agent_id=agent_id, population_id=merged_population.id
-        )
-        db.session.add(agent_population)
-
-    # Add unique pages to the new population
-    for page_id in unique_page_ids:
-        page_population = Page_Population(
-            page_id=page_id, population_id=merged_population.id
-        )
-        db.session.add(page_population)
+    # Add unique agents and pages to the new population, one executemany each
+    db.session.bulk_insert_mappings(
+        Agent_Population,
+        [
+            {"agent_id": agent_id, "population_id": merged_population.id}
+            for agent_id in unique_agent_ids
+        ],
+    )
+    db.session.bulk_insert_mappings(
+        Page_Population,
+        [
+            {"page_id": page_id, "population_id": merged_population.id}
+            for page_id in unique_page_ids
+        ],
+    )
 
     # Single commit for all operations to ensure atomicity
     db.session.commit()
@@ -24,6 +24,7 @@ from flask_login import current_user, login_required
 from werkzeug.security import generate_password_hash
 
 from y_web import db  # , app
+from y_web.routes.admin.sub.experiments._helpers import _apply_sort
 from y_web.src.content.cover_images import random_cover_image_url
 from y_web.src.llm.vllm_manager import get_llm_models
 from y_web.src.models import Admin_users, Exps, User_Experiment, User_mgmt
@@ -35,6 +36,13 @@ from y_web.src.system.miscellanea import (
 
 users = Blueprint("users", __name__)
 
+# users_data table column ids -> Admin_users columns they sort by
+_ADMIN_USER_SORT_COLUMNS = {
+    "username": Admin_users.username,
+    "role": Admin_users.role,
+    "email": Admin_users.email,
+}
+
 # Validation pattern constants for consistency between server and client
 PASSWORD_SPECIAL_CHARS_PATTERN = r"[!@#$%^&*(),.?\":{}|<>_\-+=\[\]\\\/;'`~]"
 EMAIL_PATTERN = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
@@ -106,19 +114,7 @@ def users_data():
 
     # sorting
     sort = request.args.get("sort")
-    if sort:
-        order = []
-        for s in sort.split(","):
-            direction = s[0]
-            name = s[1:]
-            if name not in ["username", "role", "email"]:
-                name = "name"
-            col = getattr(Admin_users, name)
-            if direction == "-":
-                col = col.desc()
-            order.append(col)
-        if order:
-            query = query.order_by(*order)
+    query = _apply_sort(query, sort, _ADMIN_USER_SORT_COLUMNS)
 
     # pagination
     start = request.args.get("start", type=int, default=-1)
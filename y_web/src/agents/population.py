@@ -443,20 +443,21 @@ def generate_population(
 
         agents_to_insert.append(agent)
 
-    # Bulk insert all agents in a single transaction
+    # Bulk insert all agents in a single transaction; return_defaults fetches
+    # each generated id, which is the only safe way to learn them here since
+    # agent names are not unique and other inserts may run concurrently
     db.session.bulk_save_objects(agents_to_insert, return_defaults=True)
     db.session.flush()
 
-    # Now create Agent_Population relationships in bulk
-    agent_populations_to_insert = []
-    for agent in agents_to_insert:
-        agent_population = Agent_Population(
-            agent_id=agent.id, population_id=population.id
-        )
-        agent_populations_to_insert.append(agent_population)
-
-    # Bulk insert all agent-population relationships
-    db.session.bulk_save_objects(agent_populations_to_insert)
+    # Bulk insert all agent-population relationships with one executemany;
+    # return_defaults above already set each agent's generated id
+    db.session.bulk_insert_mappings(
+        Agent_Population,
+        [
+            {"agent_id": agent.id, "population_id": population.id}
+            for agent in agents_to_insert
+        ],
+    )
     db.session.commit()
 
 
@@ -59,6 +59,7 @@ from y_web.src.llm.ollama_manager import (  # noqa: F401
     start_ollama_server,
 )
 from y_web.src.llm.vllm_manager import (  # noqa: F401
+    forget_llm_models,
     get_llm_models,
     get_vllm_models,
     is_vllm_installed,
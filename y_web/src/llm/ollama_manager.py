@@ -72,9 +72,26 @@ def start_ollama_server():
 
 
 def pull_ollama_model(model_name):
-    """Handle pull ollama model operation."""
+    """
+    Start downloading an Ollama model in a background process.
+
+    Returns as soon as the download process is spawned; progress is written to
+    ``Ollama_Pull`` by the child. A second request for a model whose download
+    is still running does not start another one.
+
+    Args:
+        model_name: Name of model to download
+    """
+    # forget downloads that have finished since the last request
+    for name, process in list(ollama_processes.items()):
+        if not process.is_alive():
+            ollama_processes.pop(name, None)
+
+    if model_name in ollama_processes:
+        return
+
     if is_ollama_running():
-        process = Process(target=start_ollama_pull, args=(model_name,))
+        process = Process(target=start_ollama_pull, args=(model_name,), daemon=True)
         process.start()
         ollama_processes[model_name] = process
 
@@ -156,11 +173,11 @@ def delete_model_pull(model_name):
     Args:
         model_name: Name of model to cancel download for
     """
-    if model_name in ollama_processes:
-        process = ollama_processes[model_name]
+    process = ollama_processes.pop(model_name, None)
+    if process is not None:
         process.terminate()
-        process.join()
+        # do not hold the request if the download process is slow to exit
+        process.join(timeout=5)
 
-    model = Ollama_Pull.query.filter_by(model_name=model_name).first()
-    db.session.delete(model)
+    Ollama_Pull.query.filter_by(model_name=model_name).delete()
     db.session.commit()
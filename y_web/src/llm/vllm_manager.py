@@ -14,6 +14,11 @@ from urllib.parse import urlparse
 
 import requests
 
+# seconds a model listing is reused before the LLM server is asked again
+_LLM_MODELS_TTL_SECONDS = 30.0
+# llm_url -> (time.monotonic() of the lookup, list of model names)
+_llm_models_cache = {}
+
 
 def is_vllm_installed():
     """Check if a supported embedded vLLM runtime is installed in the current environment."""
@@ -75,6 +80,7 @@ def start_vllm_server(model_name=None):
                 subprocess.run(screen_command, shell=True, check=True)
                 # Wait for the server to start
                 time.sleep(10)
+                _forget_llm_caches()
             else:
                 print(
                     "vLLM is installed but not running. Please start manually with a model."
@@ -85,6 +91,16 @@ def start_vllm_server(model_name=None):
         print("vLLM is not installed.")
 
 
+def _forget_llm_caches():
+    """Drop the cached backend status and model listings after a server start."""
+    from y_web.src.system.miscellanea import (  # noqa: PLC0415
+        forget_llm_backend_status,
+    )
+
+    forget_llm_backend_status()
+    forget_llm_models()
+
+
 def get_vllm_models():
     """
     Get list of models available on vLLM server.
@@ -118,6 +134,10 @@ def get_llm_models(llm_url=None):
         llm_url: Base URL of the LLM server (e.g., 'http://localhost:8000/v1').
                  If None, uses LLM_URL from environment or falls back to ollama.
 
+    The listing of each URL is reused for ``_LLM_MODELS_TTL_SECONDS``, so
+    admin pages that render the model picker do not query the server (and
+    wait on its timeouts) on every request.
+
     Returns:
         List of model names available on the LLM server
     """
@@ -133,6 +153,24 @@ def get_llm_models(llm_url=None):
             else:
                 llm_url = "http://127.0.0.1:11434/v1"
 
+    now = time.monotonic()
+    cached = _llm_models_cache.get(llm_url)
+    if cached and now - cached[0] < _LLM_MODELS_TTL_SECONDS:
+        return list(cached[1])
+
+    models = _fetch_llm_models(llm_url)
+    _llm_models_cache[llm_url] = (now, models)
+    return list(models)
+
+
+def forget_llm_models():
+    """Drop the cached model listings after models were pulled or deleted."""
+    _llm_models_cache.clear()
+
+
+def _fetch_llm_models(llm_url):
+    """Query the LLM server at ``llm_url`` for its model names."""
+
     def _candidate_model_endpoints(raw_url):
         base_url = str(raw_url or "").rstrip("/")
         if not base_url:
@@ -162,6 +162,11 @@ class ExperimentScheduleItem(db.Model):
 
     __bind_key__ = "db_admin"
     __tablename__ = "experiment_schedule_items"
+    __table_args__ = (
+        db.UniqueConstraint(
+            "group_id", "experiment_id", name="uq_sched_item_group_exp"
+        ),
+    )
     id = db.Column(db.Integer, primary_key=True)
     group_id = db.Column(
         db.Integer,
@@ -212,6 +217,7 @@ class Exp_stats(db.Model):
 
     __bind_key__ = "db_admin"
     __tablename__ = "exp_stats"
+    __table_args__ = (db.Index("ix_exp_stats_exp", "exp_id"),)
     id = db.Column(db.Integer, primary_key=True)
     exp_id = db.Column(db.Integer, db.ForeignKey("exps.idexp"), nullable=False)
     rounds = db.Column(db.Integer, nullable=False)
@@ -322,6 +328,7 @@ class Agent_Population(db.Model):
 
     __bind_key__ = "db_admin"
     __tablename__ = "agent_population"
+    __table_args__ = (db.Index("ix_agent_population_population", "population_id"),)
     id = db.Column(db.Integer, primary_key=True)
     agent_id = db.Column(db.Integer, db.ForeignKey("agents.id"), nullable=False)
     population_id = db.Column(
@@ -407,6 +414,10 @@ class Population_Experiment(db.Model):
 
     __bind_key__ = "db_admin"
     __tablename__ = "population_experiment"
+    __table_args__ = (
+        db.Index("ix_population_experiment_exp", "id_exp"),
+        db.Index("ix_population_experiment_population", "id_population"),
+    )
     id = db.Column(db.Integer, primary_key=True)
     id_population = db.Column(
         db.Integer, db.ForeignKey("population.id"), nullable=False
@@ -419,6 +430,7 @@ class Page_Population(db.Model):
 
     __bind_key__ = "db_admin"
     __tablename__ = "page_population"
+    __table_args__ = (db.Index("ix_page_population_population", "population_id"),)
     id = db.Column(db.Integer, primary_key=True)
     page_id = db.Column(db.Integer, db.ForeignKey("pages.id"), nullable=False)
     population_id = db.Column(
@@ -431,6 +443,7 @@ class User_Experiment(db.Model):
 
     __bind_key__ = "db_admin"
     __tablename__ = "user_experiment"
+    __table_args__ = (db.Index("ix_user_experiment_user_exp", "user_id", "exp_id"),)
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("admin_users.id"), nullable=False)
     exp_id = db.Column(db.Integer, db.ForeignKey("exps.idexp"), nullable=False)
@@ -448,6 +461,7 @@ class Client(db.Model):
 
     __bind_key__ = "db_admin"
     __tablename__ = "client"
+    __table_args__ = (db.Index("ix_client_exp", "id_exp"),)
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(50), nullable=False)
     descr = db.Column(db.String(200))
@@ -514,6 +528,7 @@ class Client_Execution(db.Model):
 
     __bind_key__ = "db_admin"
     __tablename__ = "client_execution"
+    __table_args__ = (db.Index("ix_client_execution_client", "client_id"),)
     id = db.Column(db.Integer, primary_key=True)
     client_id = db.Column(db.Integer, db.ForeignKey("client.id"), nullable=False)
     elapsed_time = db.Column(db.Integer, default=0)
@@ -548,6 +563,7 @@ class Jupyter_instances(db.Model):
 
     __bind_key__ = "db_admin"
     __tablename__ = "jupyter_instances"
+    __table_args__ = (db.Index("ix_jupyter_instances_exp", "exp_id"),)
     id = db.Column(db.Integer, primary_key=True)
     exp_id = db.Column(db.Integer, db.ForeignKey("exps.idexp"), nullable=False)
     port = db.Column(db.Integer, nullable=False)
@@ -115,6 +115,7 @@ class Exp_Topic(db.Model):
 
     __bind_key__ = "db_admin"
     __tablename__ = "exp_topic"
+    __table_args__ = (db.Index("ix_exp_topic_exp", "exp_id"),)
     id = db.Column(db.Integer, primary_key=True)
     exp_id = db.Column(db.Integer, db.ForeignKey("exps.idexp"), nullable=False)
     topic_id = db.Column(db.Integer, db.ForeignKey("topic_list.id"), nullable=False)
@@ -159,6 +160,9 @@ class PopulationActivityProfile(db.Model):
 
     __bind_key__ = "db_admin"
     __tablename__ = "population_activity_profile"
+    __table_args__ = (
+        db.Index("ix_population_activity_profile_population", "population"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     population = db.Column(
@@ -0,0 +1,66 @@
+"""
+JSON helpers for high-frequency endpoints and large JSON files.
+
+Serializes with ``orjson`` when it is installed and falls back to the standard
+library ``json`` module otherwise, so the dependency stays optional.
+"""
+
+import json
+
+from flask import Response
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_dumps(payload, indent=False):
+    """
+    Serialize *payload* to UTF-8 encoded JSON bytes.
+
+    Args:
+        payload: JSON-serializable object (string keys only)
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
+def json_loads(data):
+    """
+    Parse a JSON document given as ``bytes`` or ``str``.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Parsed object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_response(payload, status=200):
+    """
+    Build an ``application/json`` response for *payload*.
+
+    Args:
+        payload: JSON-serializable object (string keys only)
+        status: HTTP status code
+
+    Returns:
+        Flask Response with the compact JSON body
+    """
+    return Response(json_dumps(payload), status=status, mimetype="application/json")
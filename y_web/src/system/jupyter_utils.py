@@ -134,6 +134,62 @@ def get_jupyter_instances():
     return instances
 
 
+# pid -> (time.monotonic() of the check, running); dashboard polls from several
+# admins reuse a check instead of re-reading /proc every time
+_PID_STATUS_TTL_SECONDS = 2.0
+_pid_status_cache = {}
+
+
+def pids_running(pids):
+    """
+    Return ``{pid: running}`` for JupyterLab process ids.
+
+    A pid counts as running when it exists and is not a zombie. Results are
+    reused for ``_PID_STATUS_TTL_SECONDS``; pids needing a fresh check share
+    one ``psutil.pids()`` listing, and only live ones get a status read.
+
+    Args:
+        pids: Iterable of integer process ids
+
+    Returns:
+        dict: Mapping of each pid to a bool
+    """
+    import psutil
+
+    now = time.monotonic()
+    result = {}
+    stale = []
+    for pid in pids:
+        cached = _pid_status_cache.get(pid)
+        if cached and now - cached[0] < _PID_STATUS_TTL_SECONDS:
+            result[pid] = cached[1]
+        else:
+            stale.append(pid)
+    if not stale:
+        return result
+
+    for pid, (checked_at, _) in list(_pid_status_cache.items()):
+        if now - checked_at >= _PID_STATUS_TTL_SECONDS:
+            _pid_status_cache.pop(pid, None)
+
+    live_pids = set(psutil.pids())
+    for pid in stale:
+        is_running = False
+        if pid in live_pids:
+            try:
+                is_running = psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+            except psutil.NoSuchProcess:
+                pass
+        _pid_status_cache[pid] = (now, is_running)
+        result[pid] = is_running
+    return result
+
+
+def forget_pid_status(pid):
+    """Drop the cached running state of ``pid`` after it has been stopped."""
+    _pid_status_cache.pop(pid, None)
+
+
 def find_instance_by_notebook_dir(notebook_dir):
     """Find an instance with the specified notebook directory"""
     instances = db.session.query(Jupyter_instances).all()
@@ -230,7 +286,9 @@ def ensure_kernel_installed(kernel_name="python3_ysocial"):
         return False
 
 
-def start_jupyter(expid, notebook_dir=None, current_host=None, current_port=5000):
+def start_jupyter(
+    expid, notebook_dir=None, current_host=None, current_port=5000, db_name=None
+):
     """Start Jupyter Lab server.
 
     Args:
@@ -238,6 +296,8 @@ def start_jupyter(expid, notebook_dir=None, current_host=None, current_port=5000
         notebook_dir: Path to notebook directory. If None, uses default.
         current_host: Flask app host
         current_port: Flask app port
+        db_name: Experiment ``db_name`` when the caller already loaded it.
+            If None, it is read from the Exps table.
 
     Returns:
         tuple: (success, message, instance_id)
@@ -281,15 +341,15 @@ def start_jupyter(expid, notebook_dir=None, current_host=None, current_port=5000
     if port is None:
         return False, "No free ports available", None
 
-    exp = db.session.query(Exps).filter_by(idexp=expid).first()
+    if db_name is None:
+        db_name = db.session.query(Exps.db_name).filter_by(idexp=expid).scalar()
 
-    if "database_server.db" in exp.db_name:
-        db_name = f"y_web{os.sep}{exp.db_name}"  # SQLite path
+    if "database_server.db" in db_name:
+        db_name = f"y_web{os.sep}{db_name}"  # SQLite path
         sqlite = True
     else:
-        name = exp.db_name
         db_name = current_app.config["SQLALCHEMY_DATABASE_URI"].replace(
-            "dashboard", name
+            "dashboard", db_name
         )
         sqlite = False
 
@@ -532,6 +592,7 @@ def start_jupyter(expid, notebook_dir=None, current_host=None, current_port=5000
 
 
 def stop_process(pid, instance_id):
+    forget_pid_status(pid)
     try:
         import psutil
 
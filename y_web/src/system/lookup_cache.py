@@ -0,0 +1,99 @@
+"""
+Cache for small, rarely changing admin lookup tables.
+
+Leanings, activity profiles, topics and populations are listed on most admin
+page renders. ``lookup_rows`` keeps their column values per application for
+``LOOKUP_CACHE_TTL_SECONDS`` and drops a table's entry as soon as a session
+of this process that inserted, updated or deleted one of its rows through
+the ORM commits. Writes from other workers or processes, and raw SQL writes,
+are only picked up when the entry expires.
+"""
+
+import time
+
+from flask import current_app
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from y_web import db
+
+LOOKUP_CACHE_TTL_SECONDS = 30
+
+_EXTENSION_KEY = "lookup_cache"
+_DIRTY_KEY = "lookup_cache_dirty"
+
+# table name -> generation, bumped on every committed ORM write
+_generations = {}
+
+
+def _mark_dirty(mapper, connection, target):
+    """Remember the written table on the session until it commits."""
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_DIRTY_KEY, set()).add(mapper.local_table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_dirty_tables(session):
+    for table_name in session.info.pop(_DIRTY_KEY, ()):
+        _generations[table_name] = _generations.get(table_name, 0) + 1
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_dirty_tables(session):
+    session.info.pop(_DIRTY_KEY, None)
+
+
+def _watch(model):
+    """Register the write listeners for *model* the first time it is cached."""
+    table_name = model.__table__.name
+    if table_name not in _generations:
+        _generations[table_name] = 0
+        for name in ("after_insert", "after_update", "after_delete"):
+            event.listen(model, name, _mark_dirty)
+    return table_name
+
+
+def lookup_rows(model, *columns):
+    """
+    Return the rows of the lookup table mapped by *model* as plain values.
+
+    Rows are read-only named tuples, not ORM instances, so they can be shared
+    between requests without touching any session.
+
+    Args:
+        model: Mapped class of a small lookup table (e.g. ``Leanings``)
+        *columns: Mapped attributes to select (e.g. ``Leanings.leaning``);
+            every column attribute of *model* when omitted
+
+    Returns:
+        List of rows whose attributes are named after the selected columns
+    """
+    if not columns:
+        columns = tuple(
+            getattr(model, attr.key) for attr in model.__mapper__.column_attrs
+        )
+    table_name = _watch(model)
+    generation = _generations[table_name]
+    cache = current_app.extensions.setdefault(_EXTENSION_KEY, {})
+    key = (table_name, tuple(column.key for column in columns))
+    now = time.monotonic()
+
+    cached = cache.get(key)
+    if (
+        cached is not None
+        and cached[0] == generation
+        and now - cached[1] < LOOKUP_CACHE_TTL_SECONDS
+    ):
+        return cached[2]
+
+    # no autoflush: pending changes of this request must not reach the cache
+    with db.session.no_autoflush:
+        rows = db.session.query(*columns).all()
+    cache[key] = (generation, now, rows)
+    return rows
+
+
+def clear_lookup_cache():
+    """Drop every cached lookup table of the current application."""
+    current_app.extensions.pop(_EXTENSION_KEY, None)
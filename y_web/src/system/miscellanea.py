@@ -5,8 +5,10 @@ Provides helper functions for privilege checking, user session management,
 database connection testing, and Ollama LLM service status checking.
 """
 
-from flask import redirect, url_for
-from flask_login import login_user
+import time
+
+from flask import g, has_app_context, redirect, url_for
+from flask_login import current_user, login_user
 
 from y_web import db
 from y_web.src.models import (
@@ -15,6 +17,35 @@ from y_web.src.models import (
 )
 
 
+def get_admin_user(username):
+    """
+    Look up an admin account, memoized for the current request.
+
+    Results are cached on ``flask.g`` so repeated privilege checks and
+    user lookups within one request hit the database only once.
+
+    Args:
+        username: Username to look up
+
+    Returns:
+        Admin_users instance, or None if no such account exists
+    """
+    cache = g.setdefault("_admin_users", {})
+    if username not in cache:
+        cache[username] = Admin_users.query.filter_by(username=username).first()
+    return cache[username]
+
+
+def current_admin():
+    """
+    Return the Admin_users row of the logged-in user for this request.
+
+    Returns:
+        Admin_users instance, or None if the user has no admin account
+    """
+    return get_admin_user(current_user.username)
+
+
 def check_privileges(username):
     """
     Verify if a user has admin or researcher privileges.
@@ -25,7 +56,7 @@ def check_privileges(username):
     Returns:
         Redirect to main.index if not admin/researcher, None if authorized
     """
-    user = Admin_users.query.filter_by(username=username).first()
+    user = get_admin_user(username)
 
     if user.role not in ["admin", "researcher"]:
         return redirect(url_for("main.index"))
@@ -59,32 +90,82 @@ def _lazy_llm_helpers():
 
 def ollama_status():
     """
-    Check Ollama LLM service status.
+    Check Ollama LLM service status, memoized for the current request.
+
+    Repeated calls within one request (e.g. a route handler and a helper it
+    delegates to) reuse the first probe instead of querying the Ollama
+    server again.
 
     Returns:
         Dictionary with 'status' (running) and 'installed' boolean flags
     """
+    if has_app_context() and "_ollama_status" in g:
+        return g._ollama_status
+
     is_ollama_installed, is_ollama_running, _, _ = _lazy_llm_helpers()
 
-    return {
+    status = {
         "status": is_ollama_running(),
         "installed": is_ollama_installed(),
     }
+    if has_app_context():
+        g._ollama_status = status
+    return status
+
+
+# seconds a probed LLM backend status is reused across requests
+_LLM_BACKEND_STATUS_TTL_SECONDS = 30.0
+# (LLM_BACKEND, LLM_URL) -> (time.monotonic() of the probe, status dict)
+_llm_backend_status_cache = {}
 
 
 def llm_backend_status():
+    """
+    Check LLM backend service status, memoized for the current request.
+
+    Returns:
+        Dictionary with 'backend', 'url', 'status' (running), and 'installed' boolean flags
+    """
+    if has_app_context() and "_llm_backend_status" in g:
+        return g._llm_backend_status
+
+    status = _probe_llm_backend_status()
+    if has_app_context():
+        g._llm_backend_status = status
+    return status
+
+
+def _probe_llm_backend_status():
     """
     Check LLM backend service status based on LLM_BACKEND environment variable.
 
+    The result for a given LLM_BACKEND/LLM_URL pair is reused across requests
+    for ``_LLM_BACKEND_STATUS_TTL_SECONDS``.
+
     Returns:
         Dictionary with 'backend', 'url', 'status' (running), and 'installed' boolean flags
     """
     import os
 
-    import requests
+    key = (os.getenv("LLM_BACKEND"), os.getenv("LLM_URL"))
+    now = time.monotonic()
+    cached = _llm_backend_status_cache.get(key)
+    if cached and now - cached[0] < _LLM_BACKEND_STATUS_TTL_SECONDS:
+        return dict(cached[1])
+
+    status = _check_llm_backend_status(*key)
+    _llm_backend_status_cache[key] = (now, status)
+    return dict(status)
 
-    backend = os.getenv("LLM_BACKEND")
-    llm_url = os.getenv("LLM_URL")
+
+def forget_llm_backend_status():
+    """Drop the cached backend status after the LLM server was started."""
+    _llm_backend_status_cache.clear()
+
+
+def _check_llm_backend_status(backend, llm_url):
+    """Probe the LLM backend configured by ``backend`` and ``llm_url``."""
+    import requests
 
     # No backend specified
     if backend is None:
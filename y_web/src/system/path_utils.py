@@ -8,6 +8,12 @@ or from a PyInstaller bundle.
 import os
 import sys
 
+# Repository root when running from source, resolved once at import time
+# y_web/src/system/path_utils.py → y_web/src/system → y_web/src → y_web → repo root
+_SOURCE_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
 
 def get_base_path():
     """
@@ -26,11 +32,7 @@ def get_base_path():
         return sys._MEIPASS
     else:
         # Running from source
-        # Get the repository root (three levels up from this file's location
-        # y_web/src/system/path_utils.py → y_web/src/system/ → y_web/src/ → y_web/ → repo root)
-        return os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        )
+        return _SOURCE_ROOT
 
 
 def get_data_schema_path():
@@ -101,10 +103,7 @@ def get_writable_path(relative_path=""):
         base = str(base)
     else:
         # Running from source - use repository root
-        # y_web/src/system/path_utils.py → y_web/src/system → y_web/src → y_web → repo root
-        base = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        )
+        base = _SOURCE_ROOT
 
     if relative_path:
         return os.path.join(base, relative_path)
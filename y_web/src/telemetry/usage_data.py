@@ -4,6 +4,7 @@ import re
 import shutil
 import sys
 import tempfile
+import threading
 import traceback
 import zipfile
 from datetime import datetime, timezone
@@ -122,6 +123,19 @@ class Telemetry(object):
         except:
             return False
 
+    def log_event_async(self, data):
+        """
+        Log event data on a daemon thread so the caller does not wait on the network
+        :param data:
+        :return: the started thread, or None when telemetry is disabled
+        """
+        if not self.enabled:
+            return None
+
+        thread = threading.Thread(target=self.log_event, args=(data,), daemon=True)
+        thread.start()
+        return thread
+
     def log_stack_trace(self, data):
         """
         Log stack trace data to telemetry server using endpoints
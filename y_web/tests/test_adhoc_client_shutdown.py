@@ -75,13 +75,6 @@ def test_stop_experiment_also_stops_adhoc_clients_when_exp_already_marked_stoppe
     app = Flask(__name__)
     experiment = SimpleNamespace(idexp=8, running=0)
 
-    class _FakeExpsQuery:
-        def filter_by(self, **kwargs):
-            return self
-
-        def first(self):
-            return experiment
-
     stopped = []
 
     monkeypatch.setattr(mod, "check_privileges", lambda username: None)
@@ -98,11 +91,22 @@ def test_stop_experiment_also_stops_adhoc_clients_when_exp_already_marked_stoppe
         "stop_all_adhoc_clients",
         lambda exp, pause=False: stopped.append((exp.idexp, pause)),
     )
-    monkeypatch.setattr(mod, "Exps", SimpleNamespace(query=_FakeExpsQuery()))
-    monkeypatch.setattr(mod, "experiment_details", lambda uid: f"details:{uid}")
+    monkeypatch.setattr(
+        mod,
+        "db",
+        SimpleNamespace(
+            session=SimpleNamespace(
+                get=lambda model, pk: experiment if pk == experiment.idexp else None
+            )
+        ),
+    )
+    monkeypatch.setattr(
+        mod, "url_for", lambda endpoint, uid: f"/admin/experiment_details/{uid}"
+    )
 
     with app.test_request_context("/admin/stop_experiment/8"):
         result = mod.stop_experiment.__wrapped__(8)
 
-    assert result == "details:8"
+    assert result.status_code == 303
+    assert result.location == "/admin/experiment_details/8"
     assert stopped == [(8, False)]
@@ -1,5 +1,7 @@
 """Tests for bulk experiment download visibility filtering."""
 
+import io
+import zipfile
 from types import SimpleNamespace
 
 import pytest
@@ -93,3 +95,46 @@ def test_bulk_download_group_payload_is_scoped_by_visible_query(monkeypatch):
     )
 
     assert resolved == [1, 2]
+
+
+def test_bulk_zip_nests_experiment_archives_without_temp_files(monkeypatch, tmp_path):
+    """Each experiment zip is written straight into the bulk archive."""
+    experiments = [
+        SimpleNamespace(idexp=1, exp_name="exp one"),
+        SimpleNamespace(idexp=2, exp_name="exp one"),
+    ]
+    for exp in experiments:
+        folder = tmp_path / f"f{exp.idexp}"
+        (folder / "sub").mkdir(parents=True)
+        (folder / "sub" / "data.json").write_text(str(exp.idexp))
+
+    experiments_by_id = {exp.idexp: exp for exp in experiments}
+    monkeypatch.setattr(
+        _notifications,
+        "db",
+        SimpleNamespace(
+            session=SimpleNamespace(get=lambda model, pk: experiments_by_id.get(pk))
+        ),
+    )
+    monkeypatch.setattr(_notifications, "_get_database_type", lambda: "sqlite")
+    monkeypatch.setattr(
+        _notifications,
+        "_get_experiment_folder",
+        lambda base, exp, db_type: str(tmp_path / f"f{exp.idexp}"),
+    )
+    monkeypatch.setattr(
+        "y_web.src.system.path_utils.get_writable_path", lambda: str(tmp_path)
+    )
+
+    output = tmp_path / "bulk.zip"
+    assert (
+        _notifications._build_bulk_experiments_zip([1, 2, 3], str(output))
+        == "experiments.zip"
+    )
+
+    with zipfile.ZipFile(output) as bulk:
+        assert sorted(bulk.namelist()) == ["exp one.zip", "exp one_2.zip"]
+        with zipfile.ZipFile(io.BytesIO(bulk.read("exp one_2.zip"))) as inner:
+            assert sorted(inner.namelist()) == ["sub/", "sub/data.json"]
+            assert inner.read("sub/data.json") == b"2"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["bulk.zip", "f1", "f2"]
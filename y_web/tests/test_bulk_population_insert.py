@@ -15,7 +15,7 @@ pytestmark = pytest.mark.unit
 
 
 def test_generate_population_uses_bulk_insert():
-    """Test that generate_population uses bulk_save_objects for efficiency."""
+    """Test that generate_population uses bulk inserts instead of per-row adds."""
 
     # Create mock population
     mock_population = MagicMock()
@@ -109,8 +109,12 @@ def test_generate_population_uses_bulk_insert():
         # Call the function
         generate_population("test_pop", mock_percentages, mock_actions_config)
 
-        # Verify bulk_save_objects was called (should be called twice: once for agents, once for relationships)
-        assert mock_session.bulk_save_objects.call_count == 2
+        # Agents are saved with their generated ids fetched back
+        mock_session.bulk_save_objects.assert_called_once()
+        assert mock_session.bulk_save_objects.call_args[1] == {"return_defaults": True}
+
+        # Relationships are inserted with one executemany
+        assert mock_session.bulk_insert_mappings.call_count == 1
 
         # Verify commit was called only once at the end (not per agent)
         assert mock_session.commit.call_count == 1
@@ -204,19 +208,82 @@ def test_bulk_insert_preserves_agent_count():
         # Call the function
         generate_population("test_pop", mock_percentages, mock_actions_config)
 
-        # Get the first call to bulk_save_objects (agents)
+        # Get the call to bulk_save_objects (agents)
         first_call = mock_session.bulk_save_objects.call_args_list[0]
         agents_list = first_call[0][0]  # First positional argument
 
         # Verify correct number of agents were created
         assert len(agents_list) == 5
 
-        # Get the second call to bulk_save_objects (relationships)
-        second_call = mock_session.bulk_save_objects.call_args_list[1]
-        relationships_list = second_call[0][0]
+        # Get the call to bulk_insert_mappings (relationships)
+        second_call = mock_session.bulk_insert_mappings.call_args_list[0]
+        relationships_list = second_call[0][1]
 
         # Verify correct number of relationships were created
         assert len(relationships_list) == 5
+        assert {r["population_id"] for r in relationships_list} == {1}
+
+
+def test_generate_population_links_exactly_the_generated_agents(app):
+    """Agent_Population rows point at the new agents, never at existing ones."""
+    from y_web import db
+    from y_web.src.models import (
+        AgeClass,
+        Agent,
+        Agent_Population,
+        Education,
+        Leanings,
+        Population,
+        Profession,
+        Toxicity_Levels,
+    )
+
+    with app.app_context():
+        age_class = AgeClass(name="Adult", age_start=30, age_end=40)
+        education = Education(education_level="Bachelor")
+        leaning = Leanings(leaning="neutral")
+        toxicity = Toxicity_Levels(toxicity_level="none")
+        db.session.add_all(
+            [
+                age_class,
+                education,
+                leaning,
+                toxicity,
+                Profession(profession="Engineer", background="STEM"),
+                Agent(name="outsider"),
+                Population(
+                    name="generated",
+                    descr="d",
+                    size=4,
+                    llm="user",
+                    nationalities="American",
+                    languages="en",
+                ),
+            ]
+        )
+        db.session.commit()
+        percentages = {
+            "age_classes": {str(age_class.id): 100.0},
+            "education": {str(education.id): 100.0},
+            "political_leanings": {str(leaning.id): 100.0},
+            "toxicity_levels": {str(toxicity.id): 100.0},
+            "gender": {"male": 50, "female": 50},
+        }
+
+        generate_population(
+            "generated", percentages, {"min": "1", "max": "5", "distribution": "x"}
+        )
+
+        population = Population.query.filter_by(name="generated").one()
+        linked_ids = sorted(
+            link.agent_id
+            for link in Agent_Population.query.filter_by(population_id=population.id)
+        )
+        generated_ids = sorted(
+            agent.id for agent in Agent.query.filter(Agent.name != "outsider")
+        )
+        assert len(linked_ids) == 4
+        assert linked_ids == generated_ids
 
 
 if __name__ == "__main__":
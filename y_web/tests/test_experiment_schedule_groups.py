@@ -318,5 +318,105 @@ def test_available_schedule_payload_excludes_completed_experiments():
     assert [item["id"] for item in payload] == [4]
 
 
+def test_next_order_index_is_computed_inside_insert(app):
+    """Order indexes are assigned by the INSERT itself, starting at 1."""
+    from y_web import db
+    from y_web.routes.admin.sub.experiments._schedule import _next_order_index
+    from y_web.src.models import ExperimentScheduleGroup, ExperimentScheduleItem
+
+    with app.app_context():
+        for name in ("first", "second"):
+            db.session.add(
+                ExperimentScheduleGroup(
+                    name=name,
+                    order_index=_next_order_index(ExperimentScheduleGroup.order_index),
+                )
+            )
+            db.session.commit()
+
+        groups = ExperimentScheduleGroup.query.order_by(
+            ExperimentScheduleGroup.id
+        ).all()
+        assert [g.order_index for g in groups] == [1, 2]
+
+        for group in groups:
+            db.session.add(
+                ExperimentScheduleItem(
+                    group_id=group.id,
+                    experiment_id=1,
+                    order_index=_next_order_index(
+                        ExperimentScheduleItem.order_index,
+                        ExperimentScheduleItem.group_id == group.id,
+                    ),
+                )
+            )
+        db.session.commit()
+
+        items = ExperimentScheduleItem.query.all()
+        assert [item.order_index for item in items] == [1, 1]
+
+
+def test_schedule_item_is_unique_per_group(app):
+    """Adding the same experiment twice to a group violates the unique constraint."""
+    from sqlalchemy.exc import IntegrityError
+
+    from y_web import db
+    from y_web.src.models import ExperimentScheduleGroup, ExperimentScheduleItem
+
+    with app.app_context():
+        group = ExperimentScheduleGroup(name="g", order_index=1)
+        db.session.add(group)
+        db.session.commit()
+
+        db.session.add(ExperimentScheduleItem(group_id=group.id, experiment_id=7))
+        db.session.commit()
+
+        db.session.add(ExperimentScheduleItem(group_id=group.id, experiment_id=7))
+        with pytest.raises(IntegrityError):
+            db.session.commit()
+        db.session.rollback()
+
+        assert ExperimentScheduleItem.query.count() == 1
+
+
+def test_schedule_item_unique_migration_collapses_duplicates(tmp_path):
+    """The SQLite migration removes duplicate rows and is idempotent."""
+    import sqlite3
+
+    from y_web.migrations.add_schedule_item_unique_constraint import migrate_sqlite
+
+    db_path = tmp_path / "dashboard.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE experiment_schedule_items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            group_id INTEGER NOT NULL,
+            experiment_id INTEGER NOT NULL,
+            order_index INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO experiment_schedule_items (group_id, experiment_id) VALUES (?, ?)",
+        [(1, 5), (1, 5), (1, 6), (2, 5)],
+    )
+    conn.commit()
+    conn.close()
+
+    assert migrate_sqlite(str(db_path)) is True
+    assert migrate_sqlite(str(db_path)) is True
+
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        "SELECT id, group_id, experiment_id FROM experiment_schedule_items ORDER BY id"
+    ).fetchall()
+    with pytest.raises(sqlite3.IntegrityError):
+        conn.execute(
+            "INSERT INTO experiment_schedule_items (group_id, experiment_id) VALUES (1, 6)"
+        )
+    conn.close()
+
+    assert rows == [(1, 1, 5), (3, 1, 6), (4, 2, 5)]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
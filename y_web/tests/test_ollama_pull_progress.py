@@ -0,0 +1,103 @@
+"""
+Tests for the Ollama model pull progress endpoints.
+"""
+
+import importlib
+import json
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def ollama_client(app, monkeypatch):
+    ollama_mod = importlib.import_module("y_web.routes.admin.sub.ollama")
+
+    monkeypatch.setattr(ollama_mod, "PULL_PROGRESS_STREAM_INTERVAL", 0)
+    app.config["LOGIN_DISABLED"] = True
+    app.register_blueprint(ollama_mod.ollama)
+    return app.test_client()
+
+
+def test_pull_progress_stream_reports_completion_and_clears_the_row(app, ollama_client):
+    """A finished pull yields one 100% event and only its own row is removed."""
+    from y_web import db
+    from y_web.src.models import Ollama_Pull
+
+    with app.app_context():
+        db.session.add(Ollama_Pull(model_name="llama3", status=1.0))
+        db.session.add(Ollama_Pull(model_name="mistral", status=0.5))
+        db.session.commit()
+
+    response = ollama_client.get("/admin/pull_progress_stream/llama3")
+
+    assert response.mimetype == "text/event-stream"
+    events = [
+        json.loads(line[len("data: ") :])
+        for line in response.get_data(as_text=True).splitlines()
+        if line.startswith("data: ")
+    ]
+    assert events == [{"progress": 100, "model_name": "llama3"}]
+    with app.app_context():
+        assert [p.model_name for p in Ollama_Pull.query.all()] == ["mistral"]
+
+
+def test_pull_progress_poll_only_removes_the_finished_model(app, ollama_client):
+    """Polling a finished pull commits the removal of that model's row only."""
+    from y_web import db
+    from y_web.src.models import Ollama_Pull
+
+    with app.app_context():
+        db.session.add(Ollama_Pull(model_name="llama3", status=1.0))
+        db.session.add(Ollama_Pull(model_name="mistral", status=0.5))
+        db.session.commit()
+
+    response = ollama_client.get("/admin/pull_progress/llama3")
+    assert json.loads(response.data) == {"progress": 100, "model_name": "llama3"}
+
+    response = ollama_client.get("/admin/pull_progress/mistral")
+    assert json.loads(response.data) == {"progress": 50, "model_name": "mistral"}
+
+    with app.app_context():
+        assert [p.model_name for p in Ollama_Pull.query.all()] == ["mistral"]
+
+
+def test_pull_progress_stream_ends_when_no_pull_row_appears(
+    app, ollama_client, monkeypatch
+):
+    """A model without a progress row does not keep the stream open."""
+    ollama_mod = importlib.import_module("y_web.routes.admin.sub.ollama")
+
+    monkeypatch.setattr(ollama_mod, "PULL_PROGRESS_STREAM_START_TIMEOUT", 0)
+
+    response = ollama_client.get("/admin/pull_progress_stream/typo")
+
+    assert response.get_data(as_text=True) == ""
+
+
+def test_pull_progress_stream_sends_keepalives_then_ends_when_stalled(
+    app, ollama_client, monkeypatch
+):
+    """A stalled pull gets keepalive comments and ends after the idle timeout."""
+    from y_web import db
+    from y_web.src.models import Ollama_Pull
+
+    ollama_mod = importlib.import_module("y_web.routes.admin.sub.ollama")
+
+    monkeypatch.setattr(ollama_mod, "PULL_PROGRESS_STREAM_INTERVAL", 0.01)
+    monkeypatch.setattr(ollama_mod, "PULL_PROGRESS_STREAM_IDLE_TIMEOUT", 0.1)
+    monkeypatch.setattr(ollama_mod, "PULL_PROGRESS_STREAM_KEEPALIVE_INTERVAL", 0)
+
+    with app.app_context():
+        db.session.add(Ollama_Pull(model_name="llama3", status=0.5))
+        db.session.commit()
+
+    body = ollama_client.get("/admin/pull_progress_stream/llama3").get_data(
+        as_text=True
+    )
+
+    assert body.startswith('data: {"progress": 50, "model_name": "llama3"}')
+    assert ": keepalive" in body
+    with app.app_context():
+        assert Ollama_Pull.query.count() == 1
@@ -0,0 +1,109 @@
+"""
+Tests for the admin pages table endpoint.
+"""
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+def test_pages_data_resolves_activity_profile_names_in_one_query(app):
+    """Pages with and without an activity profile report the profile name list."""
+    from y_web import db
+    from y_web.routes.admin.sub.pages import pages_data
+    from y_web.src.models import ActivityProfile, Page
+
+    app.config["LOGIN_DISABLED"] = True
+    with app.app_context():
+        profile = ActivityProfile(name="Always On", hours="8,9,10")
+        db.session.add(profile)
+        db.session.commit()
+        db.session.add(
+            Page(name="news", page_type="news", logo="", activity_profile=profile.id)
+        )
+        db.session.add(Page(name="blog", page_type="news", logo=""))
+        db.session.commit()
+
+        with app.test_request_context("/admin/pages_data?sort=%2Bname"):
+            res = pages_data().get_json()
+
+    assert res["total"] == 2
+    assert [(row["name"], row["activity_profile"]) for row in res["data"]] == [
+        ("blog", []),
+        ("news", ["Always On"]),
+    ]
+
+
+def test_upload_page_collection_dedupes_names_against_one_preload(app, monkeypatch):
+    """Known (name, feed) pairs are skipped and clashing names get a suffix."""
+    import importlib
+    import io
+    import json
+    from types import SimpleNamespace
+
+    from y_web import db
+    from y_web.src.models import ActivityProfile, Page
+
+    pages_mod = importlib.import_module("y_web.routes.admin.sub.pages")
+
+    monkeypatch.setattr(pages_mod, "current_user", SimpleNamespace(username="admin"))
+    monkeypatch.setattr(pages_mod, "check_privileges", lambda username: None)
+    app.config["LOGIN_DISABLED"] = True
+    app.register_blueprint(pages_mod.pages)
+
+    with app.app_context():
+        db.session.add(ActivityProfile(name="Always On", hours="8,9,10"))
+        db.session.add(Page(name="news", page_type="news", feed="http://a"))
+        db.session.commit()
+
+    def entry(name, feed, profile=None):
+        return {
+            "name": name,
+            "descr": "",
+            "page_type": "news",
+            "feed": feed,
+            "keywords": "",
+            "logo": "",
+            "pg_type": "",
+            "leaning": "",
+            "activity_profile": profile,
+        }
+
+    collection = [
+        entry("news", "http://a"),
+        entry("news", "http://b", "Always On"),
+        entry("news", "http://c"),
+    ]
+    response = app.test_client().post(
+        "/admin/upload_page_collection",
+        data={"collection": (io.BytesIO(json.dumps(collection).encode()), "p.json")},
+        headers={"Referer": "/admin/pages"},
+    )
+
+    assert response.status_code == 302
+    with app.app_context():
+        rows = {p.name: p for p in Page.query.all()}
+        assert sorted(rows) == ["news", "news_1", "news_2"]
+        assert rows["news_1"].feed == "http://b"
+        assert rows["news_1"].activity_profile is not None
+        assert rows["news_2"].activity_profile is None
+
+
+def test_pages_data_keyset_page_continues_after_the_given_id(app):
+    """after_id returns the next rows by id while total still counts all pages."""
+    from y_web import db
+    from y_web.routes.admin.sub.pages import pages_data
+    from y_web.src.models import Page
+
+    app.config["LOGIN_DISABLED"] = True
+    with app.app_context():
+        for i in range(5):
+            db.session.add(Page(name=f"page{i}", page_type="news", logo=""))
+        db.session.commit()
+        ids = [p.id for p in Page.query.order_by(Page.id)]
+
+        with app.test_request_context(f"/admin/pages_data?after_id={ids[1]}&length=2"):
+            res = pages_data().get_json()
+
+    assert [row["id"] for row in res["data"]] == ids[2:4]
+    assert res["total"] == 5
@@ -180,6 +180,124 @@ def test_population_pop_type_migration_registered_in_startup_runner():
     assert "Failed to run population pop_type migration" in content
 
 
+def test_schedule_item_unique_constraint_migration_module_exists():
+    """The schedule item unique constraint migration module must be present."""
+    mod = importlib.import_module(
+        "y_web.migrations.add_schedule_item_unique_constraint"
+    )
+    assert callable(getattr(mod, "migrate_sqlite", None))
+    assert callable(getattr(mod, "migrate_postgresql", None))
+
+
+def test_schedule_item_unique_constraint_migration_registered_in_startup_runner():
+    """run_migrations must invoke the schedule item unique constraint migration."""
+    path = Path("/Users/rossetti/PycharmProjects/YWeb/y_web/db_init/migrations.py")
+    content = path.read_text(encoding="utf-8")
+    assert "add_schedule_item_unique_constraint" in content
+    assert "Failed to run schedule item unique constraint migration" in content
+
+
+def test_experiment_lookup_indexes_migration_module_exists():
+    """The experiment lookup indexes migration module must be present."""
+    mod = importlib.import_module("y_web.migrations.add_experiment_lookup_indexes")
+    assert callable(getattr(mod, "migrate_sqlite", None))
+    assert callable(getattr(mod, "migrate_postgresql", None))
+
+
+def test_experiment_lookup_indexes_migration_registered_in_startup_runner():
+    """run_migrations must invoke the experiment lookup indexes migration."""
+    path = Path("/Users/rossetti/PycharmProjects/YWeb/y_web/db_init/migrations.py")
+    content = path.read_text(encoding="utf-8")
+    assert "add_experiment_lookup_indexes" in content
+    assert "Failed to run experiment lookup indexes migration" in content
+
+
+def test_experiment_lookup_indexes_migration_sqlite(tmp_path):
+    """The migration indexes existing tables, skips missing ones and is idempotent."""
+    import sqlite3
+
+    from y_web.migrations.add_experiment_lookup_indexes import migrate_sqlite
+
+    db_path = tmp_path / "dashboard.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE client (id INTEGER PRIMARY KEY, id_exp INTEGER)")
+    conn.execute(
+        "CREATE TABLE user_experiment "
+        "(id INTEGER PRIMARY KEY, user_id INTEGER, exp_id INTEGER)"
+    )
+    conn.commit()
+    conn.close()
+
+    assert migrate_sqlite(str(db_path)) is True
+    assert migrate_sqlite(str(db_path)) is True
+
+    conn = sqlite3.connect(db_path)
+    indexes = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+    }
+    conn.close()
+    assert {"ix_client_exp", "ix_user_experiment_user_exp"} <= indexes
+    assert "ix_exp_stats_exp" not in indexes
+
+
+def test_search_trigram_indexes_migration_module_exists():
+    """The search trigram indexes migration module must be present."""
+    mod = importlib.import_module("y_web.migrations.add_search_trigram_indexes")
+    assert callable(getattr(mod, "migrate_postgresql", None))
+
+
+def test_search_trigram_indexes_migration_registered_in_startup_runner():
+    """run_migrations must invoke the search trigram indexes migration."""
+    path = Path("/Users/rossetti/PycharmProjects/YWeb/y_web/db_init/migrations.py")
+    content = path.read_text(encoding="utf-8")
+    assert "add_search_trigram_indexes" in content
+    assert "Failed to run search trigram indexes migration" in content
+
+
+def test_population_lookup_indexes_migration_module_exists():
+    """The population lookup indexes migration module must be present."""
+    mod = importlib.import_module("y_web.migrations.add_population_lookup_indexes")
+    assert callable(getattr(mod, "migrate_sqlite", None))
+    assert callable(getattr(mod, "migrate_postgresql", None))
+
+
+def test_population_lookup_indexes_migration_registered_in_startup_runner():
+    """run_migrations must invoke the population lookup indexes migration."""
+    path = Path("/Users/rossetti/PycharmProjects/YWeb/y_web/db_init/migrations.py")
+    content = path.read_text(encoding="utf-8")
+    assert "add_population_lookup_indexes" in content
+    assert "Failed to run population lookup indexes migration" in content
+
+
+def test_population_lookup_indexes_migration_sqlite(tmp_path):
+    """The migration indexes existing tables, skips missing ones and is idempotent."""
+    import sqlite3
+
+    from y_web.migrations.add_population_lookup_indexes import migrate_sqlite
+
+    db_path = tmp_path / "dashboard.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE agent_population "
+        "(id INTEGER PRIMARY KEY, agent_id INTEGER, population_id INTEGER)"
+    )
+    conn.commit()
+    conn.close()
+
+    assert migrate_sqlite(str(db_path)) is True
+    assert migrate_sqlite(str(db_path)) is True
+
+    conn = sqlite3.connect(db_path)
+    indexes = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+    }
+    conn.close()
+    assert "ix_agent_population_population" in indexes
+    assert "ix_page_population_population" not in indexes
+
+
 def test_agents_custom_features_migration_module_exists():
     """The agents_custom_features migration module must be present."""
     mod = importlib.import_module("y_web.migrations.add_agents_custom_features_table")
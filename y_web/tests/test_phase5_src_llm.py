@@ -106,3 +106,32 @@ class TestLegacyShimIdentity:
         from y_web.src.llm.ollama_manager import ollama_processes as op2
 
         assert op2 is ollama_processes
+
+
+class TestOllamaPullProcesses:
+    def test_pull_does_not_start_a_second_download_for_the_same_model(
+        self, monkeypatch
+    ):
+        from unittest.mock import MagicMock
+
+        from y_web.src.llm import ollama_manager
+
+        started = []
+
+        def fake_process(target, args, daemon):
+            process = MagicMock()
+            process.is_alive.return_value = True
+            process.start.side_effect = lambda: started.append(args)
+            return process
+
+        monkeypatch.setattr(ollama_manager, "ollama_processes", {})
+        monkeypatch.setattr(ollama_manager, "is_ollama_running", lambda: True)
+        monkeypatch.setattr(ollama_manager, "Process", fake_process)
+
+        ollama_manager.pull_ollama_model("llama3")
+        ollama_manager.pull_ollama_model("llama3")
+        assert started == [("llama3",)]
+
+        ollama_manager.ollama_processes["llama3"].is_alive.return_value = False
+        ollama_manager.pull_ollama_model("llama3")
+        assert started == [("llama3",), ("llama3",)]
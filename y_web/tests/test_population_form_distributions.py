@@ -1,6 +1,9 @@
 import pytest
 
-from y_web.routes.admin.sub.populations import _normalize_percentage_distribution
+from y_web.routes.admin.sub.populations import (
+    _load_form_json,
+    _normalize_percentage_distribution,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -19,3 +22,9 @@ def test_normalize_percentage_distribution_preserves_valid_selected_values():
     )
 
     assert distribution == {"1": 35.0, "2": 42.0, "3": 23.0}
+
+
+def test_load_form_json_falls_back_per_field():
+    assert _load_form_json('{"1": 60, "2": 40}', {}) == {"1": 60, "2": 40}
+    assert _load_form_json("{not json", {}) == {}
+    assert _load_form_json("", []) == []
@@ -0,0 +1,601 @@
+"""
+Tests for the admin population routes.
+"""
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def population_client(app, monkeypatch, tmp_path):
+    """Client for the population blueprint with privilege checks bypassed."""
+    from types import SimpleNamespace
+
+    from y_web.routes.admin.sub import populations as populations_mod
+    from y_web.src.system import path_utils
+
+    monkeypatch.setattr(
+        populations_mod, "current_user", SimpleNamespace(username="admin")
+    )
+    monkeypatch.setattr(populations_mod, "check_privileges", lambda username: None)
+    monkeypatch.setattr(path_utils, "get_writable_path", lambda: str(tmp_path))
+    app.config["LOGIN_DISABLED"] = True
+    app.register_blueprint(populations_mod.population)
+    return app.test_client()
+
+
+def _agent(name, profile=None, activity_profile=None):
+    return {
+        "name": name,
+        "ag_type": "llm",
+        "leaning": "left",
+        "oe": "",
+        "co": "",
+        "ex": "",
+        "ag": "",
+        "ne": "",
+        "language": "en",
+        "education": "",
+        "round_actions": 3,
+        "nationality": "",
+        "toxicity": "",
+        "age": 30,
+        "gender": "",
+        "crecsys": "",
+        "frecsys": "",
+        "profile_pic": "",
+        "profile": profile,
+        "activity_profile": activity_profile,
+    }
+
+
+def test_upload_population_reuses_existing_agents_and_pages(app, population_client):
+    """Known names link to the existing rows; new ones are inserted once."""
+    import io
+    import json
+
+    from y_web import db
+    from y_web.src.models import (
+        ActivityProfile,
+        Agent,
+        Agent_Population,
+        Agent_Profile,
+        Page,
+        Page_Population,
+        Population,
+    )
+
+    with app.app_context():
+        db.session.add(ActivityProfile(name="Always On", hours="8,9,10"))
+        db.session.add(Agent(name="alice"))
+        db.session.add(Page(name="news", page_type="news"))
+        db.session.commit()
+        alice_id = Agent.query.filter_by(name="alice").one().id
+        news_id = Page.query.filter_by(name="news").one().id
+
+    payload = {
+        "population_data": {"name": "imported", "descr": ""},
+        "agents": [
+            _agent("alice"),
+            _agent("bob", profile="likes cats", activity_profile="Always On"),
+            _agent("bob"),
+        ],
+        "pages": [
+            {
+                "name": name,
+                "descr": "",
+                "page_type": "news",
+                "feed": "",
+                "keywords": "",
+                "logo": "",
+                "pg_type": "",
+                "leaning": "",
+            }
+            for name in ("news", "blog")
+        ],
+    }
+    response = population_client.post(
+        "/admin/upload_population",
+        data={"population_file": (io.BytesIO(json.dumps(payload).encode()), "p.json")},
+        headers={"Referer": "/admin/populations"},
+    )
+
+    assert response.status_code == 302
+    with app.app_context():
+        pop = Population.query.filter_by(name="imported").one()
+        bob = Agent.query.filter_by(name="bob").one()
+        assert bob.activity_profile is not None
+        assert Agent_Profile.query.filter_by(agent_id=bob.id).one().profile == (
+            "likes cats"
+        )
+        assert sorted(
+            ap.agent_id for ap in Agent_Population.query.filter_by(population_id=pop.id)
+        ) == sorted([alice_id, bob.id, bob.id])
+
+        blog = Page.query.filter_by(name="blog").one()
+        assert Page.query.count() == 2
+        assert sorted(
+            pp.page_id for pp in Page_Population.query.filter_by(population_id=pop.id)
+        ) == sorted([news_id, blog.id])
+
+
+def test_delete_population_removes_its_agent_links(app, population_client, monkeypatch):
+    """The population and its Agent_Population rows go in one commit."""
+    from y_web import db
+    from y_web.routes.admin.sub import populations as populations_mod
+    from y_web.src.models import Agent, Agent_Population, Population
+
+    with app.app_context():
+        pop = Population(name="doomed", descr="")
+        other = Population(name="kept", descr="")
+        agent = Agent(name="alice")
+        db.session.add_all([pop, other, agent])
+        db.session.flush()
+        db.session.add_all(
+            [
+                Agent_Population(agent_id=agent.id, population_id=pop.id),
+                Agent_Population(agent_id=agent.id, population_id=other.id),
+            ]
+        )
+        db.session.commit()
+        pop_id, other_id = pop.id, other.id
+
+    monkeypatch.setattr(populations_mod, "populations", lambda: "")
+    response = population_client.get(f"/admin/delete_population/{pop_id}")
+
+    assert response.status_code == 200
+
+    with app.app_context():
+        assert db.session.get(Population, pop_id) is None
+        assert [ap.population_id for ap in Agent_Population.query.all()] == [other_id]
+
+
+def test_population_details_tallies_agent_distributions(
+    app, population_client, monkeypatch
+):
+    """Each histogram keeps first-seen label order; activity is sorted by level."""
+    from y_web import db
+    from y_web.routes.admin.sub import populations as populations_mod
+    from y_web.src.models import (
+        ActivityProfile,
+        AgeClass,
+        Agent,
+        Agent_Population,
+        Leanings,
+        Population,
+        PopulationActivityProfile,
+    )
+
+    rendered = {}
+
+    def fake_render(template, **context):
+        rendered.update(context)
+        return ""
+
+    monkeypatch.setattr(populations_mod, "render_template", fake_render)
+    monkeypatch.setattr(populations_mod, "get_llm_models", lambda: [])
+    monkeypatch.setattr(populations_mod, "llm_backend_status", lambda: {})
+
+    with app.app_context():
+        db.session.add_all(
+            [
+                Leanings(id=1, leaning="left"),
+                AgeClass(name="Young", age_start=18, age_end=29),
+                AgeClass(name="Adult", age_start=30, age_end=60),
+            ]
+        )
+        profile = ActivityProfile(name="Always On", hours="8,9,10")
+        pop = Population(name="p", descr="")
+        db.session.add_all([profile, pop])
+        db.session.flush()
+        agents = [
+            Agent(
+                name="a",
+                leaning="1",
+                age=20,
+                gender="f",
+                profession="dev",
+                daily_activity_level=3,
+                activity_profile=profile.id,
+                ag_type="llm",
+            ),
+            Agent(
+                name="b",
+                leaning="right",
+                age=40,
+                gender="m",
+                profession="ops",
+                daily_activity_level=1,
+                ag_type="llm",
+            ),
+            Agent(
+                name="c",
+                leaning="1",
+                age=45,
+                profession="ops",
+                daily_activity_level=3,
+                activity_profile=profile.id,
+                ag_type="bot",
+            ),
+        ]
+        db.session.add_all(agents)
+        db.session.flush()
+        db.session.add_all(
+            Agent_Population(agent_id=a.id, population_id=pop.id) for a in agents
+        )
+        db.session.add(
+            PopulationActivityProfile(
+                population=pop.id, activity_profile=profile.id, percentage=100.0
+            )
+        )
+        db.session.commit()
+        pop_id = pop.id
+
+    response = population_client.get(f"/admin/population_details/{pop_id}")
+
+    assert response.status_code == 200
+    data = rendered["data"]
+    assert data["leaning"] == {"leanings": ["left", "right"], "total": [2, 1]}
+    assert data["age"]["total"] == [1, 2]
+    assert data["gender"] == {"genders": ["f", "m"], "total": [1, 1]}
+    assert data["activity"] == {"activity": [1, 3], "total": [1, 2]}
+    assert data["professions"] == {"professions": ["ops", "dev"], "total": [2, 1]}
+    assert data["activity_profiles"] == {"profiles": ["Always On"], "total": [2]}
+    assert rendered["activity_profiles"] == {
+        "profiles": ["Always On"],
+        "assigned_count": [2],
+        "expected_pct": [100.0],
+    }
+
+
+def test_population_details_bins_ages_into_the_first_matching_class(
+    app, population_client, monkeypatch
+):
+    """Overlapping or shared-boundary age classes count an age once, first match."""
+    from y_web import db
+    from y_web.routes.admin.sub import populations as populations_mod
+    from y_web.src.models import AgeClass, Agent, Agent_Population, Population
+
+    rendered = {}
+
+    def fake_render(template, **context):
+        rendered.update(context)
+        return ""
+
+    monkeypatch.setattr(populations_mod, "render_template", fake_render)
+    monkeypatch.setattr(populations_mod, "get_llm_models", lambda: [])
+    monkeypatch.setattr(populations_mod, "llm_backend_status", lambda: {})
+
+    with app.app_context():
+        db.session.add_all(
+            [
+                AgeClass(name="Wide", age_start=18, age_end=60),
+                AgeClass(name="Narrow", age_start=30, age_end=35),
+                AgeClass(name="Senior", age_start=60, age_end=90),
+            ]
+        )
+        pop = Population(name="ages", descr="")
+        agents = [
+            Agent(name=f"a{age}", age=age, ag_type="llm") for age in (30, 40, 60, 70)
+        ]
+        db.session.add_all([pop, *agents])
+        db.session.flush()
+        db.session.add_all(
+            Agent_Population(agent_id=a.id, population_id=pop.id) for a in agents
+        )
+        db.session.commit()
+        pop_id = pop.id
+
+    response = population_client.get(f"/admin/population_details/{pop_id}")
+
+    assert response.status_code == 200
+    assert rendered["data"]["age"]["total"] == [3, 0, 1]
+
+
+def test_custom_population_details_lists_agent_rows(
+    app, population_client, monkeypatch
+):
+    """Custom populations render one row per agent with its profile name."""
+    from y_web import db
+    from y_web.routes.admin.sub import populations as populations_mod
+    from y_web.src.models import ActivityProfile, Agent, Agent_Population, Population
+
+    rendered = {}
+
+    def fake_render(template, **context):
+        rendered.update(context)
+        return ""
+
+    monkeypatch.setattr(populations_mod, "render_template", fake_render)
+
+    with app.app_context():
+        profile = ActivityProfile(name="Always On", hours="8,9,10")
+        pop = Population(name="bots", descr="", pop_type="bot")
+        agent = Agent(name="b1", ag_type="bot", daily_activity_level=2)
+        db.session.add_all([profile, pop, agent])
+        db.session.flush()
+        agent.activity_profile = profile.id
+        db.session.add(Agent_Population(agent_id=agent.id, population_id=pop.id))
+        db.session.commit()
+        pop_id, agent_id = pop.id, agent.id
+
+    response = population_client.get(f"/admin/population_details/{pop_id}")
+
+    assert response.status_code == 200
+    assert rendered["live_size"] == 1
+    assert rendered["agent_rows"] == [
+        {
+            "id": agent_id,
+            "name": "b1",
+            "ag_type": "bot",
+            "activity_profile": "Always On",
+            "daily_activity_level": 2,
+            "ext_fields": {},
+        }
+    ]
+
+
+def test_download_population_exports_profiles_and_activity_names(
+    app, population_client
+):
+    """The streamed export is one JSON document with resolved names."""
+    import json
+
+    from y_web import db
+    from y_web.src.models import (
+        ActivityProfile,
+        Agent,
+        Agent_Population,
+        Agent_Profile,
+        Page,
+        Page_Population,
+        Population,
+    )
+
+    with app.app_context():
+        profile = ActivityProfile(name="Always On", hours="8,9,10")
+        pop = Population(name="export", descr="d")
+        db.session.add_all([profile, pop])
+        db.session.flush()
+        alice = Agent(name="alice", activity_profile=profile.id)
+        bob = Agent(name="bob")
+        page = Page(name="news", page_type="news", activity_profile=profile.id)
+        db.session.add_all([alice, bob, page])
+        db.session.flush()
+        db.session.add_all(
+            [
+                Agent_Profile(agent_id=alice.id, profile="first"),
+                Agent_Profile(agent_id=alice.id, profile="second"),
+                Agent_Population(agent_id=alice.id, population_id=pop.id),
+                Agent_Population(agent_id=bob.id, population_id=pop.id),
+                Page_Population(page_id=page.id, population_id=pop.id),
+            ]
+        )
+        db.session.commit()
+        pop_id = pop.id
+
+    response = population_client.get(f"/admin/download_population/{pop_id}")
+
+    assert response.status_code == 200
+    exported = json.loads(response.data)
+    assert exported["population_data"]["name"] == "export"
+    assert [
+        (a["name"], a["profile"], a["activity_profile"]) for a in exported["agents"]
+    ] == [("alice", "first", "Always On"), ("bob", None, None)]
+    assert [p["activity_profile"] for p in exported["pages"]] == ["Always On"]
+
+
+def test_populations_data_lists_activity_profiles_per_population(
+    app, population_client
+):
+    """Activity profile names are grouped under the population they belong to."""
+    from y_web import db
+    from y_web.src.models import (
+        ActivityProfile,
+        Population,
+        PopulationActivityProfile,
+    )
+
+    with app.app_context():
+        day = ActivityProfile(name="Day", hours="9,10")
+        night = ActivityProfile(name="Night", hours="22,23")
+        first = Population(name="first", descr="d")
+        second = Population(name="second", descr="d")
+        empty = Population(name="third", descr="d")
+        db.session.add_all([day, night, first, second, empty])
+        db.session.flush()
+        db.session.add_all(
+            [
+                PopulationActivityProfile(
+                    population=first.id, activity_profile=day.id, percentage=50
+                ),
+                PopulationActivityProfile(
+                    population=first.id, activity_profile=night.id, percentage=50
+                ),
+                PopulationActivityProfile(
+                    population=second.id, activity_profile=night.id, percentage=100
+                ),
+            ]
+        )
+        db.session.commit()
+
+    response = population_client.get("/admin/populations_data")
+
+    assert response.status_code == 200
+    rows = {
+        row["name"]: row["activity_profiles"] for row in response.get_json()["data"]
+    }
+    assert sorted(rows["first"]) == ["Day", "Night"]
+    assert rows["second"] == ["Night"]
+    assert rows["third"] == []
+
+
+def test_join_csv_strips_entries_for_storage():
+    """Population id lists are stored without whitespace or empty entries."""
+    from y_web.routes.admin.sub.populations import _join_csv
+
+    assert _join_csv(["1", " 3 ", ""]) == "1,3"
+    assert _join_csv("Italian, American ,") == "Italian,American"
+    assert _join_csv(None) is None
+
+
+def test_populations_data_labels_stored_id_lists(app, population_client):
+    """Education ids map to labels, including rows stored with spaces."""
+    from y_web import db
+    from y_web.src.models import Education, Population
+
+    with app.app_context():
+        school = Education(education_level="High School")
+        college = Education(education_level="Bachelor")
+        db.session.add_all([school, college])
+        db.session.flush()
+        db.session.add(
+            Population(
+                name="legacy",
+                descr="d",
+                education=f"{school.id}, {college.id}, 99",
+            )
+        )
+        db.session.commit()
+
+    response = population_client.get("/admin/populations_data")
+
+    assert response.status_code == 200
+    (row,) = response.get_json()["data"]
+    assert row["education"] == ["High School", "Bachelor", "99"]
+
+
+def test_populations_data_keyset_page_continues_after_the_given_id(
+    app, population_client
+):
+    """after_id returns the next rows by id while total still counts all rows."""
+    from y_web import db
+    from y_web.src.models import Population
+
+    with app.app_context():
+        db.session.add_all([Population(name=f"pop{i}", descr="d") for i in range(5)])
+        db.session.commit()
+        ids = [p.id for p in Population.query.order_by(Population.id)]
+
+    response = population_client.get(
+        f"/admin/populations_data?after_id={ids[1]}&length=2"
+    )
+
+    assert response.status_code == 200
+    payload = response.get_json()
+    assert [row["id"] for row in payload["data"]] == ids[2:4]
+    assert payload["total"] == 5
+
+
+def test_update_population_recsys_and_llm_update_only_its_agents(
+    app, population_client
+):
+    """The bulk updates touch the population's agents and nobody else."""
+    from y_web import db
+    from y_web.src.models import Agent, Agent_Population, Population
+
+    with app.app_context():
+        pop = Population(name="target", descr="d")
+        member = Agent(name="member", ag_type="llm", crecsys="old", frecsys="old")
+        outsider = Agent(name="outsider", ag_type="llm", crecsys="old", frecsys="old")
+        db.session.add_all([pop, member, outsider])
+        db.session.flush()
+        db.session.add(Agent_Population(agent_id=member.id, population_id=pop.id))
+        db.session.commit()
+        pop_id = pop.id
+
+    response = population_client.post(
+        f"/admin/update_population_recsys/{pop_id}",
+        data={"recsys_type": "ReverseChrono", "frecsys_type": "Jaccard"},
+        headers={"Referer": "/admin/populations"},
+    )
+    assert response.status_code == 302
+    response = population_client.post(
+        f"/admin/update_population_llm/{pop_id}",
+        data={"user_type": "llama3"},
+        headers={"Referer": "/admin/populations"},
+    )
+    assert response.status_code == 302
+
+    with app.app_context():
+        member = Agent.query.filter_by(name="member").one()
+        outsider = Agent.query.filter_by(name="outsider").one()
+        pop = db.session.get(Population, pop_id)
+        assert (member.crecsys, member.frecsys, member.ag_type) == (
+            "ReverseChrono",
+            "Jaccard",
+            "llama3",
+        )
+        assert (outsider.crecsys, outsider.frecsys, outsider.ag_type) == (
+            "old",
+            "old",
+            "llm",
+        )
+        assert (pop.crecsys, pop.frecsys, pop.llm) == (
+            "ReverseChrono",
+            "Jaccard",
+            "llama3",
+        )
+
+
+def test_merge_populations_links_each_agent_and_page_once(
+    app, population_client, monkeypatch
+):
+    """Agents and pages shared by the merged populations are linked once."""
+    from y_web import db
+    from y_web.routes.admin.sub import populations as populations_mod
+    from y_web.src.models import (
+        Agent,
+        Agent_Population,
+        Page,
+        Page_Population,
+        Population,
+    )
+
+    monkeypatch.setattr(populations_mod, "populations", lambda: "merged")
+
+    with app.app_context():
+        first = Population(name="first", descr="d")
+        second = Population(name="second", descr="d")
+        shared = Agent(name="shared", age=30, ag_type="llama3", crecsys="A")
+        only_first = Agent(name="only_first", age=50, ag_type="llama3", crecsys="B")
+        only_second = Agent(name="only_second", age=20, ag_type="qwen", crecsys="A")
+        page = Page(name="news", page_type="news")
+        db.session.add_all([first, second, shared, only_first, only_second, page])
+        db.session.flush()
+        db.session.add_all(
+            [
+                Agent_Population(agent_id=shared.id, population_id=first.id),
+                Agent_Population(agent_id=only_first.id, population_id=first.id),
+                Agent_Population(agent_id=shared.id, population_id=second.id),
+                Agent_Population(agent_id=only_second.id, population_id=second.id),
+                Page_Population(page_id=page.id, population_id=first.id),
+                Page_Population(page_id=page.id, population_id=second.id),
+            ]
+        )
+        db.session.commit()
+        selected = f"{first.id},{second.id}"
+
+    response = population_client.post(
+        "/admin/merge_populations",
+        data={
+            "merged_population_name": "merged",
+            "selected_population_ids": selected,
+        },
+    )
+
+    assert response.status_code == 200
+    with app.app_context():
+        merged = Population.query.filter_by(name="merged").one()
+        agent_ids = [
+            link.agent_id
+            for link in Agent_Population.query.filter_by(population_id=merged.id)
+        ]
+        page_links = Page_Population.query.filter_by(population_id=merged.id).count()
+        assert len(agent_ids) == len(set(agent_ids)) == 3
+        assert page_links == 1
+        assert merged.size == 3
+        assert (merged.age_min, merged.age_max) == (20, 50)
+        assert merged.llm == "llama3"
+        assert merged.crecsys == "A"
@@ -295,6 +295,21 @@ class TestRoutesAdminRouteCounts:
         except ImportError as e:
             pytest.skip(f"Could not import pages blueprint: {e}")
 
+    def test_lab_routes_registered_once(self):
+        """Test that every JupyterLab rule is defined by a single view"""
+        from flask import Flask
+
+        try:
+            from y_web.routes.admin.sub.jupyterlab import lab
+        except ImportError as e:
+            pytest.skip(f"Could not import lab blueprint: {e}")
+
+        app = Flask(__name__)
+        app.register_blueprint(lab)
+        rules = [r.rule for r in app.url_map.iter_rules() if r.endpoint != "static"]
+
+        assert len(rules) == len(set(rules)) == 5
+
 
 class TestRoutesAdminFunctionality:
     """Test basic functionality verification for routes_admin"""
@@ -107,6 +107,51 @@ def test_stop_client_for_experiment_passes_terminal_state_for_hpc():
     assert mock_stop.call_args_list[1].kwargs == {"terminal_state": "paused"}
 
 
+def test_stop_running_clients_commits_once_and_keeps_unconfirmed_hpc():
+    """Running clients are stopped with a single commit; failed HPC stops stay running."""
+    from y_web.routes.admin.sub.experiments import _helpers
+
+    exp = MagicMock(simulator_type="HPC", idexp=1)
+    stopped = MagicMock(status=1, pid=None)
+    unconfirmed = MagicMock(status=1, pid=None)
+    idle = MagicMock(status=0, pid=None)
+
+    with (
+        patch.object(
+            _helpers, "stop_client_for_experiment", side_effect=[True, False]
+        ) as mock_stop,
+        patch.object(_helpers, "db") as mock_db,
+    ):
+        assert (
+            _helpers._stop_running_clients(exp, [stopped, unconfirmed, idle]) is False
+        )
+
+    assert mock_stop.call_count == 2
+    assert stopped.status == 0
+    assert unconfirmed.status == 1
+    assert idle.status == 0
+    mock_db.session.commit.assert_called_once()
+
+
+def test_started_once_uses_preloaded_client_executions():
+    """Preloaded Client_Execution rows are used instead of per-client queries."""
+    from y_web.routes.admin.sub.experiments import _helpers
+
+    exp = MagicMock(running=0, status=0, exp_status="stopped", idexp=1)
+    clients = [MagicMock(id=1), MagicMock(id=2)]
+    executions = {2: MagicMock(elapsed_time=3)}
+
+    with patch.object(_helpers, "Client_Execution") as mock_ce:
+        assert (
+            _helpers._experiment_has_started_once(
+                exp, clients=clients, executions=executions
+            )
+            is True
+        )
+
+    mock_ce.query.filter_by.assert_not_called()
+
+
 def test_simulator_type_check_patterns():
     """Test various simulator_type check patterns used in schedule functions."""
 
@@ -88,6 +88,52 @@ def _make_psutil_mock(occupied_ports=None):
     return mock_psutil
 
 
+# ---------------------------------------------------------------------------
+# pids_running (psutil mocked via sys.modules)
+# ---------------------------------------------------------------------------
+
+
+def test_pids_running_reuses_checks_within_ttl():
+    """One pid listing per refresh; dead pids never get a Process() lookup."""
+    from y_web.src.system import jupyter_utils
+
+    mock_psutil = MagicMock()
+    mock_psutil.NoSuchProcess = Exception
+    mock_psutil.pids.return_value = [10, 30]
+    mock_psutil.Process.return_value.status.side_effect = ["running", "zombie"]
+    mock_psutil.STATUS_ZOMBIE = "zombie"
+
+    with (
+        patch.dict(sys.modules, {"psutil": mock_psutil}),
+        patch.dict(jupyter_utils._pid_status_cache, clear=True),
+    ):
+        expected = {10: True, 20: False, 30: False}
+        assert jupyter_utils.pids_running([10, 20, 30]) == expected
+        assert jupyter_utils.pids_running([10, 20, 30]) == expected
+
+    mock_psutil.pids.assert_called_once()
+    assert [c.args for c in mock_psutil.Process.call_args_list] == [(10,), (30,)]
+
+
+def test_forget_pid_status_forces_a_fresh_check():
+    """A stopped pid is re-checked on the next call instead of served from cache."""
+    from y_web.src.system import jupyter_utils
+
+    mock_psutil = MagicMock()
+    mock_psutil.NoSuchProcess = Exception
+    mock_psutil.pids.side_effect = [[10], []]
+    mock_psutil.Process.return_value.status.return_value = "running"
+    mock_psutil.STATUS_ZOMBIE = "zombie"
+
+    with (
+        patch.dict(sys.modules, {"psutil": mock_psutil}),
+        patch.dict(jupyter_utils._pid_status_cache, clear=True),
+    ):
+        assert jupyter_utils.pids_running([10]) == {10: True}
+        jupyter_utils.forget_pid_status(10)
+        assert jupyter_utils.pids_running([10]) == {10: False}
+
+
 # ---------------------------------------------------------------------------
 # find_instance_by_notebook_dir (DB mocked)
 # The function returns the exp_id of the matching instance (not the ORM object)
@@ -130,3 +176,34 @@ def test_create_notebook_already_exists_returns_false(tmp_path):
     )
     assert result[0] is False
     assert "already exists" in result[1]
+
+
+# ---------------------------------------------------------------------------
+# lab routes — experiment lookup
+# ---------------------------------------------------------------------------
+
+
+def test_create_notebook_route_returns_404_for_unknown_experiment(app):
+    """A missing experiment is reported instead of raising on ``None.db_name``."""
+    from y_web.routes.admin.sub.jupyterlab import lab
+
+    app.config.update(LOGIN_DISABLED=True, ENABLE_NOTEBOOK=True)
+    app.register_blueprint(lab)
+
+    response = app.test_client().post("/admin/lab_create/999")
+
+    assert response.status_code == 404
+    assert response.get_json()["success"] is False
+
+
+def test_lab_routes_reject_non_integer_ids_at_routing(app):
+    """Non-numeric ids never reach the views and get a plain 404."""
+    from y_web.routes.admin.sub.jupyterlab import lab
+
+    app.config.update(LOGIN_DISABLED=True, ENABLE_NOTEBOOK=True)
+    app.register_blueprint(lab)
+    client = app.test_client()
+
+    assert client.get("/admin/lab_start/abc").status_code == 404
+    assert client.get("/admin/lab_stop/abc").status_code == 404
+    assert client.post("/admin/lab_create/abc").status_code == 404
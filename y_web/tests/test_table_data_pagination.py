@@ -0,0 +1,158 @@
+"""
+Tests for the shared sort and pagination helpers of the admin table data endpoints.
+"""
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+def _seed_languages(n):
+    from y_web import db
+    from y_web.src.models import Languages
+
+    for i in range(n):
+        db.session.add(Languages(language=f"lang{i}"))
+    db.session.commit()
+
+
+def test_paginate_columns_with_total_filters_and_returns_all_rows(app):
+    """A filtered query reports its own total; -1 windows return every row."""
+    from y_web.routes.admin.sub.experiments._helpers import (
+        _paginate_columns_with_total,
+    )
+    from y_web.src.models import Languages
+
+    with app.app_context():
+        _seed_languages(7)
+        query = Languages.query.order_by(Languages.language)
+        columns = (Languages.language,)
+
+        rows, total = _paginate_columns_with_total(query, columns, 2, 3)
+        assert [r["language"] for r in rows] == ["lang2", "lang3", "lang4"]
+        assert total == 7
+
+        rows, total = _paginate_columns_with_total(query, columns, -1, -1)
+        assert len(rows) == 7
+        assert total == 7
+
+        filtered = query.filter(Languages.language.like("%1%"))
+        rows, total = _paginate_columns_with_total(filtered, columns, 0, 5)
+        assert rows == [{"language": "lang1"}]
+        assert total == 1
+
+
+def test_paginate_columns_with_total_returns_dict_rows(app):
+    """Column pagination returns plain dicts of the selected columns plus the total."""
+    from y_web.routes.admin.sub.experiments._helpers import (
+        _paginate_columns_with_total,
+    )
+    from y_web.src.models import Languages
+
+    with app.app_context():
+        _seed_languages(5)
+        query = Languages.query.order_by(Languages.language.desc())
+        columns = (Languages.id, Languages.language)
+
+        rows, total = _paginate_columns_with_total(query, columns, 1, 2)
+        assert [r["language"] for r in rows] == ["lang3", "lang2"]
+        assert set(rows[0]) == {"id", "language"}
+        assert total == 5
+
+        rows, total = _paginate_columns_with_total(query, columns, -1, -1)
+        assert len(rows) == 5 and total == 5
+
+        rows, total = _paginate_columns_with_total(query, columns, 10, 2)
+        assert rows == [] and total == 5
+
+
+def test_apply_sort_uses_column_map_and_default_fallback(app):
+    """Sort names map through the column dict; unknown names use the default."""
+    from y_web.routes.admin.sub.experiments._helpers import _apply_sort
+    from y_web.src.models import Languages
+
+    columns = {"language": Languages.language}
+    with app.app_context():
+        _seed_languages(3)
+
+        query = _apply_sort(Languages.query, "-language", columns)
+        assert [r.language for r in query.all()] == ["lang2", "lang1", "lang0"]
+
+        query = _apply_sort(Languages.query, "-bogus", columns)
+        assert [r.language for r in query.all()] == ["lang2", "lang1", "lang0"]
+
+        query = Languages.query
+        assert _apply_sort(query, None, columns) is query
+
+
+def test_nationalities_data_search_total_counts_matching_rows_only(app):
+    """The nationalities endpoint filters once, on nationality, before counting."""
+    from y_web import db
+    from y_web.routes.admin.sub.experiments._data import nationalities_data
+    from y_web.src.models import Nationalities
+
+    app.config["LOGIN_DISABLED"] = True
+    with app.app_context():
+        for name in ("Italian", "Irish", "French", "Finnish"):
+            db.session.add(Nationalities(nationality=name))
+        db.session.commit()
+
+        with app.test_request_context(
+            "/admin/nationalities_data?search=I&sort=%2Bnationality&start=0&length=1"
+        ):
+            res = nationalities_data()
+
+    assert [row["nationality"] for row in res["data"]] == ["Finnish"]
+    assert res["total"] == 3
+
+
+def test_create_handlers_commit_once_after_the_request(app, monkeypatch):
+    """Lookup inserts staged by the create handlers are committed by the hook."""
+    from types import SimpleNamespace
+
+    from y_web.routes.admin.sub.experiments import _data, experiments
+    from y_web.src.models import Languages
+
+    monkeypatch.setattr(_data, "current_user", SimpleNamespace(username="admin"))
+    app.config["LOGIN_DISABLED"] = True
+    app.register_blueprint(experiments)
+
+    response = app.test_client().post(
+        "/admin/create_language",
+        data={"language": "Esperanto"},
+        headers={"Referer": "/admin/miscellanea"},
+    )
+
+    assert response.status_code == 302
+    with app.app_context():
+        assert [row.language for row in Languages.query.all()] == ["Esperanto"]
+
+
+def test_delete_handlers_answer_with_empty_status_codes(app, monkeypatch):
+    """Lookup DELETE handlers return 204 on success and 404 for unknown ids."""
+    from types import SimpleNamespace
+
+    from y_web import db
+    from y_web.routes.admin.sub.experiments import _data, experiments
+    from y_web.src.models import Languages
+
+    monkeypatch.setattr(_data, "current_user", SimpleNamespace(username="admin"))
+    app.config["LOGIN_DISABLED"] = True
+    app.register_blueprint(experiments)
+
+    with app.app_context():
+        language = Languages(language="Esperanto")
+        db.session.add(language)
+        db.session.commit()
+        language_id = language.id
+
+    client = app.test_client()
+    response = client.delete(f"/admin/delete_language/{language_id}")
+    assert response.status_code == 204
+    assert response.data == b""
+
+    response = client.delete(f"/admin/delete_language/{language_id}")
+    assert response.status_code == 404
+
+    with app.app_context():
+        assert Languages.query.count() == 0
@@ -247,3 +247,22 @@ def test_telemetry_anonymous_user_handling():
     telemetry = Telemetry(user=user)
     # Should default to enabled for anonymous users
     assert telemetry.enabled is True
+
+
+def test_telemetry_log_event_async_runs_off_thread(monkeypatch):
+    """log_event_async posts from a daemon thread and skips disabled users."""
+    calls = []
+
+    class MockUser:
+        def __init__(self, enabled):
+            self.telemetry_enabled = enabled
+            self.is_authenticated = True
+
+    monkeypatch.setattr(Telemetry, "log_event", lambda self, data: calls.append(data))
+
+    assert Telemetry(user=MockUser(False)).log_event_async({"action": "x"}) is None
+
+    thread = Telemetry(user=MockUser(True)).log_event_async({"action": "y"})
+    thread.join(timeout=5)
+    assert thread.daemon is True
+    assert calls == [{"action": "y"}]
@@ -509,3 +509,183 @@ def test_population_file_rename_preserves_similar_names():
         # Verify: 'pop_extended' files should NOT be renamed
         assert os.path.exists(os.path.join(tmpdir, f"{similar_name}.json"))
         assert os.path.exists(os.path.join(tmpdir, f"client_Test-{similar_name}.json"))
+
+
+def test_add_experiment_topics_reuses_and_deduplicates(app):
+    """Topics are resolved in bulk, reused when present and linked once each."""
+    from y_web import db
+    from y_web.routes.admin.sub.experiments._crud import _add_experiment_topics
+    from y_web.src.models import Exp_Topic, Topic_List
+
+    with app.app_context():
+        db.session.add(Topic_List(name="politics"))
+        db.session.commit()
+
+        _add_experiment_topics(1, ["sports", " politics", "sports ", "", "  "])
+        db.session.commit()
+
+        topics = {t.name: t.id for t in Topic_List.query.all()}
+        assert set(topics) == {"politics", "sports"}
+
+        linked = sorted(t.topic_id for t in Exp_Topic.query.filter_by(exp_id=1))
+        assert linked == sorted(topics.values())
+
+
+def test_extract_zip_streams_members_and_skips_unsafe_paths(tmp_path):
+    """Members are extracted (including empty and nested ones), traversal is skipped."""
+    from y_web.routes.admin.sub.experiments._crud import _extract_zip
+
+    zip_path = tmp_path / "exp.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("config_server.json", json.dumps({"name": "exp"}))
+        zf.writestr("nested/", "")
+        zf.writestr("nested/client_a-pop.json", "{}")
+        zf.writestr("empty.json", "")
+        zf.writestr("../escape.json", "{}")
+
+    dest = tmp_path / "out"
+    dest.mkdir()
+    _extract_zip(str(zip_path), str(dest))
+
+    assert json.loads((dest / "config_server.json").read_text()) == {"name": "exp"}
+    assert (dest / "nested" / "client_a-pop.json").read_text() == "{}"
+    assert (dest / "empty.json").read_bytes() == b""
+    assert not (tmp_path / "escape.json").exists()
+
+
+def test_extract_zip_skips_members_resolving_outside_destination(tmp_path):
+    """Members reached through a symlink out of the destination are skipped."""
+    from y_web.routes.admin.sub.experiments._crud import _extract_zip
+
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    dest = tmp_path / "out"
+    dest.mkdir()
+    (dest / "link").symlink_to(outside, target_is_directory=True)
+
+    zip_path = tmp_path / "exp.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("link/escape.json", "{}")
+        zf.writestr("nested/../kept.json", "{}")
+
+    _extract_zip(str(zip_path), str(dest))
+
+    assert not (outside / "escape.json").exists()
+    assert (dest / "kept.json").read_text() == "{}"
+
+
+def test_database_type_is_resolved_once_per_app(app):
+    """The backend type is cached in the app config after the first lookup."""
+    from y_web.routes.admin.sub.experiments._helpers import _get_database_type
+
+    with app.app_context():
+        assert "DB_TYPE" not in app.config
+        assert _get_database_type() == "sqlite"
+        assert app.config["DB_TYPE"] == "sqlite"
+
+        app.config["DB_TYPE"] = "postgresql"
+        assert _get_database_type() == "postgresql"
+
+
+def test_row_exists_uses_exists_query(app):
+    """Presence checks answer from SELECT EXISTS without loading rows."""
+    from y_web.routes.admin.sub.experiments._helpers import _row_exists
+    from y_web.src.models import Admin_users
+
+    with app.app_context():
+        assert _row_exists(Admin_users.query.filter_by(username="admin")) is True
+        assert _row_exists(Admin_users.query.filter_by(username="ghost")) is False
+
+
+def test_postgresql_bootstrap_runs_in_one_transaction():
+    """Schema and Admin seed row are applied on one connection in one transaction."""
+    from y_web.routes.admin.sub.experiments import _crud
+
+    engine = MagicMock()
+    conn = engine.begin.return_value.__enter__.return_value
+
+    with patch.object(_crud, "_postgresql_schema_sql", return_value="CREATE x;"):
+        _crud._bootstrap_postgresql_experiment_db(engine)
+
+    engine.begin.assert_called_once()
+    engine.connect.assert_not_called()
+    conn.exec_driver_sql.assert_called_once_with("CREATE x;")
+    params = conn.execute.call_args[0][1]
+    assert params["username"] == "Admin"
+    assert params["password"].startswith("pbkdf2:sha256")
+
+
+def test_postgres_admin_engine_is_reused_per_uri():
+    """The maintenance-database engine is built once per server/credentials."""
+    from y_web.routes.admin.sub.experiments import _helpers
+
+    with (
+        patch.dict(_helpers._postgres_admin_engines, clear=True),
+        patch.object(
+            _helpers, "create_engine", side_effect=lambda *a, **k: MagicMock()
+        ) as mock_create,
+    ):
+        first = _helpers._postgres_admin_engine("u", "p", "db", 5432)
+        assert _helpers._postgres_admin_engine("u", "p", "db", 5432) is first
+        assert _helpers._postgres_admin_engine("u", "p", "db", 5433) is not first
+
+    assert mock_create.call_count == 2
+    assert mock_create.call_args_list[0][0][0] == "postgresql://u:p@db:5432/postgres"
+
+
+def test_rejected_upload_dir_is_removed_off_the_request_thread(tmp_path):
+    """Rejected upload directories are deleted by a background thread."""
+    from y_web.routes.admin.sub.experiments import _crud
+
+    exp_dir = tmp_path / "exp_uid"
+    exp_dir.mkdir()
+    (exp_dir / "database_server.db").write_bytes(b"x")
+
+    with patch.object(_crud.threading, "Thread") as mock_thread:
+        _crud._discard_upload_dir(str(exp_dir))
+
+    assert exp_dir.exists()
+    mock_thread.return_value.start.assert_called_once()
+    kwargs = mock_thread.call_args.kwargs
+    assert kwargs["target"] is shutil.rmtree
+    assert kwargs["daemon"] is True
+
+    kwargs["target"](*kwargs["args"], **kwargs["kwargs"])
+    assert not exp_dir.exists()
+
+
+def test_prompts_cache_is_invalidated_when_file_changes(tmp_path):
+    """Unchanged prompts.json is parsed once; edits are picked up."""
+    from y_web.routes.admin.sub.experiments import _crud
+
+    path = tmp_path / "prompts.json"
+    path.write_text(json.dumps({"a": "1"}))
+    _crud._load_prompts_cached.cache_clear()
+
+    with patch.object(_crud, "_load_json", wraps=_crud._load_json) as mock_load:
+        assert _crud._load_prompts(str(path)) == {"a": "1"}
+        assert _crud._load_prompts(str(path)) == {"a": "1"}
+        assert mock_load.call_count == 1
+
+        path.write_text(json.dumps({"a": "22"}))
+        assert _crud._load_prompts(str(path)) == {"a": "22"}
+        assert mock_load.call_count == 2
+
+
+def test_prompts_path_uses_the_experiment_folder_for_each_backend():
+    """prompts.json resolves inside the sqlite and postgresql experiment folders."""
+    from types import SimpleNamespace
+
+    from y_web.routes.admin.sub.experiments import _crud
+
+    base = os.path.join("base")
+    sqlite_exp = SimpleNamespace(
+        db_name=os.path.join("experiments", "abc", "database_server.db")
+    )
+    pg_exp = SimpleNamespace(db_name="experiments_abc")
+    expected = os.path.join(base, "y_web", "experiments", "abc", "prompts.json")
+
+    with patch.object(_crud, "_get_database_type", return_value="sqlite"):
+        assert _crud._prompts_path(base, sqlite_exp) == expected
+    with patch.object(_crud, "_get_database_type", return_value="postgresql"):
+        assert _crud._prompts_path(base, pg_exp) == expected
@@ -45,6 +45,117 @@ class TestMiscellaneaUtils:
         except ImportError as e:
             pytest.skip(f"Required dependencies not installed: {e}")
 
+    def test_admin_user_lookup_is_cached_per_request(self, app):
+        """Test that repeated privilege checks reuse one Admin_users lookup"""
+        from y_web.src.system.miscellanea import check_privileges, get_admin_user
+
+        with app.test_request_context():
+            with patch("y_web.src.system.miscellanea.Admin_users") as mock_admin_users:
+                mock_user = Mock(role="admin")
+                mock_admin_users.query.filter_by.return_value.first.return_value = (
+                    mock_user
+                )
+
+                assert check_privileges("admin") is None
+                assert check_privileges("admin") is None
+                assert get_admin_user("admin") is mock_user
+                assert mock_admin_users.query.filter_by.call_count == 1
+
+        with app.test_request_context():
+            with patch("y_web.src.system.miscellanea.Admin_users") as mock_admin_users:
+                get_admin_user("admin")
+                assert mock_admin_users.query.filter_by.call_count == 1
+
+    def test_ollama_status_is_cached_per_request(self, app):
+        """Test that repeated ollama_status calls probe Ollama once per request"""
+        from y_web.src.system.miscellanea import ollama_status
+
+        running = Mock(return_value=True)
+        installed = Mock(return_value=True)
+        helpers = (installed, running, Mock(), Mock())
+
+        with patch(
+            "y_web.src.system.miscellanea._lazy_llm_helpers", return_value=helpers
+        ):
+            with app.test_request_context():
+                assert ollama_status() == {"status": True, "installed": True}
+                assert ollama_status() == {"status": True, "installed": True}
+                assert running.call_count == 1
+
+            with app.test_request_context():
+                ollama_status()
+                assert running.call_count == 2
+
+    def test_llm_backend_status_is_cached_per_request(self, app):
+        """Test that repeated llm_backend_status calls probe the backend once"""
+        from y_web.src.system import miscellanea
+
+        with patch.object(
+            miscellanea, "_probe_llm_backend_status", return_value={"status": True}
+        ) as probe:
+            with app.test_request_context():
+                assert miscellanea.llm_backend_status() == {"status": True}
+                assert miscellanea.llm_backend_status() == {"status": True}
+            assert probe.call_count == 1
+
+    def test_llm_backend_probe_is_reused_across_requests(self):
+        """Test that the backend probe result is cached until forgotten"""
+        from y_web.src.system import miscellanea
+
+        status = {"backend": "vllm", "url": "u", "status": True, "installed": True}
+        with (
+            patch.dict(os.environ, {"LLM_BACKEND": "vllm", "LLM_URL": "u"}),
+            patch.dict(miscellanea._llm_backend_status_cache, clear=True),
+            patch.object(
+                miscellanea, "_check_llm_backend_status", return_value=status
+            ) as check,
+        ):
+            assert miscellanea._probe_llm_backend_status() == status
+            assert miscellanea._probe_llm_backend_status() == status
+            assert check.call_count == 1
+
+            miscellanea.forget_llm_backend_status()
+            miscellanea._probe_llm_backend_status()
+            assert check.call_count == 2
+
+    def test_get_llm_models_is_cached_per_url(self):
+        """Test that model listings are reused per URL until forgotten"""
+        from y_web.src.llm import vllm_manager
+
+        with (
+            patch.dict(vllm_manager._llm_models_cache, clear=True),
+            patch.object(
+                vllm_manager, "_fetch_llm_models", return_value=["m1"]
+            ) as fetch,
+        ):
+            assert vllm_manager.get_llm_models("http://a/v1") == ["m1"]
+            assert vllm_manager.get_llm_models("http://a/v1") == ["m1"]
+            assert fetch.call_count == 1
+
+            vllm_manager.get_llm_models("http://b/v1")
+            assert fetch.call_count == 2
+
+            vllm_manager.forget_llm_models()
+            vllm_manager.get_llm_models("http://a/v1")
+            assert fetch.call_count == 3
+
+    def test_starting_vllm_forgets_cached_llm_state(self):
+        """Test that launching vLLM drops cached backend status and models"""
+        from y_web.src.llm import vllm_manager
+        from y_web.src.system import miscellanea
+
+        with (
+            patch.dict(miscellanea._llm_backend_status_cache, {("vllm", "u"): (0, {})}),
+            patch.dict(vllm_manager._llm_models_cache, {"u": (0, [])}),
+            patch.object(vllm_manager, "is_vllm_installed", return_value=True),
+            patch.object(vllm_manager, "is_vllm_running", return_value=False),
+            patch.object(vllm_manager.subprocess, "run"),
+            patch.object(vllm_manager.time, "sleep"),
+        ):
+            vllm_manager.start_vllm_server("some/model")
+            assert miscellanea._llm_backend_status_cache == {}
+            assert vllm_manager._llm_models_cache == {}
+
     def test_ollama_status_import(self):
         """Test that ollama_status can be imported"""
         try:
@@ -55,6 +166,87 @@ class TestMiscellaneaUtils:
             pytest.skip(f"Required dependencies not installed: {e}")
 
 
+class TestJsonResponse:
+    """Test the JSON response helper"""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_response_serializes_with_either_backend(self, app, use_orjson):
+        """Test that both the orjson and the json fallback produce the same body"""
+        from y_web.src.system import json_response as mod
+
+        if use_orjson and not mod.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+
+        with patch.object(mod, "ORJSON_AVAILABLE", use_orjson):
+            with app.test_request_context():
+                response = mod.json_response({"progress": 50, "name": "é"}, 201)
+
+        assert response.status_code == 201
+        assert response.mimetype == "application/json"
+        assert response.get_json() == {"progress": 50, "name": "é"}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_dumps_round_trips_with_either_backend(self, use_orjson):
+        """Test that indented bytes from json_dumps parse back with json_loads"""
+        from y_web.src.system import json_response as mod
+
+        if use_orjson and not mod.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+
+        payload = {"agents": [{"name": "é", "age": 30}], "pages": []}
+        with patch.object(mod, "ORJSON_AVAILABLE", use_orjson):
+            body = mod.json_dumps(payload, indent=True)
+            assert isinstance(body, bytes)
+            assert b'\n  "agents"' in body
+            assert mod.json_loads(body) == payload
+
+
+class TestLookupCache:
+    """Test the lookup table cache"""
+
+    def test_lookup_rows_reuses_rows_until_a_write_commits(self, app):
+        """Test that cached rows are served until an ORM write is committed"""
+        from y_web import db
+        from y_web.src.models import Topic_List
+        from y_web.src.system.lookup_cache import lookup_rows
+
+        with app.app_context():
+            db.session.add(Topic_List(name="politics"))
+            db.session.commit()
+
+            first = lookup_rows(Topic_List)
+            assert [t.name for t in first] == ["politics"]
+            assert lookup_rows(Topic_List) is first
+
+            db.session.add(Topic_List(name="sport"))
+            db.session.flush()
+            assert lookup_rows(Topic_List) is first
+            db.session.commit()
+
+            assert [t.name for t in lookup_rows(Topic_List)] == ["politics", "sport"]
+
+    def test_lookup_rows_returns_plain_values_and_leaves_the_session_alone(self, app):
+        """Test that cached rows are not ORM instances taken from the session"""
+        from y_web import db
+        from y_web.src.models import Topic_List
+        from y_web.src.system.lookup_cache import lookup_rows
+
+        with app.app_context():
+            topic = Topic_List(name="politics")
+            db.session.add(topic)
+            db.session.commit()
+            topic_id = topic.id
+            topic.name = "economy"
+
+            rows = lookup_rows(Topic_List, Topic_List.id, Topic_List.name)
+
+            assert [tuple(row) for row in rows] == [(topic_id, "politics")]
+            assert not isinstance(rows[0], Topic_List)
+            assert topic in db.session
+            assert db.session.is_modified(topic)
+            assert lookup_rows(Topic_List)[0].name == "politics"
+
+
 class TestArticleExtractor:
     """Test article extraction utilities"""
 